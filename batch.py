@@ -0,0 +1,53 @@
+"""Skript pro dávkové spuštění algoritmů nad mnoha bludišti ve více procesech.
+
+Výsledky jednotlivých úloh jsou vypisovány průběžně, v pořadí dokončení.
+
+Příklady použití:
+
+    python batch.py
+    python batch.py maze_30x18.txt medium_maze.txt --algorithms A* Random
+    python batch.py --workers 8 --timeout 2 --output results.jsonl
+"""
+
+import argparse
+import json
+
+from src.batch import run_batch, batch_jobs, maze_files, DEFAULT_TIMEOUT
+
+
+if __name__ == "__main__":
+
+    # Připrav si parametry příkazové řádky
+    parser = argparse.ArgumentParser(
+        description="Dávkové spuštění algoritmů nad bludišti")
+    parser.add_argument("mazes", nargs="*", default=None,
+                        help="soubory s bludišti (defaultně adresář mazes)")
+    parser.add_argument("--algorithms", nargs="*", default=None,
+                        help="názvy algoritmů, které mají být spuštěny")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="počet pracovních procesů")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="časový limit jedné úlohy v sekundách")
+    parser.add_argument("--output", default=None,
+                        help="soubor, do kterého se uloží výsledky (JSON "
+                             "po řádcích)")
+    args = parser.parse_args()
+
+    # Připrav si úlohy pro všechny kombinace bludišť a algoritmů
+    jobs = batch_jobs(args.mazes or maze_files(), args.algorithms)
+
+    # Spusť úlohy a průběžně vypisuj (a případně ukládej) jejich výsledky
+    writer = open(args.output, "w", encoding="utf-8") if args.output else None
+    try:
+        for result in run_batch(jobs, args.workers, args.timeout):
+            path = result["path_length"] \
+                if result["path_length"] is not None else "-"
+            print(f"{result['maze']:<28}{result['algorithm']:<22}"
+                  f"{result['status']:<9}{path:>7}{result['expanded']:>9}"
+                  f"{result['time_ms']:>11.3f} ms")
+            if writer is not None:
+                writer.write(json.dumps(result, ensure_ascii=False) + "\n")
+                writer.flush()
+    finally:
+        if writer is not None:
+            writer.close()
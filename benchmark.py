@@ -0,0 +1,69 @@
+"""Skript pro spuštění měření výkonnosti všech algoritmů nad všemi bludišti.
+
+Příklady použití:
+
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json --threshold 0.1
+    python benchmark.py --algorithms A* IDA* --memory
+    python benchmark.py --generator kruskal --sizes 255 1023 --seed 7
+    python benchmark.py --algorithms A* --sizes 129 257 --replan
+"""
+
+import argparse
+import sys
+
+from src.benchmark import (run_benchmarks, save_results, load_results,
+                           compare_results, format_results, DEFAULT_SIZES,
+                           DEFAULT_THRESHOLD, DEFAULT_GENERATOR)
+from src.generator import GENERATORS
+
+
+# Připrav si parametry příkazové řádky
+parser = argparse.ArgumentParser(
+    description="Měření výkonnosti algoritmů prohledávání bludišť")
+parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES,
+                    help="rozměry uměle vytvořených bludišť")
+parser.add_argument("--generator", choices=sorted(GENERATORS),
+                    default=DEFAULT_GENERATOR,
+                    help="generátor uměle vytvořených bludišť")
+parser.add_argument("--seed", type=int, default=0,
+                    help="semínko generátoru uměle vytvořených bludišť")
+parser.add_argument("--repeats", type=int, default=5,
+                    help="počet měřených opakování")
+parser.add_argument("--warmup", type=int, default=1,
+                    help="počet zahřívacích běhů")
+parser.add_argument("--algorithms", nargs="*", default=None,
+                    help="názvy algoritmů, které mají být měřeny")
+parser.add_argument("--compile", action="store_true",
+                    help="předem zkompilovat stavové prostory do grafu")
+parser.add_argument("--memory", action="store_true",
+                    help="měřit i největší alokovanou paměť (tracemalloc)")
+parser.add_argument("--replan", action="store_true",
+                    help="měřit i cenu přeplánování D* Lite oproti A*")
+parser.add_argument("--output", default=None,
+                    help="soubor, do kterého se uloží výsledky (JSON)")
+parser.add_argument("--baseline", default=None,
+                    help="soubor s baseline výsledky pro porovnání (JSON)")
+parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="relativní tolerance zpomalení oproti baseline")
+args = parser.parse_args()
+
+# Proveď měření a vypiš výsledky
+results = run_benchmarks(args.sizes, args.repeats, args.warmup,
+                         args.algorithms, args.compile, args.memory,
+                         args.generator, args.seed, args.replan)
+print(format_results(results))
+
+# Ulož výsledky, je-li to požadováno
+if args.output:
+    save_results(results, args.output)
+
+# Porovnej výsledky s baseline, je-li dodána
+if args.baseline:
+    regressions = compare_results(results, load_results(args.baseline),
+                                  args.threshold)
+    for regression in regressions:
+        print(f"REGRESE: {regression}")
+    if regressions:
+        sys.exit(1)
+    print("Žádné regrese oproti baseline nebyly zjištěny.")
@@ -33,7 +33,7 @@ for algo in algorithms:
         end = time.time_ns()
         path = s.final_state.whole_path
         print_maze(
-            maze.clone(),
+            maze,
             [state.field.xy for state in s.final_state.all_states][1:]
         )
 
@@ -46,7 +46,7 @@ for algo in algorithms:
 
     except Failure as f:
         print_maze(
-            maze.clone(),
+            maze,
             [state.field.xy for state in f.last_valid_state.all_states][1:]
         )
         print(f"{algo.algorithm_name}: {f}")
@@ -11,6 +11,13 @@ from .a_star import AStar
 from .gradient_search import GradientSearch
 from .greedy_search import GreedySearch
 from .random_algorithm import Random
+from .bidirectional_search import BidirectionalSearch
+from .jump_point_search import JumpPointSearch
+from .junction_search import JunctionSearch
+from .iterative_deepening_a_star import IterativeDeepeningAStar
+from .compact_a_star import CompactAStar
+from .d_star_lite import DStarLite
+from .dijkstra import Dijkstra
 from .algorithm import Algorithm
 
 
@@ -28,4 +35,23 @@ def all_algorithms(state_space: StateSpace) -> tuple[Algorithm]:
         GradientSearch(state_space),
         GreedySearch(state_space),
         Random(state_space),
+        BidirectionalSearch(state_space),
+        JumpPointSearch(state_space),
+        JunctionSearch(state_space),
+        IterativeDeepeningAStar(state_space),
+        CompactAStar(state_space),
+        DStarLite(state_space),
+        Dijkstra(state_space),
     )
+
+
+def find_algorithm(state_space: StateSpace, name: str) -> Algorithm:
+    """Přístupová funkce, která vrací algoritmus dodaného názvu (viz vlastnost
+    `Algorithm.algorithm_name`) vytvořený nad dodaným stavovým prostorem.
+
+    Pokud algoritmus daného názvu neexistuje, je vyhozena výjimka.
+    """
+    for algorithm in all_algorithms(state_space):
+        if algorithm.algorithm_name == name:
+            return algorithm
+    raise Exception(f"Neznámý algoritmus: {name}")
@@ -5,7 +5,7 @@ Heuristická funkce je obecně taková, která dokáže algoritmu pomoci vybrat
 (upřednostnit) některé operátory (resp. cesty) před jinými.
 """
 
-from src.algorithms.algorithm import Algorithm
+from src.algorithms.algorithm import Algorithm, PriorityFringe
 from src.state_space import StateSpace, State
 
 
@@ -20,40 +20,50 @@ class AStar(Algorithm):
     To je v rámci této třídy reprezentováno dvěma metodami:
 
         - statická metoda `g(State) -> int`, která vrací cenu cesty k dodanému
-          uzlu. V aktuálním pojetí tuto chápe jako počet operátorů, které byly
-          na tuto cestu aplikovány.
+          uzlu, tedy součet cen vstupu na políčka, na která byly na této
+          cestě aplikovány operátory (bez terénu jde o jejich počet).
 
         - instanční metoda `h(State) -> float`, která vrací dolní odhad ceny
           cesty k cílovému stavu. Ten je v aktuálním pojetí počítán jako
           euklidovská vzdálenost mezi souřadnicemi dodaného uzlu a souřadnicemi
           uzlu cílového (viz využití Pythagorovy věty pro výpočet vzdálenosti
-          dvou bodů ve 2D prostoru).
+          dvou bodů ve 2D prostoru). Žádný krok nestojí méně než 1, odhad je
+          tedy přípustný i v bludišti s terénem.
 
     Teoreticky lze ale pro výpočet dolního odhadu použít libovolné metriky.
     """
 
-    def __init__(self, state_space: StateSpace):
+    def __init__(self, state_space: StateSpace, algo_name: str = "A*"):
         """Initor, který přijímá instanci stavového prostoru, v němž řešení
-        bude hledat.
+        bude hledat. Volitelně přijímá i název algoritmu (pro potomky).
         """
         # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
-        super().__init__("A*", state_space)
+        super().__init__(algo_name, state_space,
+                         PriorityFringe(self.priority),
+                         detect_duplicates=True)
 
     @property
     def get_from_fringe(self) -> State:
         """Pro algoritmus vyžaduje výběr nejlevnější cesty vypočítané na
         základě skutečné cesty k dosažení daného stavu (g) a dolního odhadu
         ceny cesty k dosažení cíle.
+
+        Fringe je prioritní frontou uspořádanou dle funkce `f(State)`, výběr
+        nejlevnějšího stavu je tedy v logaritmickém čase.
+        """
+        return self._fringe.pop()
+
+    def priority(self, state: State) -> tuple[float, int]:
+        """Metoda vrací prioritu stavu ve fringe. Primárně rozhoduje celková
+        cena `f(State)`, při shodě jsou upřednostněny stavy s vyšší cenou
+        cesty (tedy blíže cíli), čímž se omezí rozevírání souměrných cest.
         """
-        cheapest = self.fringe[0]
-        cheapest_price = self.h(cheapest) + self.g(cheapest)
-        for state in self.fringe:
-            price = self.h(state) + self.g(state)
-            if price < cheapest_price:
-                cheapest = state
+        return self.f(state), -self.g(state)
 
-        self._fringe.remove(cheapest)
-        return cheapest
+    def f(self, state: State) -> float:
+        """Metoda počítá celkovou cenu stavu jako součet skutečné ceny cesty
+        k dosažení daného stavu (g) a dolního odhadu ceny k cíli (h)."""
+        return self.g(state) + self.h(state)
 
     def h(self, state: State) -> float:
         """Metoda počítá dolní odhad ceny k dosažení cílového stavu. V našem
@@ -72,8 +82,12 @@ class AStar(Algorithm):
     def g(state: State) -> int:
         """Metoda počítá cenu cesty, kolik stálo dostat se do daného stavu.
 
-        V tomto pojetí je tato hodnota spočítána prostě jen jako počet
-        operátorů, kterých bylo třeba aplikovat pro tento stav. Důvodem je
-        fakt, že cena operátoru je pro nás vždy roven 1.
+        Jde o součet cen všech operátorů aplikovaných na cestě k tomuto
+        stavu, tedy cen vstupu na jednotlivá políčka cesty (viz
+        `Operator.cost_to(Field)`). V bludišti bez terénu stojí každý krok 1
+        a cena cesty je rovna počtu aplikovaných operátorů.
+
+        Cena cesty je ve stavu akumulována již při aplikaci operátoru, není
+        tedy třeba procházet celý řetězec předků.
         """
-        return len(state.whole_path)
+        return state.path_cost
@@ -9,10 +9,321 @@ redundance) abstraktní třída Algorithm.
 # Import prostředků pro definici abstraktních tříd a metod
 from abc import ABC, abstractmethod
 
+# Import datových struktur pro efektivní implementace fringe
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+
+# Import funkce pro měření času s vysokým rozlišením
+from time import perf_counter_ns
+
+# Import protokolů pro TypeHints
+from typing import Callable, Iterator
+
 # Import tříd Stavového prostoru a stavu
 from src.state_space import StateSpace, State
 
 
+class Fringe(ABC):
+    """Abstraktní třída Fringe definuje rozhraní datové struktury, do které si
+    algoritmy ukládají stavy k budoucímu prohledání.
+
+    Jednotlivé algoritmy se liší především tím, v jakém pořadí stavy z fringe
+    vybírají. Každý algoritmus si proto volí takovou implementaci, která mu
+    umožní vybrat další stav v konstantním, resp. logaritmickém čase.
+    """
+
+    @abstractmethod
+    def push(self, state: State):
+        """Metoda vloží dodaný stav do fringe."""
+
+    @abstractmethod
+    def pop(self) -> State:
+        """Metoda odebere z fringe další stav na řadě a vrátí ho."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Počet stavů, které jsou ve fringe uloženy."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[State]:
+        """Iterátor přes všechny stavy uložené ve fringe (v libovolném pořadí).
+        """
+
+
+class FifoFringe(Fringe):
+    """Fringe chápaná jako fronta (FIFO) realizovaná obousměrnou frontou, díky
+    které je odebírání ze začátku v konstantním čase."""
+
+    def __init__(self):
+        """Initor, který připraví prázdnou frontu."""
+        self._states: deque[State] = deque()
+
+    def push(self, state: State):
+        """Vloží stav na konec fronty."""
+        self._states.append(state)
+
+    def pop(self) -> State:
+        """Odebere stav ze začátku fronty."""
+        return self._states.popleft()
+
+    def __len__(self) -> int:
+        """Počet stavů ve frontě."""
+        return len(self._states)
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterátor přes stavy ve frontě."""
+        return iter(self._states)
+
+
+class LifoFringe(Fringe):
+    """Fringe chápaná jako zásobník (LIFO) realizovaný seznamem."""
+
+    def __init__(self):
+        """Initor, který připraví prázdný zásobník."""
+        self._states: list[State] = []
+
+    def push(self, state: State):
+        """Vloží stav na vrchol zásobníku."""
+        self._states.append(state)
+
+    def pop(self) -> State:
+        """Odebere stav z vrcholu zásobníku."""
+        return self._states.pop()
+
+    def __len__(self) -> int:
+        """Počet stavů v zásobníku."""
+        return len(self._states)
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterátor přes stavy v zásobníku."""
+        return iter(self._states)
+
+
+class PriorityFringe(Fringe):
+    """Fringe chápaná jako prioritní fronta realizovaná binární haldou.
+
+    Stavy jsou odebírány dle nejnižší hodnoty dodané prioritní funkce. Při
+    shodné prioritě rozhoduje pořadí vložení (dříve vložený má přednost),
+    výběr je tedy deterministický.
+    """
+
+    def __init__(self, priority: Callable[[State], float]):
+        """Initor, který přijímá prioritní funkci, dle které jsou stavy
+        uspořádány (nižší hodnota znamená vyšší prioritu).
+        """
+        self._priority = priority
+        self._heap: list[tuple] = []
+        self._counter = count()
+
+    def push(self, state: State):
+        """Vloží stav do haldy s prioritou vypočítanou prioritní funkcí."""
+        heappush(self._heap,
+                 (self._priority(state), next(self._counter), state))
+
+    def pop(self) -> State:
+        """Odebere stav s nejvyšší prioritou (nejnižší hodnotou)."""
+        if not self._heap:
+            raise IndexError("Odebírání z prázdné fringe")
+        return heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        """Počet stavů v haldě."""
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterátor přes stavy v haldě."""
+        return (entry[2] for entry in self._heap)
+
+
+class BucketFringe(Fringe):
+    """Fringe chápaná jako prioritní fronta s celočíselnými prioritami
+    realizovaná kruhovým polem kyblíků (tzv. Dialova fronta).
+
+    Každá možná priorita má svůj kyblík (frontu FIFO) a fringe si pamatuje
+    nejnižší neprázdnou prioritu. Výběr stavu tak není porovnáváním
+    v haldě, nýbrž jen posunem po kyblících - celková práce je úměrná počtu
+    vložených stavů a rozsahu priorit, ne jejich logaritmu.
+
+    Fronta předpokládá, že priority ve fringe leží vždy v rozmezí od
+    priority naposledy odebraného stavu po tuto prioritu zvětšenou o dodaný
+    rozsah (např. cena cesty u Dijkstrova algoritmu, kde je rozsahem
+    nejvyšší cena jednoho kroku). Díky tomu vystačí s rozsah + 1 kyblíky,
+    které jsou používány cyklicky. Vložení stavu s prioritou mimo toto
+    rozmezí vede k vyhození výjimky. Při shodné prioritě rozhoduje pořadí
+    vložení (dříve vložený má přednost).
+    """
+
+    def __init__(self, priority: Callable[[State], int], span: int):
+        """Initor, který přijímá celočíselnou prioritní funkci (nižší hodnota
+        znamená vyšší prioritu) a největší rozdíl priorit stavů, které mohou
+        být ve fringe současně.
+        """
+        self._priority = priority
+        self._buckets: list[deque[State]] = [deque() for _ in range(span + 1)]
+        self._current = 0
+        self._size = 0
+
+    def push(self, state: State):
+        """Vloží stav na konec kyblíku jeho priority."""
+        priority = self._priority(state)
+        if not self._current <= priority < \
+                self._current + len(self._buckets):
+
+            # Do prázdné fringe lze vložit stav s libovolnou prioritou
+            if self._size:
+                raise Exception(f"Priorita {priority} je mimo rozsah fringe "
+                                f"({self._current} až "
+                                f"{self._current + len(self._buckets) - 1})")
+            self._current = priority
+        self._buckets[priority % len(self._buckets)].append(state)
+        self._size += 1
+
+    def pop(self) -> State:
+        """Odebere stav ze začátku kyblíku s nejnižší prioritou."""
+        if not self._size:
+            raise IndexError("Odebírání z prázdné fringe")
+        buckets = self._buckets
+        while not buckets[self._current % len(buckets)]:
+            self._current += 1
+        self._size -= 1
+        return buckets[self._current % len(buckets)].popleft()
+
+    def __len__(self) -> int:
+        """Počet stavů ve všech kyblících."""
+        return self._size
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterátor přes stavy ve všech kyblících."""
+        return (state for bucket in self._buckets for state in bucket)
+
+
+class SearchStatistics:
+    """Instance této třídy slouží jako přepravka počítadel, která algoritmus
+    průběžně aktualizuje během prohledávání. Díky nim lze zjistit, kde běh
+    algoritmu tráví čas, bez nutnosti použití externího profileru.
+
+    Sledovány jsou tyto hodnoty:
+
+        - `expansions` - počet rozevřených stavů
+        - `generated` - počet vygenerovaných následníků
+        - `duplicate_hits` - počet duplicitních stavů (potlačených při
+          generování či přeskočených při výběru z fringe)
+        - `peak_fringe` - největší dosažená velikost fringe
+        - `selection_time_ns` - čas strávený výběrem stavů z fringe
+        - `successor_time_ns` - čas strávený generováním následníků
+    """
+
+    # Počítadla nemají slovník atributů, aby byl přístup k nim co nejlevnější
+    __slots__ = ("expansions", "generated", "duplicate_hits", "peak_fringe",
+                 "selection_time_ns", "successor_time_ns")
+
+    def __init__(self):
+        """Initor, který všechna počítadla vynuluje."""
+        self.expansions = 0
+        self.generated = 0
+        self.duplicate_hits = 0
+        self.peak_fringe = 0
+        self.selection_time_ns = 0
+        self.successor_time_ns = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Metoda vrací hodnoty všech počítadel jako slovník."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        """Dunder metoda vracející textovou reprezentaci instance."""
+        values = ", ".join(f"{k}={v}" for k, v in self.as_dict().items())
+        return f"SearchStatistics({values})"
+
+
+class SearchStatus:
+    """Instance této třídy popisují stav prohledávání po provedení kroku
+    algoritmu (viz metody `Algorithm.step(int)` a `Algorithm.search()`).
+
+    Prohledávání buď stále probíhá (`RUNNING`), nebo skončilo úspěchem
+    (`SUCCESS`, k dispozici je nalezený cílový stav), či neúspěchem
+    (`FAILURE`, případně s posledním validním stavem). Na rozdíl od výjimek
+    `Success` a `Failure` se stav prohledávání předává jako obyčejná návratová
+    hodnota.
+    """
+
+    # Prohledávání dosud neskončilo
+    RUNNING = "running"
+
+    # Prohledávání skončilo nalezením cílového stavu
+    SUCCESS = "success"
+
+    # Prohledávání skončilo bez nalezení cílového stavu
+    FAILURE = "failure"
+
+    __slots__ = ("_outcome", "_message", "_state")
+
+    def __init__(self, outcome: str, message: str = "", state: State = None):
+        """Initor, který přijímá výsledek prohledávání (jednu z konstant
+        `RUNNING`, `SUCCESS` a `FAILURE`), zprávu a stav, kterého se výsledek
+        týká (cílový, resp. poslední validní stav)."""
+        self._outcome = outcome
+        self._message = message
+        self._state = state
+
+    @staticmethod
+    def running() -> "SearchStatus":
+        """Statická tovární metoda pro stav probíhajícího prohledávání."""
+        return SearchStatus(SearchStatus.RUNNING)
+
+    @staticmethod
+    def succeeded(message: str, final_state: State) -> "SearchStatus":
+        """Statická tovární metoda pro úspěšně ukončené prohledávání."""
+        return SearchStatus(SearchStatus.SUCCESS, message, final_state)
+
+    @staticmethod
+    def failed(message: str,
+               last_valid_state: State = None) -> "SearchStatus":
+        """Statická tovární metoda pro neúspěšně ukončené prohledávání."""
+        return SearchStatus(SearchStatus.FAILURE, message, last_valid_state)
+
+    @property
+    def outcome(self) -> str:
+        """Výsledek prohledávání (`RUNNING`, `SUCCESS` nebo `FAILURE`)."""
+        return self._outcome
+
+    @property
+    def message(self) -> str:
+        """Zpráva o výsledku prohledávání."""
+        return self._message
+
+    @property
+    def is_finished(self) -> bool:
+        """Zda-li prohledávání již skončilo (úspěchem či neúspěchem)."""
+        return self._outcome != SearchStatus.RUNNING
+
+    @property
+    def is_success(self) -> bool:
+        """Zda-li prohledávání skončilo nalezením cílového stavu."""
+        return self._outcome == SearchStatus.SUCCESS
+
+    @property
+    def is_failure(self) -> bool:
+        """Zda-li prohledávání skončilo bez nalezení cílového stavu."""
+        return self._outcome == SearchStatus.FAILURE
+
+    @property
+    def final_state(self) -> State:
+        """Nalezený cílový stav (jen při úspěchu, jinak None)."""
+        return self._state if self.is_success else None
+
+    @property
+    def last_valid_state(self) -> State:
+        """Poslední validní stav (jen při neúspěchu, je-li znám, jinak None).
+        """
+        return self._state if self.is_failure else None
+
+    def __repr__(self) -> str:
+        """Dunder metoda vracející textovou reprezentaci instance."""
+        return f"SearchStatus({self._outcome}, {self._message!r})"
+
+
 class Algorithm(ABC):
     """Abstraktní třída Algorithm poskytuje společné služby pro všechny své
     potomky, tedy algoritmy pro procházení grafů.
@@ -25,16 +336,41 @@ class Algorithm(ABC):
     algoritmus se liší od ostatních mimo jiné i v tomto).
     """
 
-    def __init__(self, algo_name: str, state_space: StateSpace):
+    def __init__(self, algo_name: str, state_space: StateSpace,
+                 fringe: Fringe = None, detect_duplicates: bool = False):
         """Initor, který přijímá název algoritmu (pro rozlišovacích schopnosti)
         a instanci stavového prostoru, v němž bude problém řešit.
 
+        Volitelně přijímá i datovou strukturu fringe, kterou algoritmus pro
+        výběr dalšího stavu potřebuje; defaultně je použit zásobník. Dále
+        přijímá příznak, zda-li má být potlačováno vkládání duplicitních stavů
+        do fringe (viz vlastnost `detect_duplicates`).
+
         Všichni potomci mají k těmto údajům přístup.
         """
         self._algo_name = algo_name
         self._state_space = state_space
-        self._fringe: list[State] = [state_space.initial_state]
+        self._detect_duplicates = detect_duplicates
+
+        # Počítadla průběhu prohledávání a volitelné reakce na události
+        self._statistics = SearchStatistics()
+        self._on_expand: Callable[[State], None] = None
+        self._on_generate: Callable[[State], None] = None
+        self._on_goal: Callable[[State], None] = None
+
+        # Nejlepší (nejlevnější) dosud vygenerovaný stav pro každé políčko
+        self._best_states: dict[State, State] = {}
+
+        self._fringe: Fringe = fringe if fringe is not None else LifoFringe()
+        self.remember_state(state_space.initial_state)
+
+        # Uzavřené stavy v pořadí uzavření a jejich množina pro rychlé dotazy
         self._closed: list[State] = []
+        self._closed_states: set[State] = set()
+
+        # Rozpracované prohledávání (viz `_search()`) a jeho aktuální stav
+        self._search_steps: Iterator[None] = None
+        self._status = SearchStatus.running()
 
     @property
     def algorithm_name(self) -> str:
@@ -56,24 +392,165 @@ class Algorithm(ABC):
         """Vlastnost vrací celý seznam již rozevřených prvků."""
         return tuple(self._closed)
 
+    @property
+    def statistics(self) -> SearchStatistics:
+        """Počítadla průběhu prohledávání."""
+        return self._statistics
+
+    @property
+    def on_expand(self) -> Callable[[State], None]:
+        """Funkce volaná s každým stavem, který je rozevírán (nebo None)."""
+        return self._on_expand
+
+    @on_expand.setter
+    def on_expand(self, callback: Callable[[State], None]):
+        """Nastavuje funkci volanou s každým rozevíraným stavem."""
+        self._on_expand = callback
+
+    @property
+    def on_generate(self) -> Callable[[State], None]:
+        """Funkce volaná s každým vygenerovaným následníkem (nebo None)."""
+        return self._on_generate
+
+    @on_generate.setter
+    def on_generate(self, callback: Callable[[State], None]):
+        """Nastavuje funkci volanou s každým vygenerovaným následníkem."""
+        self._on_generate = callback
+
+    @property
+    def on_goal(self) -> Callable[[State], None]:
+        """Funkce volaná s nalezeným cílovým stavem (nebo None)."""
+        return self._on_goal
+
+    @on_goal.setter
+    def on_goal(self, callback: Callable[[State], None]):
+        """Nastavuje funkci volanou s nalezeným cílovým stavem."""
+        self._on_goal = callback
+
+    @property
+    def detect_duplicates(self) -> bool:
+        """Zda-li jsou duplicitní stavy potlačovány již při jejich generování.
+
+        Je-li potlačování zapnuto, není do fringe vložen stav, jehož políčko
+        již bylo uzavřeno, nebo pro jehož políčko již byl vygenerován stav
+        s cenou cesty nejvýše stejnou. Paměťová i časová náročnost algoritmu
+        pak roste s počtem různých políček, ne s počtem vygenerovaných cest.
+        """
+        return self._detect_duplicates
+
+    @detect_duplicates.setter
+    def detect_duplicates(self, detect_duplicates: bool):
+        """Nastavuje, zda-li mají být duplicitní stavy potlačovány."""
+        self._detect_duplicates = detect_duplicates
+
     def remember_state(self, state: State):
         """Metoda si uloží dodaný stav do seznamu fringe (pro budoucí
         prohledání)."""
-        self._fringe.append(state)
+        if self._detect_duplicates:
+            self._best_states[state] = state
+        self._fringe.push(state)
+
+        # Aktualizace největší dosažené velikosti fringe
+        if len(self._fringe) > self._statistics.peak_fringe:
+            self._statistics.peak_fringe = len(self._fringe)
+
+    def is_duplicate(self, state: State) -> bool:
+        """Metoda vrací, zda-li je dodaný stav duplicitní, tedy zda-li jeho
+        políčko již bylo uzavřeno, nebo zda-li již byl pro jeho políčko
+        vygenerován stav s nejvýše stejnou cenou cesty.
+
+        Pokud není potlačování duplicit zapnuto, vrací vždy False.
+        """
+        if not self._detect_duplicates:
+            return False
+        elif state in self._closed_states:
+            return True
+        best = self._best_states.get(state)
+        return best is not None and best.path_cost <= state.path_cost
+
+    def is_outdated(self, state: State) -> bool:
+        """Metoda vrací, zda-li byl pro políčko dodaného stavu později
+        vygenerován lepší (levnější) stav. Takový stav je ve fringe přebytečný
+        a při vybrání z fringe může být přeskočen (líné odebírání)."""
+        return self._detect_duplicates \
+            and self._best_states.get(state, state) is not state
 
     def is_in_closed(self, state: State) -> bool:
         """Vlastnost vrací, zda-li je daný stav již obsažen v seznamu
         prohledaných (closed)."""
-        return state in self.closed
+        return state in self._closed_states
 
     def close_state(self, state: State):
         """Metoda uloží dodaný stav do seznamu již prohledaných a uzavřených
         stavů."""
         self._closed.append(state)
+        self._closed_states.add(state)
+
+    @property
+    def status(self) -> SearchStatus:
+        """Aktuální stav prohledávání (viz `step(int)`)."""
+        return self._status
+
+    def step(self, expansions: int = 1) -> SearchStatus:
+        """Metoda posune prohledávání nejvýše o dodaný počet rozevřených stavů
+        a vrátí aktuální stav prohledávání (viz `SearchStatus`).
+
+        Prohledávání lze takto provádět po částech - například střídavě
+        s jinými prohledáváními v jedné smyčce událostí, s hlídáním časového
+        limitu mezi kroky, či s předčasným ukončením. Po skončení prohledávání
+        vrací metoda stále tentýž konečný stav. Hodnota None znamená
+        prohledávání až do jeho konce.
+        """
+        if self._status.is_finished:
+            return self._status
+        if self._search_steps is None:
+            self._search_steps = self._search()
+
+        step = 0
+        try:
+            while expansions is None or step < expansions:
+                next(self._search_steps)
+                step += 1
+        except StopIteration as stop:
+            self._status = stop.value
+            self._search_steps = None
+        return self._status
+
+    def iterate(self, expansions: int = 1) -> Iterator[SearchStatus]:
+        """Generátor postupně provádí kroky prohledávání o dodaném počtu
+        rozevřených stavů (viz `step(int)`) a po každém vrací aktuální stav
+        prohledávání; posledním vráceným stavem je stav konečný."""
+        while True:
+            status = self.step(expansions)
+            yield status
+            if status.is_finished:
+                return
+
+    def search(self) -> SearchStatus:
+        """Metoda provede prohledávání až do konce a vrátí jeho konečný stav.
+        Na rozdíl od metody `run()` nevyhazuje výjimky."""
+        return self.step(None)
 
     def run(self):
-        """Metoda, která spouští algoritmus. Implementace této metody sama o
-        sobě definuje, jak bude algoritmus postupovat při prohledávání.
+        """Metoda, která spouští algoritmus a provede prohledávání až do konce
+        (viz `search()`).
+
+        Výsledkem běhu algoritmu je vyhození výjimky. V pozitivním případě je
+        vyhozena výjimka `Success` reprezentující úspěšné nalezení cílového
+        řešení. V opačném případě výjimka `Failure`, která naopak značí, že
+        algoritmus při hledání selhal.
+        """
+        status = self.search()
+        if status.is_success:
+            raise Success(status.message, status.final_state)
+        raise Failure(status.message, status.last_valid_state)
+
+    def _search(self) -> Iterator[None]:
+        """Generátor, který provádí samotné prohledávání; po každém rozevřeném
+        stavu předá řízení zpět (vrátí None) a po skončení prohledávání vrátí
+        (jako hodnotu `StopIteration`) konečný stav prohledávání. Implementace
+        této metody sama o sobě definuje, jak bude algoritmus postupovat při
+        prohledávání.
 
         Zde je uveden obecný algoritmus pro prohledávání stavového prostoru,
         tuto metodu lze volitelně překrýt, či využít stávající implementace.
@@ -82,29 +559,76 @@ class Algorithm(ABC):
         přidávání potomků těchto uzlů do seznamu stavů k budoucímu prohledání.
         Toto prohledávání je iterativně prováděno, dokud tento seznam stavů
         k prohledání je neprázdný. Jakmile se tento vyprázdní a řešení nebylo
-        nalezeno, je vyhozena chyba. V opačném případě se pro každý stav
-        porovnává, zda-li není cílový, což vede k úspěšnému ukončení. Není-li,
-        zjišťuje se, zda-li již nebyl prohledáván. Pokud ne, jsou přidáni
-        všichni jeho potomci do seznamu k dalšímu prohledání.
-
-        Výsledkem běhu algoritmu je typicky vyhození výjimky. V pozitivním
-        případě je vyhozena výjimka `Success` reprezentující úspěšné nalezení
-        cílového řešení. V opačném případě výjimka `Failure`, která naopak
-        značí, že algoritmus při hledání selhal.
+        nalezeno, končí prohledávání neúspěchem. V opačném případě se pro
+        každý stav porovnává, zda-li není cílový, což vede k úspěšnému
+        ukončení. Není-li, zjišťuje se, zda-li již nebyl prohledáván. Pokud
+        ne, jsou přidáni všichni jeho potomci do seznamu k dalšímu prohledání
+        (je-li zapnuto potlačování duplicit, pak jen ti, kteří nejsou
+        duplicitní).
+
+        Během běhu jsou průběžně aktualizována počítadla (viz vlastnost
+        `statistics`) a volány případně nastavené reakce na události.
         """
-        while len(self.fringe) > 0:
+        statistics = self._statistics
+        while len(self._fringe) > 0:
+
+            # Výběr dalšího stavu z fringe (s měřením času)
+            selection_start = perf_counter_ns()
             current_state = self.get_from_fringe
-            if self.state_space.is_final_state(current_state):
-                raise Success("Byl nalezen cílový stav!", current_state)
+            selection_end = perf_counter_ns()
+            statistics.selection_time_ns += selection_end - selection_start
+
+            if self.is_outdated(current_state):
+                statistics.duplicate_hits += 1
+                continue
+            elif self.state_space.is_final_state(current_state):
+                final_state = self.solution(current_state)
+                if self._on_goal is not None:
+                    self._on_goal(final_state)
+                return SearchStatus.succeeded("Byl nalezen cílový stav!",
+                                              final_state)
             elif self.is_in_closed(current_state):
+                statistics.duplicate_hits += 1
                 continue
             else:
-                for o in self.state_space.available_for_state(current_state):
-                    self.remember_state(o.apply(current_state))
+                if self._on_expand is not None:
+                    self._on_expand(current_state)
+                statistics.expansions += 1
+
+                # Generování následníků (s měřením času)
+                successors = self.successors(current_state)
+                statistics.successor_time_ns += \
+                    perf_counter_ns() - selection_end
+                statistics.generated += len(successors)
+
+                for successor in successors:
+                    if self._on_generate is not None:
+                        self._on_generate(successor)
+                    if self.is_duplicate(successor):
+                        statistics.duplicate_hits += 1
+                    else:
+                        self.remember_state(successor)
                 self.close_state(current_state)
+                yield
 
         # Pokud již není co prohledávat a řešení nebylo nalezeno
-        raise Failure("Byly prohledány všechny dosažitelné stavy a nic...")
+        return SearchStatus.failed(
+            "Byly prohledány všechny dosažitelné stavy a nic...")
+
+    def successors(self, state: State) -> tuple[State]:
+        """Metoda vrací následníky dodaného stavu, které mají být vloženy do
+        fringe. Defaultně jde o všechny následníky dle stavového prostoru;
+        potomci mohou následníky prořezávat či generovat vzdálenější stavy.
+        """
+        return self.state_space.successors(state)
+
+    def solution(self, final_state: State) -> State:
+        """Metoda vrací stav, který je výsledkem úspěšného prohledávání, na
+        základě nalezeného cílového stavu. Defaultně jde o tentýž stav;
+        potomci, jejichž stavy přeskakují políčka, z něj mohou sestavit stav
+        s řetězcem předků po jednotlivých krocích.
+        """
+        return final_state
 
     @property
     @abstractmethod
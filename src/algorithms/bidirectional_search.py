@@ -0,0 +1,187 @@
+"""Modul obsahuje definici algoritmu obousměrného prohledávání do šířky
+(Bidirectional Search), který prohledává stavový prostor současně od
+počátečního i od cílového stavu.
+"""
+
+# Import funkce pro měření času s vysokým rozlišením
+from time import perf_counter_ns
+
+# Import protokolu pro TypeHints
+from typing import Iterator
+
+from src.algorithms.algorithm import Algorithm, FifoFringe, SearchStatus
+from src.state_space import StateSpace, State
+
+
+class BidirectionalSearch(Algorithm):
+    """Algoritmus obousměrného prohledávání spouští dvě prohledávání do šířky
+    najednou - dopředné od počátečního stavu a zpětné od cílového stavu.
+    Jakmile se obě fronty potkají, jsou oba řetězce předků spojeny v jednu
+    cestu.
+
+    Každé z obou prohledávání tak dojde jen do zhruba poloviční hloubky,
+    v dlouhých chodbách bludiště je proto rozevřeno přibližně o polovinu
+    méně stavů než při jednosměrném BFS.
+
+    Obě prohledávání se střídají po celých vrstvách (vždy je rozšířena ta
+    z front, která je menší). Setkání je zjišťováno již při generování
+    následníků a prohledávání je ukončeno až po dokončení vrstvy, ve které
+    k setkání došlo - tím je zaručeno nalezení nejkratší cesty.
+
+    Zpětné prohledávání vychází z toho, že předchůdcem políčka ve směru
+    operátoru je sousední políčko v opačném směru; zpětný stav tedy nese
+    operátor, kterým se ze svého políčka dostaneme do políčka svého rodiče
+    (blíže k cíli).
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+        """
+        # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
+        super().__init__("Bidirectional Search", state_space, FifoFringe(),
+                         detect_duplicates=True)
+
+        # Fronta a dosažené stavy zpětného prohledávání (od cíle)
+        self._backward_fringe = FifoFringe()
+        self._backward_states: dict[State, State] = {}
+        self._backward_fringe.push(state_space.final_state)
+        self._backward_states[state_space.final_state] = \
+            state_space.final_state
+
+    @property
+    def get_from_fringe(self) -> State:
+        """Implementace abstraktní metody předka. Vrací další stav dopředného
+        prohledávání (fronta FIFO)."""
+        return self._fringe.pop()
+
+    @property
+    def fringe(self) -> tuple[State]:
+        """Vlastnost vrací stavy k rozevření obou prohledávání."""
+        return tuple(self._fringe) + tuple(self._backward_fringe)
+
+    def predecessors(self, state: State) -> tuple[State]:
+        """Metoda vrací ntici zpětných následníků dodaného stavu, tedy stavů
+        na políčkách, ze kterých lze do políčka dodaného stavu přejít
+        aplikací některého z operátorů.
+
+        Každý takový stav nese právě tento operátor, jeho rodičem je dodaný
+        stav (bližší cíli). Cena cesty zpětného stavu je cenou cesty z jeho
+        políčka do cíle, je tedy zvětšena o cenu vstupu na políčko dodaného
+        stavu (kam operátor vede), nikoliv na políčko opouštěné."""
+        maze = state.maze
+        x, y = state.field_coords
+        predecessors = []
+        for operator in self.state_space.available_operators:
+            direction = operator.direction
+            source = (x - direction.x_diff, y - direction.y_diff)
+            if maze.is_passable(*source):
+                predecessors.append(State(
+                    maze.field(*source), parent=state, operator=operator,
+                    depth=state.depth + 1,
+                    path_cost=state.path_cost
+                    + operator.cost_to(state.field)))
+        return tuple(predecessors)
+
+    def splice(self, forward_state: State, backward_state: State) -> State:
+        """Metoda spojí dopředný stav s řetězcem předků zpětného stavu na
+        stejném políčku a vrátí výsledný cílový stav.
+
+        Operátory zpětného řetězce jsou postupně aplikovány na dopředný stav,
+        výsledný stav má tedy obvyklý řetězec předků od počátečního stavu
+        (a tím i obvyklou cestu `whole_path`)."""
+        state = forward_state
+        while backward_state.has_parent:
+            state = backward_state.applied_operator.apply(state)
+            backward_state = backward_state.parent
+        return state
+
+    def _search(self) -> Iterator[None]:
+        """Generátor provádějící obousměrné prohledávání. Po vrstvách se
+        střídá rozšiřování dopředné a zpětné fronty, dokud se fronty nepotkají
+        (úspěch), nebo dokud se jedna z nich nevyprázdní (neúspěch). Řízení je
+        předáváno zpět po každém rozevřeném stavu.
+
+        Stejně jako u ostatních algoritmů jsou průběžně aktualizována
+        počítadla a volány případně nastavené reakce na události.
+        """
+        statistics = self._statistics
+        initial_state = self.state_space.initial_state
+
+        if self.state_space.is_final_state(initial_state):
+            if self._on_goal is not None:
+                self._on_goal(initial_state)
+            return SearchStatus.succeeded("Byl nalezen cílový stav!",
+                                          initial_state)
+
+        # Nejlepší dosud nalezené setkání a jeho cena
+        meeting: tuple[State, State] = None
+        meeting_cost = None
+
+        while len(self._fringe) > 0 and len(self._backward_fringe) > 0:
+
+            # Rozšiřuje se menší z obou front
+            forward = len(self._fringe) <= len(self._backward_fringe)
+            if forward:
+                fringe, reached, opposite = \
+                    self._fringe, self._best_states, self._backward_states
+                expand = self.state_space.successors
+            else:
+                fringe, reached, opposite = \
+                    self._backward_fringe, self._backward_states, \
+                    self._best_states
+                expand = self.predecessors
+
+            # Rozevření celé jedné vrstvy dané fronty
+            for _ in range(len(fringe)):
+                selection_start = perf_counter_ns()
+                current_state = fringe.pop()
+                selection_end = perf_counter_ns()
+                statistics.selection_time_ns += selection_end - selection_start
+
+                if self._on_expand is not None:
+                    self._on_expand(current_state)
+                statistics.expansions += 1
+
+                successors = expand(current_state)
+                statistics.successor_time_ns += \
+                    perf_counter_ns() - selection_end
+                statistics.generated += len(successors)
+
+                for successor in successors:
+                    if self._on_generate is not None:
+                        self._on_generate(successor)
+                    if successor in reached:
+                        statistics.duplicate_hits += 1
+                        continue
+                    reached[successor] = successor
+                    fringe.push(successor)
+
+                    # Setkání s druhým prohledáváním
+                    other = opposite.get(successor)
+                    if other is not None:
+                        cost = successor.path_cost + other.path_cost
+                        if meeting_cost is None or cost < meeting_cost:
+                            meeting_cost = cost
+                            meeting = (successor, other) if forward \
+                                else (other, successor)
+
+                # Aktualizace největší dosažené velikosti obou front
+                size = len(self._fringe) + len(self._backward_fringe)
+                if size > statistics.peak_fringe:
+                    statistics.peak_fringe = size
+
+                self._closed.append(current_state)
+                yield
+
+            # Po dokončení vrstvy se setkáním je nalezena nejkratší cesta
+            if meeting is not None:
+                final_state = self.splice(*meeting)
+                if self._on_goal is not None:
+                    self._on_goal(final_state)
+                return SearchStatus.succeeded("Byl nalezen cílový stav!",
+                                              final_state)
+
+        # Pokud již není co prohledávat a řešení nebylo nalezeno
+        return SearchStatus.failed(
+            "Byly prohledány všechny dosažitelné stavy a nic...")
@@ -2,7 +2,7 @@
 stavového prostoru tzv. po vrstvách.
 """
 
-from src.algorithms.algorithm import Algorithm
+from src.algorithms.algorithm import Algorithm, FifoFringe
 from src.state_space import StateSpace, State
 
 
@@ -15,12 +15,13 @@ class BreathFirstSearch(Algorithm):
         bude hledat.
         """
         # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
-        super().__init__("Breath-First Search", state_space)
+        super().__init__("Breath-First Search", state_space, FifoFringe(),
+                         detect_duplicates=True)
 
     @property
     def get_from_fringe(self) -> State:
         """Implementace abstraktní metody předka.
         Tato implementace pro potřeby algoritmu BFS chápe seznam fringe jako
-        frontu (FIFO), bere tedy prvky ze začátku.
+        frontu (FIFO), bere tedy prvky ze začátku (v konstantním čase).
         """
-        return self._fringe.pop(0)  # Index 0 značí první prvek z fringe
+        return self._fringe.pop()
@@ -0,0 +1,175 @@
+"""Modul obsahuje definici algoritmu A*, který si vygenerované uzly ukládá do
+kompaktního stromu prohledávání (viz `SearchTree`) namísto vytváření
+instancí třídy `State`.
+"""
+
+# Import kompaktních polí, funkcí pro práci s haldou a měření času
+from array import array
+from heapq import heappush, heappop
+from time import perf_counter_ns
+
+# Import protokolu pro TypeHints
+from typing import Iterator
+
+from src.algorithms.a_star import AStar
+from src.algorithms.algorithm import SearchStatus
+from src.neighbour_graph import NeighbourGraph
+from src.search_tree import SearchTree
+from src.state_space import StateSpace, State
+
+
+class CompactAStar(AStar):
+    """Algoritmus A* pracující nad celočíselnými identifikátory políčků grafu
+    sousednosti (viz `NeighbourGraph`) a celočíselnými uzly stromu
+    prohledávání (viz `SearchTree`).
+
+    Fringe je haldou n-tic (f, -g, pořadí vložení, uzel), nejlepší uzel
+    a příznak uzavření každého políčka jsou uloženy v polích indexovaných
+    identifikátorem políčka. Postup (včetně výběru při shodné prioritě
+    a potlačování duplicit) je tentýž jako u algoritmu `AStar`, rozevírá tedy
+    tytéž stavy; instance třídy `State` však vznikají jen pro nalezené
+    řešení, pro reakce na události (jsou-li nastaveny) a při přístupu
+    k vlastnostem `fringe` a `closed`.
+
+    Je-li stavový prostor zkompilován, je použit jeho graf sousednosti;
+    jinak je graf sestaven při prvním kroku prohledávání.
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+        """
+        # Volání initoru předka, tedy AStar.__init__(StateSpace, str)
+        super().__init__(state_space, "Compact A*")
+        self._graph: NeighbourGraph = state_space.graph
+        self._tree = SearchTree()
+        self._heap: list[tuple[float, int, int, int]] = []
+        self._closed_nodes = array("q")
+
+    @property
+    def neighbour_graph(self) -> NeighbourGraph:
+        """Graf sousednosti, nad kterým prohledávání probíhá; pokud dosud
+        nebyl sestaven, je sestaven nyní."""
+        if self._graph is None:
+            self._graph = NeighbourGraph(
+                self.state_space.initial_state.maze,
+                self.state_space.available_operators)
+        return self._graph
+
+    @property
+    def tree(self) -> SearchTree:
+        """Strom prohledávání se všemi vygenerovanými uzly."""
+        return self._tree
+
+    @property
+    def fringe(self) -> tuple[State]:
+        """Stavy uzlů ve fringe (jsou vytvořeny až při přístupu)."""
+        return tuple(self._states(entry[3] for entry in self._heap))
+
+    @property
+    def closed(self) -> tuple[State]:
+        """Stavy uzavřených uzlů (jsou vytvořeny až při přístupu)."""
+        return tuple(self._states(self._closed_nodes))
+
+    def _states(self, nodes) -> list[State]:
+        """Pomocná metoda vytvoří stavy dodaných uzlů stromu."""
+        if not self._tree:
+            return [self.state_space.initial_state]
+        return self._tree.states(nodes, self.state_space.initial_state,
+                                 self.neighbour_graph.operators)
+
+    def _state(self, node: int) -> State:
+        """Pomocná metoda vytvoří stav dodaného uzlu stromu."""
+        return self._tree.state(node, self.state_space.initial_state,
+                                self.neighbour_graph.operators)
+
+    def _search(self) -> Iterator[None]:
+        """Generátor provádějící algoritmus A* nad uzly stromu prohledávání.
+        Řízení je předáváno zpět po každém rozevřeném uzlu."""
+        statistics = self._statistics
+        graph = self.neighbour_graph
+        tree = self._tree
+        heap = self._heap
+        offsets, targets = graph.offsets, graph.targets
+        edge_operators, operators = graph.edge_operators, graph.operators
+        edge_costs = graph.edge_costs
+
+        initial_state = self.state_space.initial_state
+        goal_x, goal_y = self.state_space.final_state.field_coords
+        goal = graph.cell_id(goal_x, goal_y)
+
+        # Nejlepší uzel každého políčka (-1 pro dosud nedosažená políčka)
+        # a příznak uzavření každého políčka
+        best_nodes = array("q", [-1]) * graph.cell_count
+        closed = bytearray(graph.cell_count)
+
+        def h(cell: int) -> float:
+            x, y = graph.coordinates(cell)
+            return ((goal_x - x) ** 2 + (goal_y - y) ** 2) ** 0.5
+
+        start = graph.cell_id(*initial_state.field_coords)
+        root = tree.add(start)
+        best_nodes[start] = root
+        counter = 0
+        heappush(heap, (h(start), 0, counter, root))
+        statistics.peak_fringe = max(statistics.peak_fringe, 1)
+
+        while heap:
+
+            # Výběr dalšího uzlu z fringe (s měřením času)
+            selection_start = perf_counter_ns()
+            node = heappop(heap)[3]
+            selection_end = perf_counter_ns()
+            statistics.selection_time_ns += selection_end - selection_start
+            cell = tree.cell(node)
+
+            if best_nodes[cell] != node:
+                statistics.duplicate_hits += 1
+                continue
+            elif cell == goal:
+                final_state = self._state(node)
+                if self._on_goal is not None:
+                    self._on_goal(final_state)
+                return SearchStatus.succeeded("Byl nalezen cílový stav!",
+                                              final_state)
+            elif closed[cell]:
+                statistics.duplicate_hits += 1
+                continue
+
+            if self._on_expand is not None:
+                self._on_expand(self._state(node))
+            statistics.expansions += 1
+
+            # Generování následníků přímo z hran grafu
+            parent_cost = tree.cost(node)
+            first, last = offsets[cell], offsets[cell + 1]
+            statistics.generated += last - first
+            for edge in range(first, last):
+                target = targets[edge]
+                cost = parent_cost + edge_costs[edge]
+                if self._on_generate is not None:
+                    self._on_generate(operators[edge_operators[edge]]
+                                      .apply(self._state(node)))
+
+                # Do stromu jsou přidáni jen následníci, kteří nejsou
+                # duplicitní
+                best = best_nodes[target]
+                if closed[target] or (best >= 0 and tree.cost(best) <= cost):
+                    statistics.duplicate_hits += 1
+                    continue
+                successor = tree.add(target, node, edge_operators[edge],
+                                     cost)
+                best_nodes[target] = successor
+                counter += 1
+                heappush(heap, (cost + h(target), -cost, counter, successor))
+            statistics.successor_time_ns += perf_counter_ns() - selection_end
+
+            if len(heap) > statistics.peak_fringe:
+                statistics.peak_fringe = len(heap)
+            closed[cell] = 1
+            self._closed_nodes.append(node)
+            yield
+
+        # Pokud již není co prohledávat a řešení nebylo nalezeno
+        return SearchStatus.failed(
+            "Byly prohledány všechny dosažitelné stavy a nic...")
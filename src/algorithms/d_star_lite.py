@@ -0,0 +1,283 @@
+"""Modul obsahuje definici algoritmu D* Lite pro inkrementální přeplánování
+cesty v bludišti, jehož políčka se během pohybu mění.
+"""
+
+# Import funkcí pro práci s haldou a měření času s vysokým rozlišením
+from heapq import heappush, heappop
+from math import inf
+from time import perf_counter_ns
+
+# Import protokolu pro TypeHints
+from typing import Iterator
+
+from src.algorithms.algorithm import Algorithm, SearchStatistics, SearchStatus
+from src.maze import NO_FIELD_CODE, WALL_CODE, CODE_COSTS
+from src.state_space import StateSpace, State, Operator
+
+
+class DStarLite(Algorithm):
+    """Algoritmus D* Lite (Koenig, Likhachev) prohledává bludiště pozpátku,
+    od cílového políčka ke startovnímu, a pro každé políčko si pamatuje
+    odhad vzdálenosti do cíle `g` a jednokrokový výhled `rhs` (nejmenší
+    součet ceny kroku a `g` souseda). Políčka, u kterých se obě hodnoty liší
+    (tzv. nekonzistentní), čekají v prioritní frontě.
+
+    Po změně bludiště (viz `Maze.changes_since(int)`) stačí přepočítat
+    výhled změněných políček a jejich sousedů; metoda `replan()` pak
+    zpracuje jen políčka, kterých se změna skutečně týká, a opraví tak
+    předchozí řešení bez prohledávání od začátku. Startovní políčko se může
+    mezi přeplánováními posouvat (pohyb agenta), klíče fronty jsou pak
+    korigovány o ušlou vzdálenost (`km`), takže frontu není nutné přestavět.
+
+    Krok na sousední průchozí políčko stojí cenu vstupu na toto políčko (viz
+    `Maze.cost(int, int)`), zeď je neprůchozí; změna terénu je tak zpracována
+    stejně jako změna zdi. Jako heuristika je použita manhattanská vzdálenost
+    od startu (přípustná, neboť žádný krok nestojí méně než 1), algoritmus
+    proto vyžaduje právě operátory pro čtyři ortogonální směry.
+
+    Vlastnosti `fringe` a `closed` vrací samostatné stavy (bez předků)
+    políček ve frontě, resp. dosud rozevřených políček.
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+
+        Stavový prostor musí nabízet právě operátory pro jednotlivé
+        ortogonální směry, jinak je vyhozena výjimka.
+        """
+        operators = state_space.available_operators
+        if {(o.direction.x_diff, o.direction.y_diff) for o in operators} \
+                != {(1, 0), (0, 1), (-1, 0), (0, -1)}:
+            raise Exception("D* Lite vyžaduje právě operátory pro čtyři "
+                            "ortogonální směry")
+
+        # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
+        super().__init__("D* Lite", state_space)
+
+        self._maze = state_space.initial_state.maze
+        self._steps = [(o.direction.x_diff, o.direction.y_diff, o)
+                       for o in operators]
+
+        # Odhady vzdáleností do cíle a jednokrokové výhledy dle pozic políček
+        self._g: dict[int, float] = {}
+        self._rhs: dict[int, float] = {}
+
+        # Prioritní fronta nekonzistentních políček: halda dvojic (klíč,
+        # pozice) s líným odebíráním a platné klíče dle pozic
+        self._heap: list[tuple[tuple[float, float], int]] = []
+        self._keys: dict[int, tuple[float, float]] = {}
+
+        self._start = self._maze.position(
+            *state_space.initial_state.field_coords)
+        self._goal = self._maze.position(
+            *state_space.final_state.field_coords)
+        self._km = 0
+
+        # Verze bludiště, vůči které jsou hodnoty spočítány (None, dokud
+        # nebylo prohledávání spuštěno), a pozice rozevřených políček
+        self._maze_version: int = None
+        self._expanded: list[int] = []
+
+    @property
+    def get_from_fringe(self) -> State:
+        """Implementace abstraktní metody předka. Algoritmus vybírá políčka
+        z vlastní prioritní fronty, proto při zavolání vyhazuje výjimku."""
+        raise Exception("D* Lite vybírá políčka z vlastní prioritní fronty")
+
+    @property
+    def fringe(self) -> tuple[State]:
+        """Samostatné stavy políček v prioritní frontě."""
+        return tuple(self._state(position) for position in self._keys)
+
+    @property
+    def closed(self) -> tuple[State]:
+        """Samostatné stavy dosud rozevřených políček (v pořadí rozevření,
+        i opakovaně)."""
+        return tuple(self._state(position) for position in self._expanded)
+
+    @property
+    def start(self) -> tuple[int, int]:
+        """Souřadnice aktuálního startovního políčka."""
+        return self._maze.coordinates(self._start)
+
+    def _state(self, position: int) -> State:
+        """Pomocná metoda vrací samostatný stav políčka na dané pozici."""
+        return State(self._maze.field(*self._maze.coordinates(position)))
+
+    def _passable(self, position: int) -> bool:
+        """Pomocná metoda vrací, zda-li je políčko na dané pozici průchozí."""
+        code = self._maze.cells[position]
+        return code != NO_FIELD_CODE and code != WALL_CODE
+
+    def _neighbours(self, position: int) -> list[tuple[int, Operator]]:
+        """Pomocná metoda vrací dvojice (pozice, operátor) průchozích sousedů
+        průchozího políčka; z neprůchozího políčka nevede žádná hrana."""
+        if not self._passable(position):
+            return []
+        maze = self._maze
+        x, y = maze.coordinates(position)
+        result = []
+        for dx, dy, operator in self._steps:
+            neighbour = maze.position(x + dx, y + dy)
+            if neighbour >= 0 and self._passable(neighbour):
+                result.append((neighbour, operator))
+        return result
+
+    def _key(self, position: int) -> tuple[float, float]:
+        """Pomocná metoda vrací klíč políčka v prioritní frontě."""
+        best = min(self._g.get(position, inf), self._rhs.get(position, inf))
+        x, y = self._maze.coordinates(position)
+        start_x, start_y = self._maze.coordinates(self._start)
+        return best + abs(x - start_x) + abs(y - start_y) + self._km, best
+
+    def _update(self, position: int):
+        """Pomocná metoda přepočítá výhled políčka a podle jeho konzistence
+        jej vloží do prioritní fronty, nebo z ní odebere."""
+        if position != self._goal:
+            cells = self._maze.cells
+            self._rhs[position] = min(
+                (CODE_COSTS[cells[neighbour]] + self._g.get(neighbour, inf)
+                 for neighbour, _ in self._neighbours(position)),
+                default=inf)
+
+        if self._g.get(position, inf) != self._rhs.get(position, inf):
+            key = self._key(position)
+            self._keys[position] = key
+            heappush(self._heap, (key, position))
+        else:
+            self._keys.pop(position, None)
+
+        if len(self._keys) > self._statistics.peak_fringe:
+            self._statistics.peak_fringe = len(self._keys)
+
+    def _top(self) -> tuple[tuple[float, float], int]:
+        """Pomocná metoda vrací platný záznam s nejnižším klíčem (zastaralé
+        záznamy z vrcholu haldy odstraní), nebo None, je-li fronta prázdná."""
+        heap = self._heap
+        while heap:
+            key, position = heap[0]
+            if self._keys.get(position) == key:
+                return key, position
+            heappop(heap)
+            self._statistics.duplicate_hits += 1
+        return None
+
+    def _apply_changes(self):
+        """Pomocná metoda zpracuje změny bludiště od poslední zpracované
+        verze - přepočítá výhled každého změněného políčka a jeho sousedů."""
+        maze = self._maze
+        changed = {maze.position(x, y)
+                   for x, y in maze.changes_since(self._maze_version)}
+        self._maze_version = maze.version
+
+        affected = set(changed)
+        for position in changed:
+            x, y = maze.coordinates(position)
+            for dx, dy, _ in self._steps:
+                neighbour = maze.position(x + dx, y + dy)
+                if neighbour >= 0:
+                    affected.add(neighbour)
+        for position in affected:
+            self._update(position)
+
+    def replan(self, start: tuple[int, int] = None) -> SearchStatus:
+        """Metoda přeplánuje cestu po změnách bludiště a volitelně z nového
+        startovního políčka (aktuální pozice agenta) a vrátí konečný stav
+        prohledávání (viz `search()`).
+
+        Počítadla (viz vlastnost `statistics`) jsou vynulována, po
+        přeplánování tedy nesou jen jeho náklady.
+        """
+        if start is not None:
+            previous_x, previous_y = self.start
+            self._km += abs(start[0] - previous_x) \
+                + abs(start[1] - previous_y)
+            self._start = self._maze.position(*start)
+
+        self._statistics = SearchStatistics()
+        self._search_steps = None
+        self._status = SearchStatus.running()
+        return self.search()
+
+    def _search(self) -> Iterator[None]:
+        """Generátor provádějící algoritmus D* Lite. Při prvním spuštění
+        zahájí prohledávání od cíle, při dalších (viz `replan()`) nejprve
+        zpracuje změny bludiště. Políčka jsou z fronty zpracovávána, dokud
+        není startovní políčko konzistentní a jeho klíč nejnižší; řízení je
+        předáváno zpět po každém rozevřeném políčku."""
+        statistics = self._statistics
+        g, rhs = self._g, self._rhs
+
+        if self._maze_version is None:
+            self._maze_version = self._maze.version
+            rhs[self._goal] = 0
+            self._update(self._goal)
+        else:
+            self._apply_changes()
+
+        while True:
+            selection_start = perf_counter_ns()
+            top = self._top()
+            selection_end = perf_counter_ns()
+            statistics.selection_time_ns += selection_end - selection_start
+
+            start_g = g.get(self._start, inf)
+            start_rhs = rhs.get(self._start, inf)
+            if top is None or (top[0] >= self._key(self._start)
+                               and start_rhs == start_g):
+                break
+
+            key, position = top
+            new_key = self._key(position)
+            if key < new_key:
+                self._keys[position] = new_key
+                heappush(self._heap, (new_key, position))
+                continue
+
+            if self._on_expand is not None:
+                self._on_expand(self._state(position))
+            statistics.expansions += 1
+            self._expanded.append(position)
+
+            # Políčko se stane konzistentním (g sníženo na rhs), nebo je
+            # jeho g zneplatněno a přepočítá se i ono samo
+            neighbours = self._neighbours(position)
+            statistics.generated += len(neighbours)
+            if g.get(position, inf) > rhs.get(position, inf):
+                g[position] = rhs[position]
+                del self._keys[position]
+                updated = [neighbour for neighbour, _ in neighbours]
+            else:
+                g[position] = inf
+                updated = [neighbour for neighbour, _ in neighbours] \
+                    + [position]
+            for neighbour in updated:
+                self._update(neighbour)
+            statistics.successor_time_ns += perf_counter_ns() - selection_end
+            yield
+
+        if g.get(self._start, inf) == inf:
+            return SearchStatus.failed(
+                "Byly prohledány všechny dosažitelné stavy a nic...")
+
+        final_state = self._path()
+        if self._on_goal is not None:
+            self._on_goal(final_state)
+        return SearchStatus.succeeded("Byl nalezen cílový stav!", final_state)
+
+    def _path(self) -> State:
+        """Pomocná metoda sestaví cestu ze startovního políčka do cíle tak,
+        že z každého políčka pokračuje k sousedovi s nejnižším součtem ceny
+        kroku a `g`. Vrací cílový stav s obvyklým řetězcem předků."""
+        g = self._g
+        cells = self._maze.cells
+        state = State(self._maze.field(*self.start))
+        position = self._start
+        while position != self._goal:
+            position, operator = min(
+                self._neighbours(position),
+                key=lambda neighbour: CODE_COSTS[cells[neighbour[0]]]
+                + g.get(neighbour[0], inf))
+            state = operator.apply(state)
+        return state
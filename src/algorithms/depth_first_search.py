@@ -2,7 +2,7 @@
 stavového prostoru tzv. po větvích.
 """
 
-from src.algorithms.algorithm import Algorithm
+from src.algorithms.algorithm import Algorithm, LifoFringe
 from src.state_space import StateSpace, State
 
 
@@ -19,7 +19,7 @@ class DepthFirstSearch(Algorithm):
         bude hledat.
         """
         # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
-        super().__init__("Depth-First Search", state_space)
+        super().__init__("Depth-First Search", state_space, LifoFringe())
 
     @property
     def get_from_fringe(self) -> State:
@@ -27,4 +27,4 @@ class DepthFirstSearch(Algorithm):
         Tato implementace pro potřeby algoritmu DFS chápe seznam fringe jako
         zásobník (LIFO), bere tedy prvky z konce.
         """
-        return self._fringe.pop()  # Bez indexu metoda pop bere poslední prvek
+        return self._fringe.pop()
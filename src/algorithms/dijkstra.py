@@ -0,0 +1,46 @@
+"""Modul obsahuje definici Dijkstrova algoritmu pro hledání nejlevnější cesty
+v bludišti s terénem (viz `Maze.cost(int, int)`).
+"""
+
+from src.algorithms.algorithm import Algorithm, BucketFringe
+from src.state_space import StateSpace, State
+
+
+class Dijkstra(Algorithm):
+    """Dijkstrův algoritmus rozevírá stavy v pořadí rostoucí ceny cesty, první
+    vybraný cílový stav je tedy stavem s nejlevnější cestou (na rozdíl od
+    algoritmu BFS, který hledá cestu s nejmenším počtem kroků).
+
+    Ceny kroků jsou malá celá čísla (cena vstupu na políčko), fringe je proto
+    Dialovou frontou (viz `BucketFringe`) s rozsahem daným nejvyšší cenou
+    vstupu na políčko bludiště. Výběr stavu je tak v amortizovaně konstantním
+    čase namísto porovnávání v haldě; celková práce je úměrná počtu
+    vygenerovaných stavů a ceně nalezené cesty.
+
+    Terén je zjištěn při vytvoření algoritmu; pokud se bludiště později změní
+    tak, že některý krok stojí více, je třeba algoritmus vytvořit znovu.
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+        """
+        span = max(state_space.initial_state.maze.max_cost, 1)
+
+        # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
+        super().__init__("Dijkstra", state_space,
+                         BucketFringe(self.g, span),
+                         detect_duplicates=True)
+
+    @property
+    def get_from_fringe(self) -> State:
+        """Implementace abstraktní metody předka. Fringe je Dialovou frontou
+        uspořádanou dle ceny cesty (viz `g(State)`), vybírá se tedy stav
+        s nejlevnější cestou (při shodě ten dříve vložený)."""
+        return self._fringe.pop()
+
+    @staticmethod
+    def g(state: State) -> int:
+        """Metoda vrací cenu cesty k dodanému stavu, tedy součet cen vstupu
+        na všechna políčka cesty (kromě počátečního)."""
+        return state.path_cost
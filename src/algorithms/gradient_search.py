@@ -5,7 +5,9 @@ v každé následující interaci nejlepšího možného potomka.
 Tím však může snadno skončit v lokálním extrému a nemusí dojít do svého cíle.
 """
 
-from src.algorithms.algorithm import Algorithm, Success, Failure
+from typing import Iterator
+
+from src.algorithms.algorithm import Algorithm, SearchStatus
 from src.state_space import StateSpace, State
 
 
@@ -38,9 +40,18 @@ class GradientSearch(Algorithm):
         Pokud takový operátor neexistuje, je vrácena hodnota None.
         """
         current_state = self._fringe.pop()
+        if self.on_expand is not None:
+            self.on_expand(current_state)
+
+        # Rozevření aktuálního stavu (se započtením do počítadel)
+        children = self.state_space.successors(current_state)
+        self.statistics.expansions += 1
+        self.statistics.generated += len(children)
+
         cheapest = None
-        for o in self.state_space.available_for_state(current_state):
-            child = o.apply(current_state)
+        for child in children:
+            if self.on_generate is not None:
+                self.on_generate(child)
             if self.__euclid(current_state) > self.__euclid(child):
                 cheapest = child
         return cheapest
@@ -61,9 +72,9 @@ class GradientSearch(Algorithm):
         # a^2 + b^2 = c^2, resp. (a^2 + b^2)^(1/2) = c
         return (((fin_x - curr_x) ** 2) + ((fin_y - curr_y) ** 2)) ** 0.5
 
-    def run(self):
+    def _search(self) -> Iterator[None]:
         """Samotná definice gradientního algoritmu pro prohledávání stavového
-        prostoru.
+        prostoru (generátor předávající řízení zpět po každém kroku).
 
         Algoritmus stojí na principu hledání největšího gradientu zlepšení,
         dle kterého volí své operároty.
@@ -80,14 +91,17 @@ class GradientSearch(Algorithm):
 
             # Pokud je daný stav cílem
             if self.state_space.is_final_state(current_state):
-                raise Success("Nalezen cíl!", current_state)
+                if self.on_goal is not None:
+                    self.on_goal(current_state)
+                return SearchStatus.succeeded("Nalezen cíl!", current_state)
 
             # Jinak vezmi nejlepšího následníka lepšího než aktuální stav
             cheapest = self.get_from_fringe
 
             # Pokud takový nebyl nalezen
             if not cheapest:
-                raise Failure("Uvíznuto v lokálním minimu", current_state)
+                return SearchStatus.failed("Uvíznuto v lokálním minimu",
+                                           current_state)
 
             # Pokud nalezen byl, uzavři aktuální stav, do jednoprvkové fringe
             # přidej aktuální zlepšující a nastav ho i jako aktuální
@@ -96,3 +110,4 @@ class GradientSearch(Algorithm):
                 self.close_state(current_state)
                 self.remember_state(cheapest)
                 current_state = cheapest
+                yield
@@ -9,7 +9,7 @@ bonity (dle hodnoty heuristické funkce).
 V tomto případě je použita jako heuristická funkce euklidovská vzdálenost.
 """
 
-from src.algorithms.algorithm import Algorithm
+from src.algorithms.algorithm import Algorithm, PriorityFringe
 from src.state_space import StateSpace, State
 
 
@@ -26,28 +26,19 @@ class GreedySearch(Algorithm):
         bude hledat.
         """
         # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
-        super().__init__("Greedy Search", state_space)
+        super().__init__("Greedy Search", state_space,
+                         PriorityFringe(self.__euclid),
+                         detect_duplicates=True)
 
     @property
     def get_from_fringe(self) -> State:
         """Vrací ten stav, který je z doposud uložených nejperspektivnější,
         tedy přibližuje k cíli nejvíce.
-        """
-        # Definice nejlevnějšího (předpokládáme první prvek)
-        current_cheapest = self._fringe[0]
-        current_price = self.__euclid(current_cheapest)
-
-        # Pro každý prvek z uzlů nerozvinutých porovnej ceny - pokud je některý
-        # výhodnější, než doposud určený nejlevnější, přenastav ho
-        for state in self.fringe:
-            states_price = self.__euclid(state)
-            if states_price < current_price:
-                current_cheapest = state
-                current_price = states_price
 
-        # Nalezený nejlevnější z fringe odstraň a vrať ho
-        self._fringe.remove(current_cheapest)
-        return current_cheapest
+        Fringe je prioritní frontou uspořádanou dle euklidovské vzdálenosti
+        od cíle, výběr nejperspektivnějšího stavu je tedy v logaritmickém čase.
+        """
+        return self._fringe.pop()
 
     def __euclid(self, state: State) -> float:
         """Tato pomocná privátní metoda slouží k výpočtu euklidovské
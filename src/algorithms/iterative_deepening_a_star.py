@@ -0,0 +1,159 @@
+"""Modul obsahuje definici algoritmu Iterative Deepening A* (IDA*), tedy
+varianty algoritmu A* s pamětí lineární vůči hloubce cesty.
+"""
+
+# Import funkcí pro zaokrouhlení a měření času s vysokým rozlišením
+from math import ceil, inf
+from time import perf_counter_ns
+
+# Import protokolu pro TypeHints
+from typing import Generator, Iterator
+
+from src.algorithms.a_star import AStar
+from src.algorithms.algorithm import SearchStatus
+from src.state_space import StateSpace, State
+
+
+# Výchozí největší počet záznamů transpoziční tabulky
+DEFAULT_TRANSPOSITION_SIZE = 65536
+
+
+class IterativeDeepeningAStar(AStar):
+    """Algoritmus IDA* opakovaně prohledává stavový prostor do hloubky, a to
+    jen ty stavy, jejichž celková cena `f(State)` (viz `AStar`) nepřekročí
+    aktuální mez. Nebyl-li cíl nalezen, je mez zvýšena na nejnižší celkovou
+    cenu, která ji v předchozím průchodu překročila, a prohledávání se opakuje.
+
+    Na rozdíl od A* si algoritmus neuchovává fringe ani seznam uzavřených
+    stavů - jen zásobník aktuální cesty (s dosud neprozkoumanými následníky
+    každého stavu na ní) a množinu jejích políček pro kontrolu cyklů. Paměť
+    tak roste lineárně s hloubkou cesty, za cenu opakovaného rozevírání
+    stavů.
+
+    Volitelně lze použít malou transpoziční tabulku, která si v rámci
+    jednoho průchodu pamatuje nejnižší cenu cesty, se kterou bylo políčko
+    dosaženo; horší cesty do téhož políčka jsou pak prořezány. Tabulka má
+    pevně omezenou velikost a nese jen pozice políček a ceny (ne stavy),
+    paměť tedy zůstává omezená. Bez tabulky (či je-li tabulka výrazně menší
+    než počet dosažitelných políček) roste na otevřených plochách počet
+    rozevřených stavů exponenciálně s délkou cesty.
+    """
+
+    def __init__(self, state_space: StateSpace,
+                 transposition_size: int = DEFAULT_TRANSPOSITION_SIZE):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat, a největší počet záznamů transpoziční tabulky (0 znamená
+        bez transpoziční tabulky).
+        """
+        # Volání initoru předka, tedy AStar.__init__(StateSpace, str)
+        super().__init__(state_space, "IDA*")
+        self._transposition_size = transposition_size
+
+    @property
+    def transposition_size(self) -> int:
+        """Největší počet záznamů transpoziční tabulky (0 znamená bez ní)."""
+        return self._transposition_size
+
+    def expand(self, state: State) -> Iterator[State]:
+        """Metoda rozevře dodaný stav (s aktualizací počítadel a voláním
+        reakcí na události) a vrátí iterátor přes jeho následníky."""
+        if self._on_expand is not None:
+            self._on_expand(state)
+        self._statistics.expansions += 1
+
+        start = perf_counter_ns()
+        successors = self.successors(state)
+        self._statistics.successor_time_ns += perf_counter_ns() - start
+        self._statistics.generated += len(successors)
+
+        if self._on_generate is not None:
+            for successor in successors:
+                self._on_generate(successor)
+        return iter(successors)
+
+    def bounded_search(self, threshold: float) \
+            -> Generator[None, None, tuple[State, float]]:
+        """Generátor provede jeden průchod prohledávání do hloubky omezený
+        dodanou mezí celkové ceny; po každém rozevřeném stavu předá řízení
+        zpět. Vrací (jako hodnotu `StopIteration`) dvojici (nalezený cílový
+        stav nebo None, nejnižší celková cena, která mez překročila)."""
+        statistics = self._statistics
+        initial_state = self.state_space.initial_state
+        maze = initial_state.maze
+        table = {} if self._transposition_size > 0 else None
+
+        minimum = inf
+        stack = [(initial_state, self.expand(initial_state))]
+        on_path = {initial_state}
+        yield
+
+        while stack:
+            state, successors = stack[-1]
+            successor = next(successors, None)
+
+            # Všichni následníci stavu byli prozkoumáni
+            if successor is None:
+                stack.pop()
+                on_path.discard(state)
+                continue
+
+            # Kontrola cyklů podél aktuální cesty
+            if successor in on_path:
+                statistics.duplicate_hits += 1
+                continue
+
+            f = self.f(successor)
+            if f > threshold:
+                minimum = min(minimum, f)
+                continue
+
+            # Prořezání horších cest do políček z transpoziční tabulky
+            if table is not None:
+                position = maze.position(*successor.field_coords)
+                best = table.get(position)
+                if best is not None and best <= successor.path_cost:
+                    statistics.duplicate_hits += 1
+                    continue
+                if best is not None or len(table) < self._transposition_size:
+                    table[position] = successor.path_cost
+
+            if self.state_space.is_final_state(successor):
+                return successor, minimum
+
+            stack.append((successor, self.expand(successor)))
+            on_path.add(successor)
+            if len(stack) > statistics.peak_fringe:
+                statistics.peak_fringe = len(stack)
+            yield
+
+        return None, minimum
+
+    def _search(self) -> Iterator[None]:
+        """Generátor provádějící algoritmus IDA*. Průchody s postupně rostoucí
+        mezí se opakují, dokud není nalezen cílový stav (úspěch), nebo dokud
+        mez nelze dále zvýšit (neúspěch).
+
+        Ceny operátorů jsou celočíselné, cena nalezené cesty tedy také; mez
+        lze proto zaokrouhlovat nahoru, čímž se (u neceločíselné heuristiky)
+        výrazně sníží počet průchodů.
+        """
+        initial_state = self.state_space.initial_state
+        if self.state_space.is_final_state(initial_state):
+            final_state = initial_state
+        else:
+            threshold = ceil(self.f(initial_state))
+            while True:
+                final_state, minimum = \
+                    yield from self.bounded_search(threshold)
+                if final_state is not None:
+                    break
+                if minimum == inf:
+                    return SearchStatus.failed(
+                        "Byly prohledány všechny dosažitelné stavy a nic...")
+                threshold = ceil(minimum)
+
+        final_state = self.solution(final_state)
+        if self._on_goal is not None:
+            self._on_goal(final_state)
+        return SearchStatus.succeeded("Byl nalezen cílový stav!",
+                                      final_state)
@@ -0,0 +1,171 @@
+"""Modul obsahuje definici algoritmu Jump Point Search (JPS) pro prohledávání
+bludišť s rozsáhlými otevřenými plochami.
+
+Jde o variantu algoritmu A*, která místo jednotlivých sousedních políček
+vkládá do fringe jen tzv. body skoku - políčka, ve kterých se optimální cesta
+může stočit. Souměrné cesty (lišící se jen pořadím kroků) jsou tak prořezány
+a na otevřených plochách je do fringe vloženo řádově méně stavů.
+"""
+
+from src.algorithms.algorithm import Algorithm, PriorityFringe
+from src.state_space import StateSpace, State, Operator
+
+
+class JumpPointSearch(Algorithm):
+    """Algoritmus JPS ve variantě pro ortogonální pohyb (čtyři směry dle
+    `Direction.get_all_directions()`).
+
+    Kanonickými cestami jsou takové, které se vodorovným směrem pohybují
+    přednostně a do svislého směru se stáčí jen tehdy, vede-li svislým
+    směrem cesta k dalšímu bodu skoku. Z toho plynou pravidla skoku:
+
+        - svislý skok pokračuje rovně, dokud nenarazí na zeď (skok nevede
+          nikam), na cíl, nebo na políčko s tzv. vynuceným sousedem - bočním
+          políčkem, za kterým (proti směru pohybu) je zeď
+
+        - vodorovný skok pokračuje rovně a na každém políčku zkouší svislé
+          skoky oběma směry; nalezne-li některý z nich bod skoku, je bodem
+          skoku i aktuální políčko
+
+    Z bodu skoku, do kterého vedl vodorovný skok, se pokračuje vodorovně
+    stejným směrem a svisle oběma směry; z bodu, do kterého vedl svislý skok,
+    se pokračuje svisle stejným směrem a do stran jen k vynuceným sousedům.
+
+    Stav bodu skoku nese operátor směru skoku a cenu cesty zvětšenou o délku
+    skoku. Nalezená cesta je nakonec rozvinuta na jednotlivé kroky, vlastnost
+    `whole_path` cílového stavu tedy obsahuje obvyklou sekvenci operátorů.
+
+    Jako heuristika je použita manhattanská vzdálenost, která je pro
+    ortogonální pohyb přípustná i monotónní.
+
+    Prořezávání souměrných cest předpokládá, že všechny kroky stojí stejně.
+    Obsahuje-li bludiště terén s vyšší cenou (viz `Maze.max_cost`), skoky se
+    nepoužívají a následníky jsou sousední políčka (algoritmus se tak chová
+    jako A* s manhattanskou heuristikou).
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+
+        Stavový prostor musí nabízet právě operátory pro jednotlivé
+        ortogonální směry, jinak je vyhozena výjimka.
+        """
+        # Operátory dle směru posunu
+        self._operators: dict[tuple[int, int], Operator] = {
+            (o.direction.x_diff, o.direction.y_diff): o
+            for o in state_space.available_operators}
+        if set(self._operators) != {(1, 0), (0, 1), (-1, 0), (0, -1)}:
+            raise Exception("Jump Point Search vyžaduje právě operátory "
+                            "pro čtyři ortogonální směry")
+
+        # Zda-li bludiště obsahuje terén, na kterém skoky nelze použít
+        self._weighted = state_space.initial_state.maze.max_cost > 1
+
+        # Volání initoru předka, tedy Algorithm.__init__(str, StateSpace)
+        super().__init__("Jump Point Search", state_space,
+                         PriorityFringe(self.priority),
+                         detect_duplicates=True)
+
+    @property
+    def get_from_fringe(self) -> State:
+        """Implementace abstraktní metody předka. Fringe je prioritní frontou
+        uspořádanou dle celkové ceny stavu (viz `priority(State)`)."""
+        return self._fringe.pop()
+
+    def priority(self, state: State) -> tuple[int, int]:
+        """Metoda vrací prioritu stavu ve fringe - součet ceny cesty a
+        manhattanské vzdálenosti do cíle; při shodě jsou upřednostněny stavy
+        blíže cíli."""
+        x, y = state.field_coords
+        final_x, final_y = self.state_space.final_state.field_coords
+        h = abs(final_x - x) + abs(final_y - y)
+        return state.path_cost + h, -state.path_cost
+
+    def directions(self, state: State) -> list[tuple[int, int]]:
+        """Metoda vrací směry, kterými má smysl z dodaného stavu skákat (po
+        prořezání souměrných cest dle směru, kterým se do stavu došlo)."""
+        if not state.has_parent:
+            return list(self._operators)
+
+        x_diff, y_diff = state.applied_operator.direction.x_diff, \
+            state.applied_operator.direction.y_diff
+        if x_diff:
+            return [(x_diff, 0), (0, 1), (0, -1)]
+
+        # Po svislém skoku rovně a do stran jen k vynuceným sousedům
+        passable = state.maze.is_passable
+        x, y = state.field_coords
+        directions = [(0, y_diff)]
+        for side in (1, -1):
+            if passable(x + side, y) and not passable(x + side, y - y_diff):
+                directions.append((side, 0))
+        return directions
+
+    def jump(self, x: int, y: int, x_diff: int,
+             y_diff: int) -> tuple[int, int]:
+        """Metoda provede skok z dodaného políčka daným směrem a vrátí
+        souřadnice nalezeného bodu skoku, nebo None, pokud skok nikam nevede.
+        """
+        passable = self.state_space.initial_state.maze.is_passable
+        final = self.state_space.final_state.field_coords
+
+        while True:
+            x += x_diff
+            y += y_diff
+            if not passable(x, y):
+                return None
+            if (x, y) == final:
+                return x, y
+
+            if x_diff:
+                # Vodorovný skok se zastaví, vede-li odtud svislý skok kamkoliv
+                if self.jump(x, y, 0, 1) is not None \
+                        or self.jump(x, y, 0, -1) is not None:
+                    return x, y
+            else:
+                # Svislý skok se zastaví u vynuceného souseda
+                for side in (1, -1):
+                    if passable(x + side, y) \
+                            and not passable(x + side, y - y_diff):
+                        return x, y
+
+    def successors(self, state: State) -> tuple[State]:
+        """Metoda vrací stavy všech bodů skoku dosažitelných z dodaného stavu
+        (viz `jump(int, int, int, int)`), resp. sousedních políček, obsahuje-li
+        bludiště terén."""
+        if self._weighted:
+            return super().successors(state)
+
+        maze = state.maze
+        x, y = state.field_coords
+        successors = []
+        for x_diff, y_diff in self.directions(state):
+            jump_point = self.jump(x, y, x_diff, y_diff)
+            if jump_point is None:
+                continue
+            distance = abs(jump_point[0] - x) + abs(jump_point[1] - y)
+            successors.append(State(
+                maze.field(*jump_point), parent=state,
+                operator=self._operators[(x_diff, y_diff)],
+                depth=state.depth + distance,
+                path_cost=state.path_cost + distance))
+        return tuple(successors)
+
+    def solution(self, final_state: State) -> State:
+        """Metoda rozvine cestu přes body skoku na jednotlivé kroky, tedy
+        postupně aplikuje operátor každého skoku tolikrát, jak byl skok
+        dlouhý. Vrací výsledný cílový stav."""
+        # Stavy bodů skoku od počátečního stavu (bez něj) po cílový stav
+        jump_states = []
+        while final_state.has_parent:
+            jump_states.append(final_state)
+            final_state = final_state.parent
+
+        state = self.state_space.initial_state
+        for jump_state in reversed(jump_states):
+            (x, y), (parent_x, parent_y) = \
+                jump_state.field_coords, jump_state.parent.field_coords
+            for _ in range(abs(x - parent_x) + abs(y - parent_y)):
+                state = jump_state.applied_operator.apply(state)
+        return state
@@ -0,0 +1,69 @@
+"""Modul obsahuje definici algoritmu A* prohledávajícího graf křižovatek, tedy
+bludiště se staženými chodbami (viz `JunctionGraph`).
+"""
+
+from src.algorithms.a_star import AStar
+from src.junction_graph import JunctionGraph
+from src.state_space import StateSpace, State
+
+
+class JunctionSearch(AStar):
+    """Algoritmus A* nad grafem křižovatek. Následníky stavu nejsou sousední
+    políčka, nýbrž nejbližší křižovatky, slepé konce či cíl na konci každé
+    chodby, která ze stavu vede; cena cesty následníka je zvětšena o cenu
+    chodby (u bludiště bez terénu o její délku). Na bludištích tvořených
+    převážně chodbami tak algoritmus rozevírá řádově méně stavů.
+
+    Graf křižovatek je sestaven při prvním rozevření (viz metoda
+    `StateSpace.contract()`), pokud již stavový prostor stažen nebyl; doba
+    sestavení a míru redukce lze zjistit z grafu samotného.
+
+    Nalezená cesta je nakonec rozvinuta na jednotlivé kroky, vlastnost
+    `whole_path` cílového stavu tedy obsahuje obvyklou sekvenci operátorů.
+    """
+
+    def __init__(self, state_space: StateSpace):
+        """Initor, který přijímá instanci stavového prostoru, v němž řešení
+        bude hledat.
+        """
+        # Volání initoru předka, tedy AStar.__init__(StateSpace, str)
+        super().__init__(state_space, "Junction Search")
+
+    @property
+    def junction_graph(self) -> JunctionGraph:
+        """Graf křižovatek stavového prostoru; pokud dosud nebyl sestaven,
+        je sestaven nyní."""
+        graph = self.state_space.junction_graph
+        return graph if graph is not None else self.state_space.contract()
+
+    def successors(self, state: State) -> tuple[State]:
+        """Metoda vrací stavy uzlů na koncích všech chodeb, které ze stavu
+        vedou. Každý takový stav nese první operátor své chodby."""
+        graph = self.junction_graph
+        maze = state.maze
+        return tuple(
+            State(maze.field(*graph.coordinates(target)), parent=state,
+                  operator=operator, depth=state.depth + length,
+                  path_cost=state.path_cost + cost)
+            for target, length, cost, operator
+            in graph.edges(graph.node_id(*state.field_coords)))
+
+    def solution(self, final_state: State) -> State:
+        """Metoda rozvine cestu přes uzly grafu na jednotlivé kroky, tedy
+        postupně aplikuje operátory každé chodby, kterou cesta vede. Vrací
+        výsledný cílový stav."""
+        graph = self.junction_graph
+
+        # Stavy uzlů od počátečního stavu (bez něj) po cílový stav
+        node_states = []
+        while final_state.has_parent:
+            node_states.append(final_state)
+            final_state = final_state.parent
+
+        state = self.state_space.initial_state
+        for node_state in reversed(node_states):
+            node_id = graph.node_id(*node_state.parent.field_coords)
+            for operator in graph.corridor(node_id,
+                                           node_state.applied_operator):
+                state = operator.apply(state)
+        return state
@@ -5,7 +5,9 @@ smyslu nejde o 'prohledávání'.
 Jeho zařazení mezi ostatní algoritmy je jen z čistě demonstračních důvodů.
 """
 
-from src.algorithms.algorithm import Algorithm, Success, Failure
+from typing import Iterator
+
+from src.algorithms.algorithm import Algorithm, SearchStatus
 from src.state_space import StateSpace, State
 from random import choice
 
@@ -42,8 +44,9 @@ class Random(Algorithm):
         """Limit, kolik iterací je možné provést."""
         self._limit = new_limit
 
-    def run(self):
-        """Implementace náhodného nesystematického algoritmu.
+    def _search(self) -> Iterator[None]:
+        """Implementace náhodného nesystematického algoritmu (generátor
+        předávající řízení zpět po každém kroku).
         """
         # Jako aktuální stav nastav počáteční
         current_state = self.state_space.initial_state
@@ -57,20 +60,30 @@ class Random(Algorithm):
 
             # Pokud je počet iterací větší, než limit, ukonči běh
             if iteration > self.limit:
-                raise Failure(f"Byl překročen limit iterací: {self.limit}",
-                              current_state)
+                return SearchStatus.failed(
+                    f"Byl překročen limit iterací: {self.limit}",
+                    current_state)
 
             # Vlož aktuální stav jako prohledávaný (do closed) - pro
             # potřeby pozdějšího vyhodnocování efektivity
             self.close_state(current_state)
+            if self.on_expand is not None:
+                self.on_expand(current_state)
 
             # Ulož si všechny dostupné operátory
             all_available = self.state_space.available_for_state(current_state)
-
+            self.statistics.expansions += 1
+            self.statistics.generated += 1
             # Náhodně vyber operátor pomocí funkce random.choice(Sequence)
             # a aplikuj ho na aktuální stav a výsledek prohlaš jako nový
             # aktuální stav; konec dané iterace a prokačuj znovu od while
             current_state = choice(all_available).apply(current_state)
+            if self.on_generate is not None:
+                self.on_generate(current_state)
+            yield
 
         # Byl nalezen cílový stav (byl ukončen cyklus while)
-        raise Success("Náhodně nalezen cílový stav", current_state)
+        if self.on_goal is not None:
+            self.on_goal(current_state)
+        return SearchStatus.succeeded("Náhodně nalezen cílový stav",
+                                      current_state)
@@ -0,0 +1,147 @@
+"""Modul obsahuje prostředky pro dávkové spouštění algoritmů nad mnoha
+bludišti s využitím všech jader procesoru.
+
+Dávka se sestává z úloh (soubor s bludištěm, název algoritmu), které jsou
+rozdělovány mezi procesy z `concurrent.futures.ProcessPoolExecutor`. Každý
+pracovní proces si načtené bludiště uchovává, takže další úlohy nad týmž
+bludištěm jej již nenačítají. Výsledky úloh jsou vraceny v pořadí, ve kterém
+byly dokončeny.
+
+Každá úloha má časový limit. Prohledávání je prováděno po krocích (viz
+`Algorithm.step(int)`) a limit je hlídán mezi nimi, takže ani nekonečně
+bloudící algoritmus nezablokuje pracovní proces a tím ani celou dávku.
+"""
+
+# Import knihoven pro paralelní běh, cache a měření času
+import os
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable, Iterator
+
+# Import prostředků bludiště, stavového prostoru a algoritmů
+from .maze import Maze, load_maze
+from .state_space import StateSpace, State, Operator
+from .algorithms import all_algorithms, find_algorithm
+
+
+# Výchozí časový limit jedné úlohy (v sekundách)
+DEFAULT_TIMEOUT = 10.0
+
+# Počet bludišť, která si každý pracovní proces uchovává
+MAZE_CACHE_SIZE = 32
+
+# Počet rozevřených stavů mezi dvěma kontrolami časového limitu
+STEP_EXPANSIONS = 256
+
+
+@lru_cache(maxsize=MAZE_CACHE_SIZE)
+def cached_maze(filename: str) -> Maze:
+    """Funkce vrací bludiště z dodaného souboru (viz `load_maze(str)`).
+    V rámci jednoho procesu je každé bludiště načteno jen jednou."""
+    return load_maze(filename)
+
+
+def run_job(filename: str, algorithm_name: str,
+            timeout: float = DEFAULT_TIMEOUT, seed: int = 0) -> dict:
+    """Funkce spustí algoritmus daného názvu nad bludištěm z dodaného souboru
+    a vrátí výsledek úlohy jako slovník.
+
+    Stav úlohy (`status`) je jedním z hodnot `success`, `failure` (řešení
+    nebylo nalezeno), `timeout` (překročen časový limit) a `error` (úlohu
+    nebylo možné provést, např. bludiště nemá start či cíl). Generátor
+    náhodných čísel je inicializován dodaným semínkem, aby byly i běhy
+    náhodného algoritmu opakovatelné.
+    """
+    result = {"maze": filename, "algorithm": algorithm_name,
+              "status": "error", "path_length": None, "expanded": 0,
+              "generated": 0, "time_ms": 0.0, "error": None}
+    try:
+        maze = cached_maze(filename)
+        state_space = StateSpace(Operator.create_operators(),
+                                 State(maze.start_field),
+                                 State(maze.goal_field))
+        algorithm = find_algorithm(state_space, algorithm_name)
+    except Exception as error:
+        result["error"] = str(error)
+        return result
+
+    # Prohledávání po krocích s kontrolou časového limitu mezi nimi
+    start = time.perf_counter()
+    deadline = start + timeout
+
+    random.seed(seed)
+    try:
+        status = algorithm.step(STEP_EXPANSIONS)
+        while not status.is_finished and time.perf_counter() <= deadline:
+            status = algorithm.step(STEP_EXPANSIONS)
+
+        if status.is_success:
+            result["status"] = "success"
+            result["path_length"] = len(status.final_state.whole_path)
+        elif status.is_failure:
+            result["status"] = "failure"
+        else:
+            result["status"] = "timeout"
+            result["error"] = f"Překročen časový limit {timeout} s"
+    except Exception as error:
+        result["error"] = str(error)
+
+    result["time_ms"] = (time.perf_counter() - start) * 1000
+    result["expanded"] = algorithm.statistics.expansions
+    result["generated"] = algorithm.statistics.generated
+    return result
+
+
+def batch_jobs(filenames: Iterable[str],
+               algorithms: Iterable[str] = None) -> list[tuple[str, str]]:
+    """Funkce vrací seznam úloh (soubor, název algoritmu) pro všechny
+    kombinace dodaných bludišť a algoritmů (defaultně všech implementovaných,
+    viz `all_algorithms(StateSpace)`).
+
+    Úlohy jsou seřazeny dle bludiště, takže úlohy nad týmž bludištěm jsou
+    rozdělovány po sobě a pracovní procesy mohou využít svých cache.
+    """
+    filenames = list(filenames)
+    if algorithms is None:
+        algorithms = algorithm_names(filenames)
+    algorithms = list(algorithms)
+    return [(filename, name) for filename in filenames for name in algorithms]
+
+
+def algorithm_names(filenames: Iterable[str]) -> list[str]:
+    """Funkce vrací názvy všech implementovaných algoritmů. Algoritmy lze
+    vytvořit jen nad stavovým prostorem, je proto použito první z dodaných
+    bludišť, které má start i cíl."""
+    for filename in filenames:
+        try:
+            maze = cached_maze(filename)
+            state_space = StateSpace(Operator.create_operators(),
+                                     State(maze.start_field),
+                                     State(maze.goal_field))
+        except Exception:
+            continue
+        return [a.algorithm_name for a in all_algorithms(state_space)]
+    return []
+
+
+def maze_files() -> list[str]:
+    """Funkce vrací seřazené názvy všech souborů v adresáři `mazes`."""
+    project_dir = os.path.dirname(os.path.dirname(__file__))
+    return sorted(os.listdir(os.path.join(project_dir, "mazes")))
+
+
+def run_batch(jobs: Iterable[tuple[str, str]], workers: int = None,
+              timeout: float = DEFAULT_TIMEOUT) -> Iterator[dict]:
+    """Generátor spustí dodané úlohy (soubor, název algoritmu) v zadaném
+    počtu pracovních procesů (defaultně dle počtu jader) a vrací jejich
+    výsledky (viz `run_job(str, str, float)`) v pořadí dokončení."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_job, filename, name, timeout)
+                   for filename, name in jobs]
+        for future in as_completed(futures):
+            yield future.result()
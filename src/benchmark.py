@@ -0,0 +1,380 @@
+"""Modul obsahuje prostředky pro měření výkonnosti algoritmů prohledávání.
+
+Měření probíhá nad všemi bludišti z adresáře `mazes` a nad uměle vytvořenými
+bludišti větších rozměrů. Každý algoritmus je nejprve několikrát spuštěn
+naprázdno (zahřátí) a následně opakovaně měřen. Výsledky lze uložit ve formátu
+JSON a porovnat s dříve uloženými výsledky (tzv. baseline).
+"""
+
+# Import knihoven pro práci se soubory, formátem JSON a měřením času
+import json
+import math
+import os
+import platform
+import random
+import time
+import tracemalloc
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable, Iterator
+
+# Import prostředků bludiště, stavového prostoru a algoritmů
+from .maze import Maze, load_maze, WALL_CHARACTER
+from .generator import generate_maze
+from .state_space import StateSpace, State, Operator
+from .algorithms import all_algorithms, AStar
+from .algorithms.algorithm import Algorithm
+from .algorithms.d_star_lite import DStarLite
+
+
+# Výchozí rozměry uměle vytvořených bludišť
+DEFAULT_SIZES = (64, 128)
+
+# Výchozí generátor uměle vytvořených bludišť (viz `GENERATORS`)
+DEFAULT_GENERATOR = "pillars"
+
+# Výchozí počty políček měněných najednou při měření přeplánování
+DEFAULT_EDIT_BATCHES = (1, 16)
+
+# Výchozí relativní tolerance zpomalení oproti baseline (20 %)
+DEFAULT_THRESHOLD = 0.2
+
+
+def benchmark_mazes(sizes: Iterable[int] = DEFAULT_SIZES,
+                    generator: str = DEFAULT_GENERATOR, seed: int = 0
+                    ) -> Iterator[tuple[str, Maze]]:
+    """Generátor vrací dvojice (název, bludiště) všech bludišť z adresáře
+    `mazes` a uměle vytvořených bludišť dodaných velikostí (daným
+    generátorem s daným semínkem, viz `generate_maze`).
+
+    Bludiště bez startovního či cílového políčka jsou přeskočena.
+    """
+    project_dir = os.path.dirname(os.path.dirname(__file__))
+    for filename in sorted(os.listdir(os.path.join(project_dir, "mazes"))):
+        maze = load_maze(filename)
+        try:
+            maze.start_field, maze.goal_field
+        except Exception:
+            continue
+        yield filename, maze
+
+    # Bludiště výchozího generátoru si ponechávají původní názvy, aby je
+    # bylo možné porovnat se staršími baseline výsledky
+    prefix = "generated" if generator == DEFAULT_GENERATOR else generator
+    for size in sizes:
+        maze = generate_maze(generator, size, size, seed)
+        yield f"{prefix}_{maze.width}x{maze.height}", maze
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Funkce vrací percentil dodaných hodnot metodou nejbližšího pořadí."""
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def measure(state_space: StateSpace, algorithm_class: type[Algorithm],
+            seed: int, memory: bool = False) -> dict:
+    """Funkce vytvoří algoritmus dodané třídy nad dodaným stavovým prostorem,
+    jednou ho spustí a vrátí naměřené hodnoty jednoho běhu.
+
+    Generátor náhodných čísel je před během inicializován dodaným semínkem,
+    aby byly i běhy náhodného algoritmu opakovatelné. Volitelně je během běhu
+    sledována i největší alokovaná paměť (pomocí modulu `tracemalloc`, což
+    běh výrazně zpomalí - naměřený čas pak není vypovídající).
+    """
+    algorithm: Algorithm = algorithm_class(state_space)
+
+    random.seed(seed)
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter_ns()
+    final_state = algorithm.search().final_state
+    end = time.perf_counter_ns()
+
+    peak_memory = None
+    if memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    statistics = algorithm.statistics
+    return {
+        "algorithm": algorithm.algorithm_name,
+        "success": final_state is not None,
+        "path_length": (len(final_state.whole_path)
+                        if final_state is not None else None),
+        "expanded": statistics.expansions,
+        "generated": statistics.generated,
+        "duplicate_hits": statistics.duplicate_hits,
+        "peak_fringe": statistics.peak_fringe,
+        "peak_closed": len(algorithm.closed),
+        "selection_ms": statistics.selection_time_ns / 10 ** 6,
+        "successors_ms": statistics.successor_time_ns / 10 ** 6,
+        "time_ms": (end - start) / 10 ** 6,
+        "peak_memory_kb": (peak_memory / 1024
+                           if peak_memory is not None else None),
+    }
+
+
+def run_replanning(sizes: Iterable[int] = DEFAULT_SIZES,
+                   edit_batches: Iterable[int] = DEFAULT_EDIT_BATCHES,
+                   rounds: int = 5, generator: str = DEFAULT_GENERATOR,
+                   seed: int = 0) -> list[dict]:
+    """Funkce změří cenu přeplánování algoritmem D* Lite (viz
+    `DStarLite.replan()`) oproti novému běhu algoritmu A* po změnách
+    bludiště a vrátí výsledky jako seznam slovníků.
+
+    Pro každé uměle vytvořené bludiště a každý počet najednou měněných
+    políček je na kopii bludiště provedeno dodaný počet kol; v každém kole
+    je zazděn daný počet náhodných políček aktuální cesty (mimo start a cíl)
+    a následně změřeno přeplánování i nový běh A*. Obě cesty musí mít
+    stejnou délku (viz klíč `consistent`).
+    """
+    rng = random.Random(seed)
+    prefix = "generated" if generator == DEFAULT_GENERATOR else generator
+    results = []
+    for size in sizes:
+        for edits in edit_batches:
+            maze = generate_maze(generator, size, size, seed).clone()
+            state_space = StateSpace(Operator.create_operators(),
+                                     State(maze.start_field),
+                                     State(maze.goal_field))
+            replanner = DStarLite(state_space)
+            start = time.perf_counter_ns()
+            status = replanner.search()
+            initial_ms = (time.perf_counter_ns() - start) / 10 ** 6
+
+            replan_times, replan_expanded = [], []
+            astar_times, astar_expanded = [], []
+            consistent = True
+            for _ in range(rounds):
+                if not status.is_success:
+                    break
+
+                # Zazdění náhodných políček aktuální cesty
+                path = [s.field.xy for s in status.final_state.all_states]
+                for x, y in rng.sample(path[1:], min(edits, len(path) - 1)):
+                    maze.set_character(x, y, WALL_CHARACTER)
+
+                start = time.perf_counter_ns()
+                status = replanner.replan()
+                replan_times.append((time.perf_counter_ns() - start) / 10 ** 6)
+                replan_expanded.append(replanner.statistics.expansions)
+
+                astar = AStar(StateSpace(Operator.create_operators(),
+                                         State(maze.start_field),
+                                         State(maze.goal_field)))
+                start = time.perf_counter_ns()
+                astar_status = astar.search()
+                astar_times.append((time.perf_counter_ns() - start) / 10 ** 6)
+                astar_expanded.append(astar.statistics.expansions)
+
+                consistent &= status.is_success == astar_status.is_success \
+                    and (not status.is_success
+                         or len(status.final_state.whole_path)
+                         == len(astar_status.final_state.whole_path))
+
+            if not replan_times:
+                continue
+            replan_ms = percentile(replan_times, 0.5)
+            astar_ms = percentile(astar_times, 0.5)
+            results.append({
+                "maze": f"{prefix}_{maze.width}x{maze.height}",
+                "edits": edits,
+                "rounds": len(replan_times),
+                "initial_ms": initial_ms,
+                "replan_ms": replan_ms,
+                "replan_expanded": percentile(replan_expanded, 0.5),
+                "astar_ms": astar_ms,
+                "astar_expanded": percentile(astar_expanded, 0.5),
+                "speedup": astar_ms / replan_ms if replan_ms else None,
+                "consistent": consistent,
+            })
+    return results
+
+
+def run_benchmarks(sizes: Iterable[int] = DEFAULT_SIZES, repeats: int = 5,
+                   warmup: int = 1, algorithms: Iterable[str] = None,
+                   compile_graph: bool = False, memory: bool = False,
+                   generator: str = DEFAULT_GENERATOR, seed: int = 0,
+                   replanning: bool = False) -> dict:
+    """Funkce spustí měření všech algoritmů nad všemi bludišti a vrátí
+    výsledky jako slovník připravený k uložení ve formátu JSON.
+
+    Přijímá rozměry uměle vytvořených bludišť, počet měřených opakování,
+    počet zahřívacích běhů, volitelný výběr názvů algoritmů, příznak, zda-li
+    mají být stavové prostory předem zkompilovány do grafu sousednosti,
+    příznak, zda-li má být měřena i největší alokovaná paměť (ta je
+    měřena v jednom samostatném běhu navíc, aby neovlivnila naměřené časy),
+    název generátoru uměle vytvořených bludišť s jeho semínkem a příznak,
+    zda-li má být změřena i cena přeplánování (viz `run_replanning`).
+    """
+    selected = set(algorithms) if algorithms is not None else None
+    results = []
+    contraction = []
+
+    for maze_name, maze in benchmark_mazes(sizes, generator, seed):
+        state_space = StateSpace(Operator.create_operators(),
+                                 State(maze.start_field),
+                                 State(maze.goal_field))
+        if compile_graph:
+            state_space.compile()
+
+        # Stažení chodeb (sdílené všemi běhy nad tímto bludištěm) a jeho míra
+        graph = state_space.contract()
+        contraction.append({
+            "maze": maze_name,
+            "cells": graph.cell_count,
+            "nodes": graph.node_count,
+            "edges": graph.edge_count,
+            "reduction_ratio": graph.reduction_ratio,
+            "build_ms": graph.build_time_ns / 10 ** 6,
+        })
+
+        for algorithm in all_algorithms(state_space):
+            if selected is not None \
+                    and algorithm.algorithm_name not in selected:
+                continue
+
+            # Každý běh vytváří jen vlastní instanci měřeného algoritmu
+            algorithm_class = type(algorithm)
+
+            # Zahřívací běhy, jejichž výsledky se zahazují
+            for trial in range(warmup):
+                measure(state_space, algorithm_class, trial)
+
+            # Měřené běhy
+            trials = [measure(state_space, algorithm_class, trial)
+                      for trial in range(repeats)]
+            times = [trial["time_ms"] for trial in trials]
+            peak_memory = measure(state_space, algorithm_class, 0, True)[
+                "peak_memory_kb"] if memory else None
+            results.append({
+                "maze": maze_name,
+                "width": maze.width,
+                "height": maze.height,
+                "algorithm": algorithm.algorithm_name,
+                "success": all(trial["success"] for trial in trials),
+                "path_length": trials[0]["path_length"],
+                "expanded": max(trial["expanded"] for trial in trials),
+                "generated": max(trial["generated"] for trial in trials),
+                "duplicate_hits": max(trial["duplicate_hits"]
+                                      for trial in trials),
+                "peak_fringe": max(trial["peak_fringe"] for trial in trials),
+                "peak_closed": max(trial["peak_closed"] for trial in trials),
+                "selection_ms": percentile(
+                    [trial["selection_ms"] for trial in trials], 0.5),
+                "successors_ms": percentile(
+                    [trial["successors_ms"] for trial in trials], 0.5),
+                "median_ms": percentile(times, 0.5),
+                "p95_ms": percentile(times, 0.95),
+                "times_ms": times,
+                "peak_memory_kb": peak_memory,
+            })
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "warmup": warmup,
+            "compiled": compile_graph,
+            "memory": memory,
+            "generator": generator,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+        "contraction": contraction,
+        "replanning": (run_replanning(sizes, generator=generator, seed=seed)
+                       if replanning else []),
+    }
+
+
+def save_results(results: dict, path: str):
+    """Funkce uloží výsledky měření do souboru ve formátu JSON."""
+    with open(path, "w", encoding="utf-8") as writer:
+        json.dump(results, writer, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> dict:
+    """Funkce načte výsledky měření ze souboru ve formátu JSON."""
+    with open(path, "r", encoding="utf-8") as reader:
+        return json.load(reader)
+
+
+def compare_results(current: dict, baseline: dict,
+                    threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Funkce porovná aktuální výsledky s baseline a vrátí seznam popisů
+    zjištěných regresí.
+
+    Za regresi je považováno zpomalení mediánu času o více než dodanou
+    relativní toleranci, nárůst počtu rozevřených stavů či ztráta úspěšnosti.
+    Dvojice (bludiště, algoritmus), které v baseline nejsou, se nesrovnávají.
+    """
+    reference = {(r["maze"], r["algorithm"]): r for r in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        key = (result["maze"], result["algorithm"])
+        if key not in reference:
+            continue
+        old = reference[key]
+        label = f"{result['algorithm']} @ {result['maze']}"
+
+        if result["median_ms"] > old["median_ms"] * (1 + threshold):
+            regressions.append(
+                f"{label}: medián {old['median_ms']:.3f} ms -> "
+                f"{result['median_ms']:.3f} ms")
+        if result["expanded"] > old["expanded"]:
+            regressions.append(
+                f"{label}: rozevřeno {old['expanded']} -> "
+                f"{result['expanded']} stavů")
+        if old["success"] and not result["success"]:
+            regressions.append(f"{label}: řešení již není nalezeno")
+
+    return regressions
+
+
+def format_results(results: dict) -> str:
+    """Funkce vrací výsledky měření naformátované jako textovou tabulku."""
+    # Sloupec s pamětí jen tehdy, byla-li měřena
+    memory = results["meta"].get("memory", False)
+
+    header = (f"{'Bludiště':<28}{'Algoritmus':<22}{'Medián ms':>11}"
+              f"{'p95 ms':>11}{'Rozevřeno':>11}{'Max fringe':>12}"
+              f"{'Cesta':>8}" + (f"{'Paměť kB':>11}" if memory else ""))
+    lines = [header, "-" * len(header)]
+    for r in results["results"]:
+        path = r["path_length"] if r["success"] else "-"
+        lines.append(
+            f"{r['maze']:<28}{r['algorithm']:<22}{r['median_ms']:>11.3f}"
+            f"{r['p95_ms']:>11.3f}{r['expanded']:>11}{r['peak_fringe']:>12}"
+            f"{path:>8}"
+            + (f"{r['peak_memory_kb']:>11.1f}" if memory else ""))
+
+    # Míra stažení chodeb (starší výsledky ji nemusí obsahovat)
+    if results.get("contraction"):
+        header = (f"{'Bludiště':<28}{'Políček':>9}{'Uzlů':>9}{'Hran':>9}"
+                  f"{'Poměr':>9}{'Sestavení ms':>14}")
+        lines += ["", header, "-" * len(header)]
+        for c in results["contraction"]:
+            lines.append(
+                f"{c['maze']:<28}{c['cells']:>9}{c['nodes']:>9}"
+                f"{c['edges']:>9}{c['reduction_ratio']:>9.3f}"
+                f"{c['build_ms']:>14.3f}")
+
+    # Cena přeplánování oproti novému běhu A* (je-li měřena)
+    if results.get("replanning"):
+        header = (f"{'Bludiště':<28}{'Změn':>6}{'D* Lite ms':>12}"
+                  f"{'Rozevřeno':>11}{'A* ms':>10}{'Rozevřeno':>11}"
+                  f"{'Zrychlení':>11}")
+        lines += ["", header, "-" * len(header)]
+        for r in results["replanning"]:
+            speedup = f"{r['speedup']:.1f}x" if r["speedup"] else "-"
+            lines.append(
+                f"{r['maze']:<28}{r['edits']:>6}{r['replan_ms']:>12.3f}"
+                f"{r['replan_expanded']:>11}{r['astar_ms']:>10.3f}"
+                f"{r['astar_expanded']:>11}{speedup:>11}"
+                + ("" if r["consistent"] else "  NESHODA"))
+    return "\n".join(lines)
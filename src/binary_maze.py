@@ -0,0 +1,155 @@
+"""Modul obsahuje definici binárního formátu pro ukládání bludišť.
+
+Soubor v binárním formátu se sestává z hlavičky pevné délky a z paměti
+políček. Hlavička obsahuje rozměry bludiště, souřadnice jeho počátku, pozice
+startovního a cílového políčka a způsob kódování políček:
+
+    - `BYTE_ENCODING` - každé políčko zabírá jeden bajt s kódem políčka
+      (stejně jako v paměti instance třídy `Maze`); takový soubor lze mapovat
+      do paměti (mmap) a používat bez jakéhokoliv kopírování či převodu
+    - `PACKED_ENCODING` - každé políčko zabírá 2 bity (zeď, cesta či žádné
+      políčko), start a cíl jsou obnoveny z hlavičky; soubor je čtyřikrát
+      menší, při otevření je však nutné jej rozbalit
+
+Převod textového bludiště do binárního formátu lze provést i z příkazové
+řádky:
+
+    python -m src.binary_maze mazes/maze_30x18.txt maze_30x18.mzb --packed
+"""
+
+# Import knihoven pro práci se soubory, mapováním do paměti a hlavičkou
+import argparse
+import mmap
+import struct
+
+# Import prostředků bludiště
+from .maze import (Maze, load_maze, BINARY_MAGIC, NO_FIELD_CODE, WALL_CODE,
+                   PATH_CODE, START_CODE, GOAL_CODE)
+
+
+# Verze binárního formátu
+VERSION = 1
+
+# Kódování, kdy každé políčko zabírá jeden bajt
+BYTE_ENCODING = 0
+
+# Kódování, kdy každé políčko zabírá dva bity
+PACKED_ENCODING = 1
+
+# Struktura hlavičky: magic, verze, kódování, rozměry (šířka a výška),
+# počátek (x a y) a pozice startu a cíle (-1, pokud v bludišti nejsou)
+HEADER = struct.Struct("<4sBB2xIIiiqq")
+
+# Pozice, na které začínají data políček (hlavička je zarovnána na 64 bajtů)
+DATA_OFFSET = 64
+
+# Kódy políček, které lze uložit do dvou bitů
+PACKABLE_CODES = bytes([NO_FIELD_CODE, WALL_CODE, PATH_CODE])
+
+
+def _pack(cells: bytes) -> bytes:
+    """Pomocná funkce, která zabalí kódy políček do dvou bitů na políčko.
+
+    Start a cíl jsou uloženy jako cesta (jejich pozice nese hlavička).
+    Balení probíhá hromadně: každá čtveřice políček tvoří jeden bajt, do
+    kterého každé políčko přispívá posunutou hodnotou svého kódu.
+    """
+    # Start a cíl jsou uloženy jako cesta
+    cells = bytes(cells).translate(bytes.maketrans(
+        bytes([START_CODE, GOAL_CODE]), bytes([PATH_CODE, PATH_CODE])))
+    if cells.translate(None, PACKABLE_CODES):
+        raise Exception("Bludiště obsahuje políčka, která nelze zabalit")
+
+    # Doplnění na násobek čtyř políček
+    cells += bytes(-len(cells) % 4)
+    count = len(cells) // 4
+
+    # Pro každé ze čtyř políček v bajtu se hodnoty posunou na jeho pozici
+    # a výsledky se sloučí bitovým součtem přes celá čísla
+    packed = 0
+    for index in range(4):
+        table = bytes((code << (2 * index)) & 0xFF for code in range(256))
+        packed |= int.from_bytes(cells[index::4].translate(table), "little")
+    return packed.to_bytes(count, "little")
+
+
+def _unpack(packed: bytes, size: int) -> bytearray:
+    """Pomocná funkce, která rozbalí políčka zabalená funkcí `_pack(bytes)`
+    zpět na jeden bajt na políčko."""
+    cells = bytearray(len(packed) * 4)
+    for index in range(4):
+        table = bytes((value >> (2 * index)) & 0b11 for value in range(256))
+        cells[index::4] = bytes(packed).translate(table)
+    del cells[size:]
+    return cells
+
+
+def save_binary_maze(maze: Maze, path: str, packed: bool = False):
+    """Funkce uloží bludiště do souboru v binárním formátu. Volitelně lze
+    políčka uložit zabalená do dvou bitů (viz `PACKED_ENCODING`)."""
+    size = maze.width * maze.height
+
+    # Pozice startu a cíle (pokud v bludišti nejsou, uloží se -1)
+    positions = []
+    for name in ("start_field", "goal_field"):
+        try:
+            positions.append(maze.position(*getattr(maze, name).xy))
+        except Exception:
+            positions.append(-1)
+
+    header = HEADER.pack(BINARY_MAGIC, VERSION,
+                         PACKED_ENCODING if packed else BYTE_ENCODING,
+                         maze.width, maze.height, *maze.origin, *positions)
+
+    with open(path, "wb") as writer:
+        writer.write(header.ljust(DATA_OFFSET, b"\0"))
+        writer.write(_pack(maze.cells) if packed else bytes(maze.cells[:size]))
+
+
+def open_binary_maze(path: str) -> Maze:
+    """Funkce otevře bludiště uložené v binárním formátu.
+
+    Soubor s jedním bajtem na políčko je mapován do paměti v režimu kopírování
+    při zápisu - paměť políček je tedy přímo pohledem do souboru (bez kopie)
+    a stránky jsou sdíleny všemi procesy, které tentýž soubor otevřou. Kopie
+    stránky vzniká až při změně některého políčka (a jen pro daný proces;
+    soubor samotný se nemění).
+    """
+    with open(path, "rb") as reader:
+        buffer = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    magic, version, encoding, width, height, origin_x, origin_y, start, \
+        goal = HEADER.unpack_from(buffer)
+    if magic != BINARY_MAGIC or version != VERSION:
+        raise Exception(f"Soubor {path} není bludištěm v binárním formátu")
+
+    size = width * height
+    if encoding == BYTE_ENCODING:
+        cells = memoryview(buffer)[DATA_OFFSET:DATA_OFFSET + size]
+    elif encoding == PACKED_ENCODING:
+        cells = _unpack(buffer[DATA_OFFSET:], size)
+        for position, code in ((start, START_CODE), (goal, GOAL_CODE)):
+            if position >= 0:
+                cells[position] = code
+    else:
+        raise Exception(f"Neznámé kódování políček: {encoding}")
+
+    return Maze.from_cells(width, height, cells, (origin_x, origin_y),
+                           start, goal)
+
+
+def convert_maze(source: str, destination: str, packed: bool = False):
+    """Funkce převede bludiště z textového souboru (viz `load_maze(str)`)
+    do souboru v binárním formátu."""
+    save_binary_maze(load_maze(source), destination, packed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Převod bludiště z textového do binárního formátu")
+    parser.add_argument("source", help="textový soubor s bludištěm")
+    parser.add_argument("destination", help="cílový binární soubor")
+    parser.add_argument("--packed", action="store_true",
+                        help="uložit políčka zabalená do dvou bitů")
+    arguments = parser.parse_args()
+    convert_maze(arguments.source, arguments.destination, arguments.packed)
@@ -0,0 +1,179 @@
+"""Modul obsahuje výpočet tzv. distančního pole bludiště pomocí knihovny NumPy.
+
+Distanční pole nese pro každé políčko bludiště cenu nejlevnější cesty do
+cílového políčka (bez terénu délku nejkratší cesty) a směr (operátor), kterým
+se z daného políčka k cíli vydat. Výpočet probíhá vlnami (wavefront) od cíle:
+vlna je polem pozic políček se stejnou cenou cesty a v každé iteraci se celá
+najednou rozšíří o jeden krok, a to vektorově (posunem pozic o sousedy) bez
+vytváření jednotlivých stavů. Vlny čekají v kyblících dle ceny cesty (jako
+v Dialově frontě), bez terénu jde tedy o prohledávání do šířky. Práce jedné
+iterace je úměrná velikosti vlny, nikoliv velikosti bludiště.
+
+Modul vyžaduje knihovnu NumPy; ostatní části projektu na ní nezávisí.
+"""
+
+# Import knihovny pro vektorové výpočty nad mřížkou bludiště
+import numpy as np
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable
+
+# Import prostředků bludiště a stavového prostoru
+from .maze import Maze, CODE_COSTS
+from .state_space import Operator
+
+
+class DistanceField:
+    """Instance této třídy reprezentují distanční pole bludiště vůči jednomu
+    cílovému políčku.
+
+    Pole `distances` (typu int32) nese pro každé políčko cenu nejlevnější
+    cesty do cíle, tedy součet cen vstupu na políčka cesty (viz
+    `Maze.cost(int, int)`; -1 pro nedosažitelná políčka a zdi). Pole
+    `directions` (typu int8) nese index operátoru (v ntici `operators`), jehož
+    aplikací se z daného políčka přiblížíme k cíli (-1 pro cíl a nedosažitelná
+    políčka).
+    Obě pole jsou indexována jako [y, x] relativně k počátku bludiště.
+    """
+
+    def __init__(self, maze: Maze, operators: Iterable[Operator] = None,
+                 target: tuple[int, int] = None):
+        """Initor, který přijímá bludiště, volitelně sadu operátorů (defaultně
+        všechny ortogonální směry) a volitelně souřadnice cílového políčka
+        (defaultně cílové políčko bludiště). Distanční pole je spočítáno
+        ihned při vytvoření instance.
+
+        Pokud cílové políčko v bludišti neexistuje nebo je zdí, je vyhozena
+        výjimka.
+        """
+        self._maze = maze
+        self._operators = tuple(operators) if operators is not None \
+            else Operator.create_operators()
+        self._target = target if target is not None else maze.goal_field.xy
+        if not maze.is_passable(*self._target):
+            raise Exception(f"Cíl {self._target} není průchozím políčkem "
+                            f"bludiště")
+
+        # Ceny vstupu na políčka jako ploché pole (pozice odpovídají pozicím
+        # v bludišti); neprůchozí políčka mají cenu 0
+        width = maze.width
+        codes = np.frombuffer(maze.cells, dtype=np.uint8)
+        costs = np.frombuffer(CODE_COSTS, dtype=np.uint8)[codes]
+        passable = costs > 0
+        distances = np.full(len(codes), -1, dtype=np.int32)
+        directions = np.full(len(codes), -1, dtype=np.int8)
+
+        # Do políčka vede operátor z políčka, které je od něj opačným směrem
+        steps = [(index, -operator.direction.x_diff,
+                  -operator.direction.y_diff)
+                 for index, operator in enumerate(self._operators)]
+
+        # Kyblíky vln dle ceny cesty (seznamy polí pozic); ceny čekajících
+        # pozic leží vždy v rozmezí od zpracovávané ceny po tuto cenu
+        # zvětšenou o nejvyšší cenu kroku, kyblíky jsou tedy použity cyklicky
+        span = int(costs.max()) if len(costs) else 1
+        buckets: list[list[np.ndarray]] = [[] for _ in range(span + 1)]
+        target = maze.position(*self._target)
+        distances[target] = 0
+        buckets[0].append(np.array([target], dtype=np.int64))
+        pending = 1
+
+        distance = 0
+        while pending:
+            bucket = buckets[distance % len(buckets)]
+            if not bucket:
+                distance += 1
+                continue
+            pending -= len(bucket)
+            frontier = np.concatenate(bucket)
+            bucket.clear()
+
+            # Vlnu tvoří pozice, pro které mezitím nebyla nalezena levnější
+            # cesta; krok do nich stojí cenu vstupu na ně
+            frontier = frontier[distances[frontier] == distance]
+            columns = frontier % width
+            reached = distance + costs[frontier].astype(np.int32)
+
+            # Políčko se k vlně připojí, pokud operátor vede z něj do vlny
+            # a nová cesta je levnější; při shodě rozhoduje pořadí operátorů
+            # (posun o týž směr je prostý, v rámci jednoho operátoru tedy ke
+            # shodě nedochází)
+            for index, x_diff, y_diff in steps:
+                candidates = frontier + (x_diff + y_diff * width)
+                inside = (columns + x_diff >= 0) & (columns + x_diff < width) \
+                    & (candidates >= 0) & (candidates < len(codes))
+                candidates, new = candidates[inside], reached[inside]
+                known = distances[candidates]
+                better = passable[candidates] & ((known < 0) | (new < known))
+                candidates, new = candidates[better], new[better]
+                distances[candidates] = new
+                directions[candidates] = index
+
+                # Pozice se zařadí do kyblíků dle své nové ceny; bez terénu
+                # mají všechny tutéž cenu a třídit je není třeba
+                if span == 1:
+                    if len(candidates):
+                        buckets[(distance + 1) % 2].append(candidates)
+                        pending += 1
+                    continue
+                for value in np.unique(new):
+                    buckets[value % len(buckets)].append(
+                        candidates[new == value])
+                    pending += 1
+
+            distance += 1
+
+        self._distances = distances.reshape(maze.height, width)
+        self._directions = directions.reshape(maze.height, width)
+
+    @property
+    def maze(self) -> Maze:
+        """Bludiště, pro které bylo distanční pole spočítáno."""
+        return self._maze
+
+    @property
+    def operators(self) -> tuple[Operator]:
+        """Operátory, na které odkazují indexy v poli `directions`."""
+        return self._operators
+
+    @property
+    def target(self) -> tuple[int, int]:
+        """Souřadnice cílového políčka."""
+        return self._target
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Pole cen nejlevnějších cest do cíle (int32, indexováno [y, x])."""
+        return self._distances
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Pole indexů operátorů vedoucích k cíli (int8, indexováno [y, x])."""
+        return self._directions
+
+    def distance(self, x: int, y: int) -> int:
+        """Metoda vrací cenu nejlevnější cesty z daného políčka do cíle, nebo
+        -1, pokud je cíl z daného políčka nedosažitelný nebo políčko leží
+        mimo bludiště."""
+        # Souřadnice mimo bludiště nesmí být převedeny na záporné indexy,
+        # které by NumPy chápal jako indexy od konce pole
+        if self._maze.position(x, y) < 0:
+            return -1
+        origin_x, origin_y = self._maze.origin
+        return int(self._distances[y - origin_y, x - origin_x])
+
+    def path_from(self, x: int, y: int) -> tuple[Operator]:
+        """Metoda vrací nejlevnější cestu (sekvenci operátorů) z daného políčka
+        do cíle, a to v čase úměrném délce cesty. Pokud je cíl z daného
+        políčka nedosažitelný (či políčko leží mimo bludiště), vrací None."""
+        if self.distance(x, y) < 0:
+            return None
+
+        origin_x, origin_y = self._maze.origin
+        path = []
+        while (x, y) != self._target:
+            operator = self._operators[
+                self._directions[y - origin_y, x - origin_x]]
+            path.append(operator)
+            x, y = operator.direction.neighbour_coordinates(x, y)
+        return tuple(path)
@@ -0,0 +1,365 @@
+"""Modul obsahuje generátory umělých bludišť libovolných rozměrů, např. pro
+měření výkonnosti algoritmů nad velkými bludišti.
+
+Dokonalá bludiště (mezi každými dvěma políčky vede právě jedna cesta) jsou
+tvořena nad mřížkou políček na lichých souřadnicích, mezi kterými jsou
+bourány zdi:
+
+    - `backtracker_maze` - prohledávání do hloubky s návratem (recursive
+      backtracker); dlouhé klikaté chodby s málo odbočkami
+    - `kruskal_maze` - náhodná kostra Kruskalovým algoritmem; mnoho krátkých
+      slepých uliček
+    - `wilson_maze` - náhodné procházky s odstraněním smyček (Wilsonův
+      algoritmus); rovnoměrně náhodná kostra
+    - `sidewinder_maze` - náhodné úseky řad spojené nahoru (Sidewinder);
+      horní řada je jedinou chodbou, sestavuje se vektorově
+
+Dále jsou k dispozici bludiště typu 'otevřený svět' - s náhodně rozmístěnými
+překážkami dané hustoty (`open_maze`), či s pravidelně rozmístěnými sloupy
+(`pillar_maze`). Ta jsou sestavována hromadně (z náhodných bajtů převedených
+metodou `bytes.translate`, resp. z předem připravených řádků), a to i pro
+rozměry v řádu 10 000 x 10 000 políček během několika sekund. Stejně rychle
+vzniká i dokonalé bludiště `sidewinder_maze` (vektorově pomocí knihovny
+NumPy). Ostatní dokonalá bludiště jsou naproti tomu bourána zeď po zdi;
+jejich tvorba trvá řádově mikrosekundy na políčko, pro 10 000 x 10 000
+políček tedy minuty.
+
+Všechny generátory jsou deterministické vzhledem k dodanému semínku. Rozměry
+jsou zaokrouhleny na lichá čísla (nejméně 5), obvod bludiště tvoří zeď.
+Start je defaultně v levém horním a cíl v pravém dolním rohu.
+
+Bludiště lze vytvořit a uložit i z příkazové řádky:
+
+    python -m src.generator kruskal 1001 1001 mazes/kruskal_1001.txt --seed 1
+    python -m src.generator open 10001 10001 open.mzb --density 0.3 --binary
+"""
+
+# Import knihoven pro zpracování parametrů a generování náhodných čísel
+import argparse
+import random
+
+# Import společného protokolu pro funkce
+from typing import Callable
+
+# Import prostředků bludiště
+from .maze import (Maze, save_maze, WALL_CODE, PATH_CODE, START_CODE,
+                   GOAL_CODE)
+
+
+# Výchozí hustota překážek bludiště typu 'otevřený svět'
+DEFAULT_DENSITY = 0.3
+
+# Počet řad políček, které generátor Sidewinder zpracovává najednou
+SIDEWINDER_BLOCK_ROWS = 1024
+
+
+def _dimensions(width: int, height: int) -> tuple[int, int]:
+    """Pomocná funkce zaokrouhlí rozměry na lichá čísla (nejméně 5)."""
+    return max(width | 1, 5), max(height | 1, 5)
+
+
+def _cell_grid(width: int, height: int) -> bytearray:
+    """Pomocná funkce vrací pracovní mřížku pro tvorbu dokonalého bludiště:
+    0 pro dosud nenavštívená políčka na lichých souřadnicích, 1 pro všechny
+    ostatní pozice. Mřížka je o dva řádky delší, aby skok o dva řádky za
+    horní okraj nevedl mimo ni (skok pod dolní okraj vede díky záporným
+    indexům na poslední řádky, které také nejsou políčky)."""
+    grid = bytearray(b"\1") * (width * (height + 2))
+    for row in range(1, height - 1, 2):
+        start = row * width + 1
+        grid[start:start + width - 2:2] = bytes((width - 1) // 2)
+    return grid
+
+
+def _finish(cells: bytearray, width: int, height: int,
+            start: tuple[int, int], goal: tuple[int, int]) -> Maze:
+    """Pomocná funkce umístí do paměti políček start a cíl (defaultně levý
+    horní a pravý dolní roh) a vytvoří z ní bludiště."""
+    start = start if start is not None else (1, height - 2)
+    goal = goal if goal is not None else (width - 2, 1)
+    positions = []
+    for (x, y), code in ((start, START_CODE), (goal, GOAL_CODE)):
+        if not (0 <= x < width and 0 <= y < height):
+            raise Exception(f"Souřadnice {x}, {y} leží mimo bludiště "
+                            f"{width}x{height}")
+        positions.append(y * width + x)
+        cells[y * width + x] = code
+    if positions[0] == positions[1]:
+        raise Exception("Start a cíl nemohou ležet na tomtéž políčku")
+    return Maze.from_cells(width, height, cells, (0, 0), *positions)
+
+
+def backtracker_maze(width: int, height: int, seed: int = None,
+                     start: tuple[int, int] = None,
+                     goal: tuple[int, int] = None) -> Maze:
+    """Funkce vytvoří dokonalé bludiště prohledáváním do hloubky s návratem:
+    z aktuálního políčka se zboří zeď k náhodnému nenavštívenému sousedovi,
+    a nemá-li takového, vrací se po zásobníku zpět."""
+    width, height = _dimensions(width, height)
+    rng = random.Random(seed)
+    grid = _cell_grid(width, height)
+    cells = bytearray([WALL_CODE]) * (width * height)
+    steps = (2, -2, 2 * width, -2 * width)
+
+    position = width + 1
+    grid[position] = 1
+    cells[position] = PATH_CODE
+    stack = [position]
+    while stack:
+        position = stack[-1]
+        options = [step for step in steps if not grid[position + step]]
+        if not options:
+            stack.pop()
+            continue
+        step = options[int(rng.random() * len(options))]
+        following = position + step
+        grid[following] = 1
+        cells[following] = PATH_CODE
+        cells[position + step // 2] = PATH_CODE
+        stack.append(following)
+
+    return _finish(cells, width, height, start, goal)
+
+
+def kruskal_maze(width: int, height: int, seed: int = None,
+                 start: tuple[int, int] = None,
+                 goal: tuple[int, int] = None) -> Maze:
+    """Funkce vytvoří dokonalé bludiště Kruskalovým algoritmem: zdi mezi
+    sousedními políčky jsou procházeny v náhodném pořadí a každá zeď, která
+    odděluje dosud nespojené části (dle disjunktních množin), je zbořena."""
+    width, height = _dimensions(width, height)
+    rng = random.Random(seed)
+    columns, rows = (width - 1) // 2, (height - 1) // 2
+    count = columns * rows
+
+    # Všechna políčka na lichých souřadnicích jsou cestou
+    cells = bytearray([WALL_CODE]) * (width * height)
+    for row in range(1, height - 1, 2):
+        begin = row * width + 1
+        cells[begin:begin + width - 2:2] = bytes([PATH_CODE]) * columns
+
+    # Zdi jako 2 * index políčka + směr (0 doprava, 1 nahoru)
+    walls = [2 * cell for cell in range(count) if cell % columns
+             != columns - 1]
+    walls += [2 * cell + 1 for cell in range(count - columns)]
+    rng.shuffle(walls)
+
+    parents = list(range(count))
+    for wall in walls:
+        cell, vertical = divmod(wall, 2)
+        other = cell + columns if vertical else cell + 1
+
+        # Nalezení reprezentantů obou množin (se zkracováním cest)
+        first = cell
+        while parents[first] != first:
+            parents[first] = parents[parents[first]]
+            first = parents[first]
+        second = other
+        while parents[second] != second:
+            parents[second] = parents[parents[second]]
+            second = parents[second]
+        if first == second:
+            continue
+
+        parents[first] = second
+        position = (2 * (cell // columns) + 1) * width \
+            + 2 * (cell % columns) + 1
+        cells[position + (width if vertical else 1)] = PATH_CODE
+
+    return _finish(cells, width, height, start, goal)
+
+
+def wilson_maze(width: int, height: int, seed: int = None,
+                start: tuple[int, int] = None,
+                goal: tuple[int, int] = None) -> Maze:
+    """Funkce vytvoří dokonalé bludiště Wilsonovým algoritmem: z každého
+    políčka mimo dosud vytvořený strom se vede náhodná procházka, dokud
+    nenarazí na strom; procházka se zbavenými smyčkami (pamatuje se jen
+    poslední směr z každého políčka) je pak ke stromu připojena."""
+    width, height = _dimensions(width, height)
+    rng = random.Random(seed)
+    grid = _cell_grid(width, height)
+    cells = bytearray([WALL_CODE]) * (width * height)
+    steps = (2, -2, 2 * width, -2 * width)
+    random_bits = rng.getrandbits
+
+    # Stav políček v mřížce: 0 mimo strom, 1 není políčkem, 2 ve stromu
+    grid[width + 1] = 2
+    cells[width + 1] = PATH_CODE
+
+    for row in range(1, height - 1, 2):
+        for origin in range(row * width + 1, (row + 1) * width - 1, 2):
+            if grid[origin]:
+                continue
+
+            # Náhodná procházka až ke stromu s posledním směrem z políček;
+            # směr je losován ze všech čtyř, dokud nevede na políčko
+            directions = {}
+            position = origin
+            while not grid[position]:
+                step = steps[random_bits(2)]
+                while grid[position + step] == 1:
+                    step = steps[random_bits(2)]
+                directions[position] = step
+                position += step
+
+            # Připojení procházky bez smyček ke stromu
+            position = origin
+            while not grid[position]:
+                step = directions[position]
+                grid[position] = 2
+                cells[position] = PATH_CODE
+                cells[position + step // 2] = PATH_CODE
+                position += step
+
+    return _finish(cells, width, height, start, goal)
+
+
+def sidewinder_maze(width: int, height: int, seed: int = None,
+                    start: tuple[int, int] = None,
+                    goal: tuple[int, int] = None) -> Maze:
+    """Funkce vytvoří dokonalé bludiště algoritmem Sidewinder: horní řada
+    políček je jedinou chodbou a v každé další řadě se políčka náhodně
+    spojují do úseků vedoucích doprava, přičemž z každého úseku vede
+    nahoru (do vyšší řady) zbořená zeď z jednoho náhodného políčka.
+
+    Úseky nepřesahují hranice řad, rozhodnutí všech políček jsou tedy
+    nezávislá a bludiště je sestaveno vektorově (pomocí knihovny NumPy)
+    po blocích řad. Bludiště mají horní chodbu a svislé chodby bez slepých
+    uliček směrem nahoru, zato je jejich tvorba i pro 10 000 x 10 000
+    políček otázkou sekund."""
+    # Import až zde, aby ostatní generátory na knihovně NumPy nezávisely
+    import numpy as np
+
+    width, height = _dimensions(width, height)
+    rng = np.random.default_rng(seed)
+    columns, rows = (width - 1) // 2, (height - 1) // 2
+
+    # Všechna políčka na lichých souřadnicích jsou cestou
+    cells = bytearray([WALL_CODE]) * (width * height)
+    for row in range(1, height - 1, 2):
+        begin = row * width + 1
+        cells[begin:begin + width - 2:2] = bytes([PATH_CODE]) * columns
+    view = np.frombuffer(cells, dtype=np.uint8)
+
+    # Horní řada políček je jedinou chodbou
+    top = (2 * rows - 1) * width + 1
+    view[top + 1:top + 2 * columns - 2:2] = PATH_CODE
+
+    # Pozice políček v rámci řady (relativně k první řadě bloku)
+    offsets = (np.arange(columns, dtype=np.int64) * 2)[np.newaxis, :]
+    for first in range(0, rows - 1, SIDEWINDER_BLOCK_ROWS):
+        count = min(SIDEWINDER_BLOCK_ROWS, rows - 1 - first)
+        positions = ((2 * np.arange(first, first + count, dtype=np.int64)
+                      + 1) * width + 1)[:, np.newaxis] + offsets
+
+        # Úsek končí náhodně, vždy však na konci řady; jinak se boří zeď
+        # doprava
+        closes = rng.random((count, columns)) < 0.5
+        closes[:, -1] = True
+        view[positions[~closes] + 1] = PATH_CODE
+
+        # Z každého úseku vede nahoru políčko s nejvyšším náhodným klíčem;
+        # klíč nese ve spodních bitech pořadí políčka v bloku
+        closes = closes.ravel()
+        starts = np.concatenate(([0], np.flatnonzero(closes[:-1]) + 1))
+        keys = rng.integers(0, 2 ** 31, closes.size, dtype=np.int64) << 32 \
+            | np.arange(closes.size, dtype=np.int64)
+        chosen = np.maximum.reduceat(keys, starts) & 0xFFFFFFFF
+        view[positions.ravel()[chosen] + width] = PATH_CODE
+
+    return _finish(cells, width, height, start, goal)
+
+
+def open_maze(width: int, height: int, seed: int = None,
+              start: tuple[int, int] = None, goal: tuple[int, int] = None,
+              density: float = DEFAULT_DENSITY) -> Maze:
+    """Funkce vytvoří bludiště typu 'otevřený svět' s náhodně rozmístěnými
+    překážkami, kde dodaná hustota je pravděpodobností zdi na každém
+    políčku. Každý náhodný bajt je převeden na zeď či cestu jedinou
+    převodní tabulkou. Cesta mezi startem a cílem nemusí existovat."""
+    width, height = _dimensions(width, height)
+    rng = random.Random(seed)
+    threshold = round(density * 256)
+    table = bytes(WALL_CODE if value < threshold else PATH_CODE
+                  for value in range(256))
+    cells = bytearray(rng.randbytes(width * height)).translate(table)
+
+    # Obvodová zeď (sloupce po krocích šířky bludiště)
+    cells[:width] = cells[-width:] = bytes([WALL_CODE]) * width
+    cells[::width] = cells[width - 1::width] = bytes([WALL_CODE]) * height
+
+    return _finish(cells, width, height, start, goal)
+
+
+def pillar_maze(width: int, height: int, seed: int = None,
+                start: tuple[int, int] = None,
+                goal: tuple[int, int] = None) -> Maze:
+    """Funkce vytvoří bludiště typu 'otevřený svět' s obvodovou zdí
+    a pravidelně rozmístěnými sloupy (na sudých souřadnicích). Bludiště
+    je sestaveno z předem připravených řádků; semínko nemá vliv."""
+    width, height = _dimensions(width, height)
+    wall = bytes([WALL_CODE])
+    border = wall * width
+    free = wall + bytes([PATH_CODE]) * (width - 2) + wall
+    pillars = (wall + bytes([PATH_CODE])) * (width // 2) + wall
+
+    rows = [free if row % 2 else pillars for row in range(height)]
+    rows[0] = rows[-1] = border
+    return _finish(bytearray(b"".join(rows)), width, height, start, goal)
+
+
+# Generátory bludišť dle názvů
+GENERATORS: dict[str, Callable[..., Maze]] = {
+    "backtracker": backtracker_maze,
+    "kruskal": kruskal_maze,
+    "wilson": wilson_maze,
+    "sidewinder": sidewinder_maze,
+    "open": open_maze,
+    "pillars": pillar_maze,
+}
+
+
+def generate_maze(kind: str, width: int, height: int, seed: int = None,
+                  start: tuple[int, int] = None, goal: tuple[int, int] = None,
+                  density: float = DEFAULT_DENSITY) -> Maze:
+    """Funkce vytvoří bludiště generátorem daného názvu (viz `GENERATORS`).
+    Hustota překážek je použita jen u bludiště typu `open`."""
+    if kind not in GENERATORS:
+        raise Exception(f"Neznámý generátor bludiště: {kind}")
+    if kind == "open":
+        return open_maze(width, height, seed, start, goal, density)
+    return GENERATORS[kind](width, height, seed, start, goal)
+
+
+if __name__ == "__main__":
+    # Import až zde kvůli zamezení cyklickým importům
+    from .binary_maze import save_binary_maze
+
+    parser = argparse.ArgumentParser(
+        description="Vytvoření umělého bludiště")
+    parser.add_argument("kind", choices=sorted(GENERATORS),
+                        help="typ bludiště (pro velká dokonalá bludiště "
+                             "je nejrychlejší sidewinder)")
+    parser.add_argument("width", type=int, help="šířka bludiště")
+    parser.add_argument("height", type=int, help="výška bludiště")
+    parser.add_argument("destination", help="cílový soubor")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="semínko generátoru náhodných čísel")
+    parser.add_argument("--density", type=float, default=DEFAULT_DENSITY,
+                        help="hustota překážek (jen pro typ open)")
+    parser.add_argument("--start", type=int, nargs=2, default=None,
+                        help="souřadnice startu (x y)")
+    parser.add_argument("--goal", type=int, nargs=2, default=None,
+                        help="souřadnice cíle (x y)")
+    parser.add_argument("--binary", action="store_true",
+                        help="uložit v binárním formátu")
+    arguments = parser.parse_args()
+
+    maze = generate_maze(arguments.kind, arguments.width, arguments.height,
+                         arguments.seed, arguments.start, arguments.goal,
+                         arguments.density)
+    if arguments.binary:
+        save_binary_maze(maze, arguments.destination)
+    else:
+        save_maze(maze, arguments.destination)
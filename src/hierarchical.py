@@ -0,0 +1,415 @@
+"""Modul obsahuje hierarchický plánovač cest (HPA*, Hierarchical Path-Finding
+A*) pro bludiště velkých rozměrů.
+
+Bludiště je rozděleno na čtvercové shluky (clustery). Na hranicích sousedních
+shluků jsou nalezeny vstupy - úseky průchozích dvojic políček - a každý vstup
+je reprezentován jedním či dvěma přechody. Políčka přechodů jsou uzly
+abstraktního grafu; ten nese hrany přes hranice shluků (cena 1) a hrany uvnitř
+shluků (délka nejkratší cesty uvnitř shluku), které jsou předpočítány jednou.
+
+Dotaz na cestu pak spustí A* jen nad abstraktním grafem a na jednotlivé kroky
+zjemní (refine) jen ty shluky, kterými nalezená abstraktní cesta vede. Změna
+políčka bludiště vede k přepočtu jen toho shluku, ve kterém políčko leží.
+
+Nalezené cesty nejsou nutně nejkratší - omezení na přechody a na cesty uvnitř
+shluků je vykoupeno řádově rychlejšími dotazy nad velkými bludišti.
+"""
+
+# Import datových struktur pro frontu a haldu a funkce pro měření času
+from collections import deque
+from heapq import heappush, heappop
+from time import perf_counter_ns
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable
+
+# Import prostředků bludiště a stavového prostoru
+from .maze import Maze, NO_FIELD_CODE, WALL_CODE
+from .state_space import StateSpace, State, Operator
+
+
+# Výchozí délka strany shluku (v políčkách)
+DEFAULT_CLUSTER_SIZE = 16
+
+# Vstupy alespoň této délky jsou reprezentovány dvěma přechody (na krajích)
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPlanner:
+    """Instance této třídy plánují cesty v bludišti pomocí hierarchického
+    abstraktního grafu (viz popis modulu).
+
+    Uzly abstraktního grafu jsou identifikovány pozicemi políček v paměti
+    bludiště (viz `Maze.position(int, int)`). Plánovač se zaregistruje
+    u bludiště (viz `Maze.add_listener`), změněné shluky si poznamená
+    a přepočte je před dalším dotazem. Pokud již plánovač není potřeba, je
+    vhodné jej od bludiště odpojit metodou `close()`.
+
+    Plánovač vyžaduje právě operátory pro čtyři ortogonální směry.
+    """
+
+    def __init__(self, maze: Maze, operators: Iterable[Operator] = None,
+                 cluster_size: int = DEFAULT_CLUSTER_SIZE):
+        """Initor, který přijímá bludiště, volitelně sadu operátorů (defaultně
+        všechny ortogonální směry) a délku strany shluku. Abstraktní graf je
+        sestaven ihned při vytvoření instance.
+        """
+        start = perf_counter_ns()
+
+        self._maze = maze
+        self._operators = tuple(operators) if operators is not None \
+            else Operator.create_operators()
+        self._steps = [(o.direction.x_diff, o.direction.y_diff,
+                        o.direction.x_diff + o.direction.y_diff * maze.width)
+                       for o in self._operators]
+        if {step[:2] for step in self._steps} \
+                != {(1, 0), (0, 1), (-1, 0), (0, -1)}:
+            raise Exception("Hierarchický plánovač vyžaduje právě operátory "
+                            "pro čtyři ortogonální směry")
+
+        self._cluster_size = cluster_size
+        self._columns = -(-maze.width // cluster_size)
+        self._rows = -(-maze.height // cluster_size)
+        cluster_count = self._columns * self._rows
+
+        # Přechody mezi sousedními shluky: (shluk a, shluk b) -> dvojice
+        # pozic (políčko ve shluku a, políčko ve shluku b), kde a < b
+        self._transitions: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+        # Pro každý shluk: uzel -> pozice, na které z něj vedou přechody,
+        # a uzel -> {jiný uzel téhož shluku: délka cesty uvnitř shluku}
+        self._crossings: list[dict[int, list[int]]] = \
+            [{} for _ in range(cluster_count)]
+        self._edges: list[dict[int, dict[int, int]]] = \
+            [{} for _ in range(cluster_count)]
+
+        # Shluky čekající na přepočet a počet provedených přepočtů
+        self._dirty: set[int] = set()
+        self._rebuild_count = 0
+
+        for cluster in range(cluster_count):
+            for neighbour in self._neighbour_clusters(cluster):
+                if cluster < neighbour:
+                    self._update_transitions(cluster, neighbour)
+        for cluster in range(cluster_count):
+            self._update_crossings(cluster)
+            self._update_edges(cluster)
+
+        maze.add_listener(self._cell_changed)
+        self._build_time_ns = perf_counter_ns() - start
+
+    @property
+    def maze(self) -> Maze:
+        """Bludiště, nad kterým plánovač pracuje."""
+        return self._maze
+
+    @property
+    def cluster_size(self) -> int:
+        """Délka strany shluku (v políčkách)."""
+        return self._cluster_size
+
+    @property
+    def cluster_count(self) -> int:
+        """Počet shluků, na které je bludiště rozděleno."""
+        return len(self._edges)
+
+    @property
+    def node_count(self) -> int:
+        """Počet uzlů abstraktního grafu (políček přechodů)."""
+        return sum(len(crossings) for crossings in self._crossings)
+
+    @property
+    def build_time_ns(self) -> int:
+        """Doba sestavení abstraktního grafu v nanosekundách."""
+        return self._build_time_ns
+
+    @property
+    def rebuild_count(self) -> int:
+        """Počet přepočtů jednotlivých shluků po změnách bludiště."""
+        return self._rebuild_count
+
+    def cluster(self, x: int, y: int) -> int:
+        """Metoda vrací identifikátor shluku, ve kterém leží políčko na
+        dodaných souřadnicích, nebo -1 pro souřadnice mimo bludiště."""
+        position = self._maze.position(x, y)
+        return self._cluster_of(position) if position >= 0 else -1
+
+    def _cluster_of(self, position: int) -> int:
+        """Pomocná metoda vrací identifikátor shluku dané pozice."""
+        row, column = divmod(position, self._maze.width)
+        return (row // self._cluster_size) * self._columns \
+            + column // self._cluster_size
+
+    def _bounds(self, cluster: int) -> tuple[int, int, int, int]:
+        """Pomocná metoda vrací rozsah sloupců a řádků shluku jako čtveřici
+        (první sloupec, první řádek, konec sloupců, konec řádků)."""
+        row, column = divmod(cluster, self._columns)
+        first_column = column * self._cluster_size
+        first_row = row * self._cluster_size
+        return (first_column, first_row,
+                min(first_column + self._cluster_size, self._maze.width),
+                min(first_row + self._cluster_size, self._maze.height))
+
+    def _neighbour_clusters(self, cluster: int) -> list[int]:
+        """Pomocná metoda vrací identifikátory shluků sousedících s dodaným.
+        """
+        row, column = divmod(cluster, self._columns)
+        neighbours = []
+        if column > 0:
+            neighbours.append(cluster - 1)
+        if column < self._columns - 1:
+            neighbours.append(cluster + 1)
+        if row > 0:
+            neighbours.append(cluster - self._columns)
+        if row < self._rows - 1:
+            neighbours.append(cluster + self._columns)
+        return neighbours
+
+    def _passable(self, position: int) -> bool:
+        """Pomocná metoda vrací, zda-li je políčko na dané pozici průchozí."""
+        code = self._maze.cells[position]
+        return code != NO_FIELD_CODE and code != WALL_CODE
+
+    def _update_transitions(self, first: int, second: int):
+        """Pomocná metoda nalezne přechody na hranici dvou sousedních shluků
+        (první má menší identifikátor, leží tedy vlevo či pod druhým).
+
+        Každý souvislý úsek průchozích dvojic políček (vstup) je reprezentován
+        přechodem uprostřed, dlouhé vstupy pak dvěma přechody na krajích."""
+        width = self._maze.width
+        first_column, first_row, end_column, end_row = self._bounds(first)
+
+        # Dvojice pozic podél hranice (vodorovné, nebo svislé)
+        if second == first + self._columns:
+            pairs = [((end_row - 1) * width + column, end_row * width + column)
+                     for column in range(first_column, end_column)]
+        else:
+            pairs = [(row * width + end_column - 1, row * width + end_column)
+                     for row in range(first_row, end_row)]
+
+        # Rozdělení na souvislé úseky průchozích dvojic
+        transitions = []
+        entrance = []
+        for pair in pairs + [None]:
+            if pair is not None and self._passable(pair[0]) \
+                    and self._passable(pair[1]):
+                entrance.append(pair)
+                continue
+            if len(entrance) >= LONG_ENTRANCE:
+                transitions += [entrance[0], entrance[-1]]
+            elif entrance:
+                transitions.append(entrance[len(entrance) // 2])
+            entrance = []
+
+        self._transitions[(first, second)] = transitions
+
+    def _update_crossings(self, cluster: int):
+        """Pomocná metoda sestaví přechody vedoucí z uzlů dodaného shluku."""
+        crossings = {}
+        for neighbour in self._neighbour_clusters(cluster):
+            key = (min(cluster, neighbour), max(cluster, neighbour))
+            for first, second in self._transitions[key]:
+                own, other = (first, second) if cluster < neighbour \
+                    else (second, first)
+                crossings.setdefault(own, []).append(other)
+        self._crossings[cluster] = crossings
+
+    def _update_edges(self, cluster: int):
+        """Pomocná metoda předpočítá délky nejkratších cest mezi všemi uzly
+        dodaného shluku (vedoucích jen uvnitř shluku)."""
+        nodes = self._crossings[cluster]
+        edges = {}
+        for node in nodes:
+            distances = self._search_cluster(cluster, node)[0]
+            edges[node] = {other: distances[other] for other in nodes
+                           if other != node and other in distances}
+        self._edges[cluster] = edges
+
+    def _search_cluster(self, cluster: int,
+                        source: int) -> tuple[dict[int, int], dict[int, int]]:
+        """Pomocná metoda prohledá do šířky políčka dodaného shluku z dodané
+        pozice. Vrací vzdálenosti dosažených pozic a indexy operátorů, kterými
+        byly pozice dosaženy."""
+        width = self._maze.width
+        first_column, first_row, end_column, end_row = self._bounds(cluster)
+        passable = self._passable
+
+        distances = {source: 0}
+        operators = {}
+        queue = deque([source])
+        while queue:
+            position = queue.popleft()
+            row, column = divmod(position, width)
+            distance = distances[position] + 1
+            for index, (x_diff, y_diff, offset) in enumerate(self._steps):
+                if not (first_column <= column + x_diff < end_column
+                        and first_row <= row + y_diff < end_row):
+                    continue
+                neighbour = position + offset
+                if neighbour not in distances and passable(neighbour):
+                    distances[neighbour] = distance
+                    operators[neighbour] = index
+                    queue.append(neighbour)
+        return distances, operators
+
+    def _cell_changed(self, x: int, y: int):
+        """Reakce na změnu políčka bludiště - poznamená si jeho shluk."""
+        cluster = self.cluster(x, y)
+        if cluster >= 0:
+            self._dirty.add(cluster)
+
+    def rebuild(self):
+        """Metoda přepočte všechny shluky, ve kterých se od posledního
+        přepočtu změnilo některé políčko. Je volána automaticky před každým
+        dotazem.
+
+        Přepočteny jsou přechody na hranicích změněného shluku a cesty uvnitř
+        něj; sousední shluky jsou přepočteny jen tehdy, změnily-li se jejich
+        uzly."""
+        for cluster in sorted(self._dirty):
+            neighbours = self._neighbour_clusters(cluster)
+            for neighbour in neighbours:
+                self._update_transitions(min(cluster, neighbour),
+                                         max(cluster, neighbour))
+            for affected in [cluster] + neighbours:
+                nodes = set(self._crossings[affected])
+                self._update_crossings(affected)
+                if affected == cluster \
+                        or nodes != set(self._crossings[affected]):
+                    self._update_edges(affected)
+            self._rebuild_count += 1
+        self._dirty.clear()
+
+    def close(self):
+        """Metoda odpojí plánovač od bludiště (změny bludiště již nebudou
+        sledovány)."""
+        self._maze.remove_listener(self._cell_changed)
+
+    def path(self, start: tuple[int, int],
+             goal: tuple[int, int]) -> tuple[Operator]:
+        """Metoda vrací cestu (sekvenci operátorů) z políčka na souřadnicích
+        `start` do políčka na souřadnicích `goal`, nebo None, pokud cesta
+        neexistuje.
+
+        Start a cíl jsou do abstraktního grafu vloženy jen dočasně (cestami
+        uvnitř svých shluků k jejich uzlům), poté proběhne A* nad abstraktním
+        grafem a nalezená abstraktní cesta je zjemněna na jednotlivé kroky.
+        """
+        if self._dirty:
+            self.rebuild()
+
+        maze = self._maze
+        if not maze.is_passable(*start) or not maze.is_passable(*goal):
+            return None
+        source, target = maze.position(*start), maze.position(*goal)
+        if source == target:
+            return ()
+
+        # Dočasné hrany ze startu a do cíle (uvnitř jejich shluků)
+        source_cluster = self._cluster_of(source)
+        target_cluster = self._cluster_of(target)
+        distances = self._search_cluster(source_cluster, source)[0]
+        source_edges = {node: distances[node]
+                        for node in self._crossings[source_cluster]
+                        if node in distances}
+        if target in distances:
+            source_edges[target] = distances[target]
+        distances = self._search_cluster(target_cluster, target)[0]
+        target_edges = {node: distances[node]
+                        for node in self._crossings[target_cluster]
+                        if node in distances}
+
+        abstract_path = self._abstract_search(source, target, source_edges,
+                                              target_edges)
+        if abstract_path is None:
+            return None
+        return self._refine(abstract_path)
+
+    def _abstract_search(self, source: int, target: int,
+                         source_edges: dict[int, int],
+                         target_edges: dict[int, int]) -> list[int]:
+        """Pomocná metoda provede A* nad abstraktním grafem rozšířeným
+        o dočasné hrany startu a cíle. Vrací seznam pozic abstraktní cesty
+        (včetně startu a cíle), nebo None, pokud cesta neexistuje."""
+        width = self._maze.width
+        target_row, target_column = divmod(target, width)
+
+        def h(position: int) -> int:
+            row, column = divmod(position, width)
+            return abs(target_row - row) + abs(target_column - column)
+
+        costs = {source: 0}
+        parents = {source: None}
+        closed = set()
+        heap = [(h(source), 0, source)]
+        while heap:
+            _, cost, position = heappop(heap)
+            if position == target:
+                break
+            if position in closed:
+                continue
+            closed.add(position)
+
+            # Hrany uvnitř shluku (či dočasné ze startu), přes hranice shluků
+            # a případně dočasná hrana do cíle
+            cluster = self._cluster_of(position)
+            edges = list(source_edges.items() if position == source
+                         else self._edges[cluster].get(position, {}).items())
+            edges += [(other, 1) for other
+                      in self._crossings[cluster].get(position, ())]
+            if position in target_edges:
+                edges.append((target, target_edges[position]))
+
+            for neighbour, length in edges:
+                new_cost = cost + length
+                if new_cost < costs.get(neighbour, new_cost + 1):
+                    costs[neighbour] = new_cost
+                    parents[neighbour] = position
+                    heappush(heap, (new_cost + h(neighbour), new_cost,
+                                    neighbour))
+        else:
+            return None
+
+        abstract_path = []
+        position = target
+        while position is not None:
+            abstract_path.append(position)
+            position = parents[position]
+        return abstract_path[::-1]
+
+    def _refine(self, abstract_path: list[int]) -> tuple[Operator]:
+        """Pomocná metoda zjemní abstraktní cestu na jednotlivé operátory.
+        Přechod mezi shluky je jediným krokem, úsek uvnitř shluku je znovu
+        prohledán do šířky (jen v rámci tohoto shluku)."""
+        path = []
+        for source, target in zip(abstract_path, abstract_path[1:]):
+            cluster = self._cluster_of(source)
+            if cluster != self._cluster_of(target):
+                offset = target - source
+                path += [operator for operator, step
+                         in zip(self._operators, self._steps)
+                         if step[2] == offset]
+                continue
+
+            operators = self._search_cluster(cluster, source)[1]
+            segment = []
+            while target != source:
+                index = operators[target]
+                segment.append(self._operators[index])
+                target -= self._steps[index][2]
+            path += reversed(segment)
+        return tuple(path)
+
+    def solve(self, state_space: StateSpace) -> State:
+        """Metoda vrací cílový stav cesty z počátečního stavu dodaného
+        stavového prostoru do jeho cílového stavu, nebo None, pokud cesta
+        neexistuje. Stav je vytvořen postupnou aplikací operátorů cesty."""
+        path = self.path(state_space.initial_state.field_coords,
+                         state_space.final_state.field_coords)
+        if path is None:
+            return None
+
+        state = state_space.initial_state
+        for operator in path:
+            state = operator.apply(state)
+        return state
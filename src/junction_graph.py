@@ -0,0 +1,175 @@
+"""Modul obsahuje definici grafu křižovatek, tedy bludiště se staženými
+chodbami.
+
+Většina políček typického bludiště leží v chodbách šířky jednoho políčka,
+ve kterých není co rozhodovat - z každého takového políčka vede cesta jen
+dál, nebo zpět. Graf křižovatek proto za uzly považuje jen křižovatky, slepé
+konce a počáteční a cílové políčko; každá chodba mezi dvěma uzly je stažena
+do jedné hrany ohodnocené svou délkou a cenou (součtem cen vstupu na
+políčka chodby). Prohledávání nad takovým grafem rozevírá řádově méně stavů,
+nalezenou cestu lze přitom zpět rozvinout na jednotlivé operátory.
+"""
+
+# Import kompaktních polí pro uložení grafu a funkce pro měření času
+from array import array
+from time import perf_counter_ns
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable, Iterator
+
+# Import bludiště a operátorů, ze kterých se graf sestavuje
+from .maze import Maze
+from .state_space import Operator
+
+
+class JunctionGraph:
+    """Instance této třídy reprezentují neměnný graf křižovatek bludiště pro
+    danou sadu operátorů.
+
+    Uzlem je každé průchozí políčko, ze kterého nevedou právě dvě cesty
+    (křižovatka či slepý konec), a dále každé z dodaných koncových políček
+    (typicky start a cíl). Hrana vede z uzlu každým aplikovatelným operátorem
+    a pokračuje chodbou až k nejbližšímu uzlu; nese cílový uzel, délku chodby,
+    cenu chodby (součet cen vstupu na její políčka včetně cílového, viz
+    `Maze.cost(int, int)`) a indexy operátorů, ze kterých se chodba skládá.
+
+    Chodby předpokládají symetrické operátory (ke každému směru existuje
+    opačný), jako je tomu u ortogonálních směrů.
+
+    Graf je snímkem bludiště v okamžiku svého sestavení; pokud se bludiště
+    později změní, je třeba graf sestavit znovu.
+    """
+
+    def __init__(self, maze: Maze, operators: Iterable[Operator],
+                 terminals: Iterable[tuple[int, int]] = ()):
+        """Initor, který přijímá bludiště, sadu operátorů a souřadnice
+        políček, která mají být uzly grafu vždy (typicky start a cíl)."""
+        start = perf_counter_ns()
+
+        self._maze = maze
+        self._operators = tuple(operators)
+        terminals = set(terminals)
+        diffs = [(o.direction.x_diff, o.direction.y_diff)
+                 for o in self._operators]
+        passable = maze.is_passable
+
+        # Mapování pozice v paměti bludiště na identifikátor uzlu (nebo -1)
+        # a opačné mapování identifikátoru uzlu na pozici
+        self._node_ids = array("l", [-1]) * len(maze.cells)
+        self._positions = array("l")
+
+        # Uzly jsou průchozí políčka s jiným počtem sousedů než dva
+        self._cell_count = 0
+        for position in range(len(maze.cells)):
+            x, y = maze.coordinates(position)
+            if not passable(x, y):
+                continue
+            self._cell_count += 1
+            degree = sum(passable(x + dx, y + dy) for dx, dy in diffs)
+            if degree != 2 or (x, y) in terminals:
+                self._node_ids[position] = len(self._positions)
+                self._positions.append(position)
+
+        # Hrany uzlů: (cílový uzel, délka chodby, cena chodby, indexy
+        # operátorů chodby)
+        self._edges: list[list[tuple[int, int, int, bytes]]] = []
+        for position in self._positions:
+            x, y = maze.coordinates(position)
+            edges = []
+            for index, (dx, dy) in enumerate(diffs):
+                if passable(x + dx, y + dy):
+                    edges.append(self._corridor(x, y, index, diffs))
+            self._edges.append(edges)
+
+        self._build_time_ns = perf_counter_ns() - start
+
+    def _corridor(self, x: int, y: int, index: int,
+                  diffs: list[tuple[int, int]]
+                  ) -> tuple[int, int, int, bytes]:
+        """Pomocná metoda projde chodbu z uzlu na dodaných souřadnicích
+        operátorem s dodaným indexem až k nejbližšímu uzlu a vrátí hranu
+        (cílový uzel, délka chodby, cena chodby, indexy operátorů chodby)."""
+        maze = self._maze
+        path = bytearray([index])
+        previous = (x, y)
+        x, y = x + diffs[index][0], y + diffs[index][1]
+        cost = maze.cost(x, y)
+
+        # Z políčka chodby vede (kromě cesty zpět) právě jedna cesta dál
+        while self._node_ids[maze.position(x, y)] < 0:
+            for next_index, (dx, dy) in enumerate(diffs):
+                following = (x + dx, y + dy)
+                if following != previous and maze.is_passable(*following):
+                    break
+            path.append(next_index)
+            previous, (x, y) = (x, y), following
+            cost += maze.cost(x, y)
+
+        return (self._node_ids[maze.position(x, y)], len(path), cost,
+                bytes(path))
+
+    @property
+    def maze(self) -> Maze:
+        """Bludiště, ze kterého byl graf sestaven."""
+        return self._maze
+
+    @property
+    def operators(self) -> tuple[Operator]:
+        """Operátory, ze kterých se skládají chodby grafu."""
+        return self._operators
+
+    @property
+    def cell_count(self) -> int:
+        """Počet průchozích políček bludiště."""
+        return self._cell_count
+
+    @property
+    def node_count(self) -> int:
+        """Počet uzlů grafu (křižovatek, slepých konců a koncových políček).
+        """
+        return len(self._positions)
+
+    @property
+    def edge_count(self) -> int:
+        """Počet (orientovaných) hran grafu."""
+        return sum(len(edges) for edges in self._edges)
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Poměr počtu uzlů grafu k počtu průchozích políček bludiště; čím
+        menší, tím více se prohledávání stažením chodeb ušetří."""
+        return self.node_count / self._cell_count if self._cell_count else 1.0
+
+    @property
+    def build_time_ns(self) -> int:
+        """Doba sestavení grafu v nanosekundách."""
+        return self._build_time_ns
+
+    def node_id(self, x: int, y: int) -> int:
+        """Metoda vrací identifikátor uzlu na dodaných souřadnicích, nebo -1,
+        pokud políčko není uzlem grafu."""
+        position = self._maze.position(x, y)
+        return self._node_ids[position] if position >= 0 else -1
+
+    def coordinates(self, node_id: int) -> tuple[int, int]:
+        """Metoda vrací souřadnice políčka uzlu s dodaným identifikátorem."""
+        return self._maze.coordinates(self._positions[node_id])
+
+    def edges(self, node_id: int
+              ) -> Iterator[tuple[int, int, int, Operator]]:
+        """Metoda vrací iterátor přes hrany uzlu s dodaným identifikátorem
+        jako čtveřice (cílový uzel, délka chodby, cena chodby, první operátor
+        chodby)."""
+        operators = self._operators
+        return ((target, length, cost, operators[path[0]])
+                for target, length, cost, path in self._edges[node_id])
+
+    def corridor(self, node_id: int, operator: Operator) -> tuple[Operator]:
+        """Metoda vrací operátory chodby, která z uzlu s dodaným
+        identifikátorem začíná dodaným operátorem. Pokud taková chodba
+        neexistuje, je vyhozena výjimka."""
+        for _, _, _, path in self._edges[node_id]:
+            if self._operators[path[0]] is operator:
+                return tuple(self._operators[index] for index in path)
+        raise Exception(f"Z uzlu {node_id} nevede chodba operátorem "
+                        f"{operator}")
@@ -1,10 +1,14 @@
 """Definice bludiště a všech potřebných prostředků pro jeho budování."""
 
-# Import knihovny pro potřeby čtení souborů
+# Import knihoven pro potřeby čtení souborů a výpočtu otisku obsahu
+import hashlib
 import os
 
-# Import společného předka (nadtypu) pro TypeHints kontejnerů
-from typing import Iterable
+# Import kompaktního pole pro záznam změněných políček
+from array import array
+
+# Import společného předka (nadtypu) pro TypeHints kontejnerů a funkcí
+from typing import Callable, Iterable
 
 
 # Znak reprezentující zeď, defaultně znak █
@@ -20,21 +24,94 @@ START = "S"
 GOAL = "G"
 
 
+# Kódy políček v kompaktní reprezentaci bludiště; každé políčko je v paměti
+# bludiště uloženo jako jediný bajt s jedním z následujících kódů
+
+# Kód pozice, pro kterou bludiště nemá žádné políčko
+NO_FIELD_CODE = 0
+
+# Kód políčka se zdí
+WALL_CODE = 1
+
+# Kód políčka s cestou
+PATH_CODE = 2
+
+# Kód startovního políčka
+START_CODE = 3
+
+# Kód cílového políčka
+GOAL_CODE = 4
+
+# Znaky políček s terénem - číslice 1 až 9 vyjadřují průchozí políčko, jehož
+# vstup stojí právě tolik (políčko cesty, startu i cíle stojí 1)
+TERRAIN_CHARACTERS = "123456789"
+
+# Kód políčka s terénem ceny 1; terén ceny c má kód TERRAIN_CODE + c - 1
+TERRAIN_CODE = 5
+
+# Úvodní bajty (tzv. magic number) souboru s bludištěm v binárním formátu
+BINARY_MAGIC = b"MZB1"
+
+# Převodní tabulka mezi znaky políček a jejich kódy
+CHARACTER_CODES = {
+    WALL_CHARACTER: WALL_CODE,
+    PATH_CHARACTER: PATH_CODE,
+    START: START_CODE,
+    GOAL: GOAL_CODE,
+    **{character: TERRAIN_CODE + index
+       for index, character in enumerate(TERRAIN_CHARACTERS)},
+}
+
+# Opačná převodní tabulka mezi kódy políček a jejich znaky
+CODE_CHARACTERS = {code: char for char, code in CHARACTER_CODES.items()}
+
+# Převodní tabulka (pro `bytes.translate`) mezi kódy políček a cenou vstupu
+# na políčko; neprůchozí políčka a neznámé kódy mají cenu 0
+CODE_COSTS = bytes(
+    1 if code in (PATH_CODE, START_CODE, GOAL_CODE)
+    else code - TERRAIN_CODE + 1
+    if TERRAIN_CODE <= code < TERRAIN_CODE + len(TERRAIN_CHARACTERS)
+    else 0
+    for code in range(256))
+
+
+def encode_character(character: str) -> int:
+    """Funkce převádí znak políčka na jeho kód v kompaktní reprezentaci
+    bludiště. Pokud znak nereprezentuje žádný známý typ políčka, je vyhozena
+    výjimka."""
+    if character not in CHARACTER_CODES:
+        raise Exception(f"Neznámý znak políčka: '{character}'")
+    return CHARACTER_CODES[character]
+
+
 class Field:
     """Instance této třídy slouží k vyjádření políčka (cesty nebo stěny)
-    na zadaných souřadnicích."""
+    na zadaných souřadnicích.
+
+    Políčko, které je součástí bludiště, je jen lehkým pohledem (view) do
+    kompaktní paměti bludiště - svůj znak si samo neudržuje, nýbrž ho čte
+    z bludiště (a do bludiště ho také zapisuje). Samostatné políčko (bez
+    bludiště) si svůj znak udržuje samo.
+    """
 
-    def __init__(self, x: int, y: int, character: str):
+    # Políčka nemají slovník atributů, aby byla co nejmenší
+    __slots__ = ("_x", "_y", "_character", "_maze")
+
+    def __init__(self, x: int, y: int, character: str = None,
+                 maze: "Maze" = None):
         """Initor, který přijímá souřadnice x a y reprezentující dané políčko.
         Dále přijímá znak, který políčko reprezentuje. Z něj odvozuje, zda-li
         je či není políčko stěnou.
+
+        Volitelně přijímá i bludiště, jehož je políčko pohledem; v takovém
+        případě se znak políčka čte přímo z bludiště.
         """
         self._x = x
         self._y = y
         self._character = character
 
         # Z praktických důvodů může mít políčko referenci na bludiště
-        self._maze: Maze = None
+        self._maze: Maze = maze
 
     @property
     def x(self) -> int:
@@ -49,17 +126,22 @@ class Field:
     @property
     def xy(self) -> tuple[int, int]:
         """Souřadnice os x a y tvořené jako ntice příslušných hodnot."""
-        return self.x, self.y
+        return self._x, self._y
 
     @property
     def character(self) -> str:
         """Znak, který reprezentuje dané políčko."""
-        return self._character
+        if self._maze is None:
+            return self._character
+        return CODE_CHARACTERS[self._maze.code(self._x, self._y)]
 
     @character.setter
     def character(self, new_character: str):
         """Setter na znak, který reprezentuje dané políčko."""
-        self._character = new_character
+        if self._maze is None:
+            self._character = new_character
+        else:
+            self._maze.set_character(self._x, self._y, new_character)
 
     @property
     def is_wall(self) -> bool:
@@ -76,6 +158,14 @@ class Field:
         """Zda-li je toto políčko počátečním či nikoliv."""
         return self.character == START
 
+    @property
+    def cost(self) -> int:
+        """Cena vstupu na toto políčko (1 pro cestu, start a cíl, hodnota
+        číslice pro terén, 0 pro zeď)."""
+        if self._maze is None:
+            return CODE_COSTS[CHARACTER_CODES.get(self._character, 0)]
+        return self._maze.cost(self._x, self._y)
+
     @property
     def maze(self) -> "Maze":
         """Bludiště, jehož je toto políčko součástí."""
@@ -87,7 +177,8 @@ class Field:
         self._maze = maze
 
     def clone(self) -> "Field":
-        """Funkce, která vytvoří kompletní kopii tohoto objektu."""
+        """Funkce, která vytvoří kompletní (samostatnou) kopii tohoto objektu.
+        """
         return Field(self.x, self.y, self.character)
 
     def __str__(self):
@@ -107,86 +198,302 @@ class Field:
         """
         return isinstance(other, Field) and other.xy == self.xy
 
+    def __hash__(self) -> int:
+        """Dunder metoda vracející hash políčka odvozený (v souladu
+        s porovnáváním) jen od jeho souřadnic."""
+        return hash((self._x, self._y))
+
 
 class Maze:
     """Instance této třídy jsou odpovědné za udržování informace o bludišti
     coby souboru políček. Nad rámec poskytování této funkce plní instance
     této třídy i roli vyhledávače mezi políčky.
+
+    Políčka jsou v bludišti uložena kompaktně jako pole bajtů (po řádcích),
+    kde každý bajt nese kód daného políčka (viz `WALL_CODE`, `PATH_CODE`,
+    `START_CODE`, `GOAL_CODE`, `TERRAIN_CODE` a `NO_FIELD_CODE`). Paměťová
+    náročnost je tedy 1 bajt na políčko (např. bludiště 10 000 x 10 000
+    políček zabere zhruba 100 MB). Instance třídy `Field` (cca 64 bajtů) jsou
+    vytvářeny až na vyžádání a slouží jen jako pohled na příslušnou pozici.
     """
 
     def __init__(self, fields: Iterable[Field]):
         """Initor, který přijímá libovolnou iterovatelnou sadu sestavenou
         z políček (instancí třídy Field).
 
-        Ta jsou dále převedena na seznam pro snazší manipulaci.
+        Znaky políček jsou převedeny do kompaktní paměti bludiště a dodaná
+        políčka se stávají pohledy do tohoto bludiště.
         """
 
-        # Dodaná políčka se převádí na seznam
-        self._fields = list(fields)
+        # Dodaná políčka se převádí na ntici
+        fields = tuple(fields)
+
+        # Předpočítání rozsahu souřadnic (jednou, ne při každém dotazu)
+        if fields:
+            min_x = min(field.x for field in fields)
+            min_y = min(field.y for field in fields)
+            width = max(field.x for field in fields) - min_x + 1
+            height = max(field.y for field in fields) - min_y + 1
+        else:
+            min_x = min_y = width = height = 0
+
+        # Kompaktní paměť políček; pozice bez políčka mají kód NO_FIELD_CODE
+        cells = bytearray(width * height)
+        for field in fields:
+            position = (field.y - min_y) * width + (field.x - min_x)
+            cells[position] = encode_character(field.character)
 
-        # Pro každé své políčko nastav sebe jako bludiště
-        for field in self.fields:
+        self._initialize(width, height, cells, (min_x, min_y))
+
+        # Pro každé dodané políčko nastav sebe jako bludiště
+        for field in fields:
             field.maze = self
 
+    def _initialize(self, width: int, height: int, cells: bytearray,
+                    origin: tuple[int, int], start_position: int = None,
+                    goal_position: int = None):
+        """Pomocná metoda, která nastaví vnitřní stav bludiště z kompaktní
+        paměti políček uspořádaných po řádcích a souřadnic jejího počátku.
+
+        Pamětí políček může být libovolný zapisovatelný buffer bajtů, typicky
+        `bytearray` nebo `memoryview` (např. nad souborem mapovaným do paměti).
+        Pozice startovního a cílového políčka lze dodat, pokud jsou předem
+        známé; jinak jsou v paměti políček vyhledány.
+        """
+        self._width = width
+        self._height = height
+        self._cells = cells
+        self._min_x, self._min_y = origin
+
+        # Pozice startovního a cílového políčka (je-li v bludišti)
+        self._start_position = start_position if start_position is not None \
+            else self._find(START_CODE)
+        self._goal_position = goal_position if goal_position is not None \
+            else self._find(GOAL_CODE)
+
+        # Líně vypočítávaný otisk obsahu bludiště (viz `content_hash`)
+        self._content_hash: str = None
+
+        # Funkce volané se souřadnicemi každého změněného políčka
+        self._listeners: list[Callable[[int, int], None]] = []
+
+        # Verze obsahu bludiště (počet změn políček) a pozice změněných
+        # políček v pořadí změn (viz `changes_since`)
+        self._version = 0
+        self._changes = array("q")
+
+    def _find(self, code: int) -> int:
+        """Pomocná metoda, která vrací pozici prvního políčka s dodaným kódem,
+        nebo -1, pokud takové políčko v bludišti není."""
+        # Pohled na paměť (memoryview) nemá metodu find, proto se prohledá
+        # jeho kopie; k tomu dochází jen při změně startu či cíle
+        if isinstance(self._cells, memoryview):
+            return self._cells.tobytes().find(code)
+        return self._cells.find(code)
+
+    @staticmethod
+    def from_cells(width: int, height: int, cells: bytearray,
+                   origin: tuple[int, int] = (0, 0),
+                   start_position: int = None,
+                   goal_position: int = None) -> "Maze":
+        """Statická tovární funkce, která vytvoří bludiště přímo z kompaktní
+        paměti políček (kódů uspořádaných po řádcích, od nejnižší souřadnice
+        y), bez vytváření jednotlivých instancí třídy Field.
+
+        Volitelně přijímá předem známé pozice startovního a cílového políčka
+        v paměti políček (-1, pokud v bludišti nejsou).
+        """
+        if len(cells) != width * height:
+            raise Exception(
+                f"Počet políček ({len(cells)}) neodpovídá rozměrům "
+                f"{width}x{height}")
+        maze = Maze.__new__(Maze)
+        maze._initialize(width, height, cells, origin, start_position,
+                         goal_position)
+        return maze
+
+    def position(self, x: int, y: int) -> int:
+        """Metoda převádí souřadnice na pozici v paměti políček (viz vlastnost
+        `cells`). Pro souřadnice mimo rozsah bludiště vrací -1."""
+        column = x - self._min_x
+        row = y - self._min_y
+        if 0 <= column < self._width and 0 <= row < self._height:
+            return row * self._width + column
+        return -1
+
+    def coordinates(self, position: int) -> tuple[int, int]:
+        """Metoda převádí pozici v paměti políček zpět na souřadnice."""
+        row, column = divmod(position, self._width)
+        return column + self._min_x, row + self._min_y
+
+    @property
+    def cells(self) -> bytearray:
+        """Kompaktní paměť políček - kódy políček uspořádané po řádcích."""
+        return self._cells
+
+    @property
+    def content_hash(self) -> str:
+        """Otisk obsahu bludiště (rozměrů, počátku a všech políček). Dvě
+        bludiště se shodným obsahem mají shodný otisk.
+
+        Otisk je vypočítán až při prvním přístupu a uchováván až do změny
+        některého z políček.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{self._width}x{self._height}@{self.origin}"
+                          .encode("utf-8"))
+            digest.update(self._cells)
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        """Nejmenší souřadnice x a y v bludišti (souřadnice první pozice)."""
+        return self._min_x, self._min_y
+
     @property
     def fields(self) -> tuple[Field]:
-        """Políčka daného bludiště převedená na ntici."""
-        return tuple(self._fields)
+        """Políčka daného bludiště převedená na ntici.
+
+        Políčka jsou vytvářena až při zavolání, proto je vhodné této
+        vlastnosti u velkých bludišť spíše se vyhýbat.
+        """
+        return tuple(
+            Field(*self.coordinates(position), maze=self)
+            for position, code in enumerate(self._cells)
+            if code != NO_FIELD_CODE)
 
     @property
     def start_field(self) -> Field:
         """Startovní políčko, ze kterého se má začít."""
-        for field in self.fields:
-            if field.is_start:
-                return field
+        # Znak políčka lze změnit, proto je třeba případně vyhledat znovu
+        if self._start_position < 0 \
+                or self._cells[self._start_position] != START_CODE:
+            self._start_position = self._find(START_CODE)
+
         # Pokud nebylo nalezeno startovní políčko
-        raise Exception("Startovní políčko nebylo nalezeno")
+        if self._start_position < 0:
+            raise Exception("Startovní políčko nebylo nalezeno")
+        return Field(*self.coordinates(self._start_position), maze=self)
 
     @property
     def goal_field(self) -> Field:
         """Cílové políčko, na kterém je cílem skončit."""
-        for field in self.fields:
-            if field.is_goal:
-                return field
+        # Znak políčka lze změnit, proto je třeba případně vyhledat znovu
+        if self._goal_position < 0 \
+                or self._cells[self._goal_position] != GOAL_CODE:
+            self._goal_position = self._find(GOAL_CODE)
+
         # Pokud nebylo nalezeno cílové políčko
-        raise Exception("Cílové políčko nebylo nalezeno")
+        if self._goal_position < 0:
+            raise Exception("Cílové políčko nebylo nalezeno")
+        return Field(*self.coordinates(self._goal_position), maze=self)
 
     @property
     def width(self) -> int:
         """Šířka bludiště coby rozdíl mezi nejmenší a největší souřadnicí x.
         """
-        # Předpočítání políček s nejmenší a největší souřadnicí x
-        min_x = min(self.fields, key=lambda f: f.x)
-        max_x = max(self.fields, key=lambda f: f.x)
-
-        return max_x.x - min_x.x + 1
+        return self._width
 
     @property
     def height(self) -> int:
-        """Šířka bludiště coby rozdíl mezi nejmenší a největší souřadnicí x.
+        """Výška bludiště coby rozdíl mezi nejmenší a největší souřadnicí y.
         """
-        # Předpočítání políček s nejmenší a největší souřadnicí y
-        min_y = min(self.fields, key=lambda f: f.y)
-        max_y = max(self.fields, key=lambda f: f.y)
+        return self._height
+
+    def code(self, x: int, y: int) -> int:
+        """Metoda vrací kód políčka na daných souřadnicích. Pokud bludiště
+        takové políčko nemá, vrací `NO_FIELD_CODE`."""
+        position = self.position(x, y)
+        return self._cells[position] if position >= 0 else NO_FIELD_CODE
+
+    def is_passable(self, x: int, y: int) -> bool:
+        """Metoda vrací, zda-li na daných souřadnicích existuje políčko, na
+        které lze vstoupit (tedy které není zdí)."""
+        code = self.code(x, y)
+        return code != NO_FIELD_CODE and code != WALL_CODE
 
-        return max_y.y - min_y.y + 1
+    def cost(self, x: int, y: int) -> int:
+        """Metoda vrací cenu vstupu na políčko na daných souřadnicích (viz
+        `CODE_COSTS`); pro neprůchozí či neexistující políčko vrací 0."""
+        return CODE_COSTS[self.code(x, y)]
+
+    @property
+    def max_cost(self) -> int:
+        """Nejvyšší cena vstupu na některé z políček bludiště (0 pro bludiště
+        bez průchozích políček). Je-li rovna 1, jde o bludiště bez terénu,
+        ve kterém je cena cesty rovna její délce.
+
+        Hodnota je zjišťována hromadně převodem celé paměti políček na ceny.
+        """
+        cells = self._cells
+        if isinstance(cells, memoryview):
+            cells = cells.tobytes()
+        return max(cells.translate(CODE_COSTS), default=0)
+
+    def set_character(self, x: int, y: int, character: str):
+        """Metoda nastaví políčku na daných souřadnicích nový znak."""
+        position = self.position(x, y)
+        if position < 0 or self._cells[position] == NO_FIELD_CODE:
+            raise Exception(f"Bludiště nemá políčko na souřadnicích {x}, {y}")
+        self._cells[position] = encode_character(character)
+        self._content_hash = None
+        self._version += 1
+        self._changes.append(position)
+        for listener in tuple(self._listeners):
+            listener(x, y)
+
+    @property
+    def version(self) -> int:
+        """Verze obsahu bludiště, tedy počet dosavadních změn políček (viz
+        `set_character`). Každá změna verzi zvýší o jedna."""
+        return self._version
+
+    def changes_since(self, version: int) -> list[tuple[int, int]]:
+        """Metoda vrací souřadnice políček změněných od dodané verze (viz
+        vlastnost `version`) v pořadí změn. Políčko změněné vícekrát je
+        uvedeno vícekrát.
+
+        Záznam změn je uchováván po celou dobu života bludiště (8 bajtů na
+        změnu), takže změny mohou dohledávat libovolní odběratelé, aniž by se
+        u bludiště registrovali (viz `add_listener`).
+        """
+        if not 0 <= version <= self._version:
+            raise Exception(f"Neplatná verze bludiště: {version}")
+        return [self.coordinates(position)
+                for position in self._changes[version:]]
+
+    def add_listener(self, listener: Callable[[int, int], None]):
+        """Metoda zaregistruje funkci, která bude volána se souřadnicemi
+        každého políčka, jehož znak se změní (viz `set_character`, resp.
+        `Field.character`)."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int, int], None]):
+        """Metoda zruší registraci dříve zaregistrované funkce."""
+        self._listeners.remove(listener)
 
     def has_field(self, x: int, y: int) -> bool:
         """Metoda vrací, zda-li má bludiště políčko o daných souřadnicích.
         """
-        # Pokud políčko na daných souřadnicích je nalezeno (není None)
-        return self.field(x, y) is not None
+        return self.code(x, y) != NO_FIELD_CODE
 
     def field(self, x: int, y: int) -> Field:
         """Metoda se pokusí vyhledat políčko, které by odpovídalo dodaným
-        souřadnicím."""
-        for field in self.fields:
-            if field.x == x and field.y == y:
-                return field
+        souřadnicím. Pokud takové v bludišti není, vrací None.
+
+        Vrácené políčko je nově vytvořeným pohledem do paměti bludiště.
+        """
+        if self.code(x, y) == NO_FIELD_CODE:
+            return None
+        return Field(x, y, maze=self)
 
     def clone(self) -> "Maze":
         """Metoda, která vrací hlubokou kopii tohoto bludiště."""
-        return Maze([field.clone() for field in self.fields])
+        return Maze.from_cells(self._width, self._height,
+                               bytearray(self._cells),
+                               (self._min_x, self._min_y))
 
 
 def filter_empty_lines(lines: Iterable[str]) -> tuple[str]:
@@ -200,34 +507,116 @@ def filter_empty_lines(lines: Iterable[str]) -> tuple[str]:
     return tuple(filter(lambda line: len(line), stripped_lines))
 
 
-def load_maze(filename: str) -> Maze:
-    """Funkce, která se pokusí najít soubor ve standardním adresáři a vytvořit
-    z něj bludiště.
+def maze_path(filename: str) -> str:
+    """Funkce vrací cestu k souboru s definicí bludiště. Pokud soubor daného
+    názvu existuje ve standardním adresáři `mazes`, je vrácena cesta k němu.
+    V opačném případě je dodaný název chápán jako libovolná cesta k souboru.
     """
-
     # Cesta ke kořeni projektu
     project_dir = os.path.dirname(os.path.dirname(__file__))
 
-    # Cesta k souboru, ve kterém je definice bludiště
-    maze_path = os.path.join(project_dir, "mazes", filename)
+    # Cesta k souboru ve standardním adresáři pro definice bludišť
+    standard_path = os.path.join(project_dir, "mazes", filename)
+    return standard_path if os.path.isfile(standard_path) else filename
 
-    # Seznam políček, ze kterých se má bludiště sestávat
-    fields: list[Field] = []
 
-    # Čti soubor v kódování UTF-8
-    with open(maze_path, "r", encoding="utf-8") as reader:
+def parse_maze(data: bytes) -> Maze:
+    """Funkce vytvoří bludiště z textové definice v kódování UTF-8.
 
-        # Filtrace řádků, aby zbyly pouze neprázdné
-        lines = reversed(filter_empty_lines(reader.readlines()))
+    Převod znaků na kódy políček probíhá hromadně nad celým obsahem najednou
+    (nahrazením víceznakových sekvencí a metodou `bytes.translate`), nikoliv
+    po jednotlivých znacích. Prázdné řádky jsou ignorovány, všechny zbylé
+    řádky musí být stejně dlouhé.
+    """
+    # Znaky, které v UTF-8 zabírají více bajtů (např. zeď █), se nahradí
+    # přímo svým kódem, zbylé jednobajtové znaky se převedou tabulkou
+    single_bytes, codes = bytearray(), bytearray()
+    for character, code in CHARACTER_CODES.items():
+        encoded = character.encode("utf-8")
+        if len(encoded) > 1:
+            data = data.replace(encoded, bytes([code]))
+            single_bytes.append(code)
+        else:
+            single_bytes += encoded
+        codes.append(code)
+
+    # Neprázdné řádky bez znaků konce řádku; mezery na okrajích řádků se
+    # neořezávají, neboť reprezentují políčka cesty
+    rows = [row for row in (line.rstrip(b"\r") for line in data.split(b"\n"))
+            if row.strip()]
+
+    # Ověření, že je bludiště obdélníkové
+    width = len(rows[0]) if rows else 0
+    for row_number, row in enumerate(rows):
+        if len(row) != width:
+            raise Exception(
+                f"Řádek {row_number + 1} má délku {len(row)} namísto {width}")
+
+    # Spojení řádků (první řádek souboru má nejvyšší souřadnici y)
+    cells = bytearray(b"".join(reversed(rows)))
+
+    # Ověření, že bludiště neobsahuje žádné neznámé znaky
+    if cells.translate(None, single_bytes):
+        raise Exception("Bludiště obsahuje neznámé znaky")
+
+    # Hromadný převod znaků na kódy políček
+    cells = cells.translate(bytes.maketrans(bytes(single_bytes), codes))
+    return Maze.from_cells(width, len(rows), cells)
 
-        # Pro každý řádek souboru reprezentující řádek mapy
-        for row_number, row in enumerate(lines):
 
-            # Pro každý znak na řádku reprezentující políčko
-            for column_number, character in enumerate(tuple(row)):
+def load_maze(filename: str) -> Maze:
+    """Funkce, která se pokusí najít soubor ve standardním adresáři a vytvořit
+    z něj bludiště. Pokud v něm soubor daného názvu není, je název chápán
+    jako libovolná cesta k souboru (viz funkce `maze_path(str)`).
+
+    Soubor je načten jediným čtením a převeden hromadně (viz funkce
+    `parse_maze(bytes)`). Soubory v binárním formátu (viz modul
+    `binary_maze`) jsou namísto toho mapovány do paměti.
+    """
+    path = maze_path(filename)
+    with open(path, "rb") as reader:
 
-                # Přidej políčko do seznamu políček
-                fields.append(Field(column_number, row_number, character))
+        # Soubory v binárním formátu jsou mapovány do paměti
+        if reader.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            # Import až zde kvůli zamezení cyklickým importům
+            from .binary_maze import open_binary_maze
+            return open_binary_maze(path)
 
-    # Ze seznamu políček vytvoř instanci bludiště a vrať ji
-    return Maze(fields)
+        reader.seek(0)
+        return parse_maze(reader.read())
+
+
+def save_maze(maze: Maze, path: str):
+    """Funkce uloží bludiště do textového souboru v kódování UTF-8 (ve
+    formátu, který lze načíst funkcí `load_maze(str)`).
+
+    Převod kódů políček na znaky probíhá hromadně po celých řádcích (metodou
+    `bytes.translate` a nahrazením kódů víceznakových sekvencí). Bludiště
+    s pozicemi bez políček nelze v textovém formátu uložit, v takovém
+    případě je vyhozena výjimka.
+    """
+    # Jednobajtové znaky se převedou tabulkou, kódy znaků, které v UTF-8
+    # zabírají více bajtů (např. zeď █), se následně nahradí celou sekvencí
+    table = bytearray(range(256))
+    replacements = []
+    for character, code in CHARACTER_CODES.items():
+        encoded = character.encode("utf-8")
+        if len(encoded) > 1:
+            replacements.append((bytes([code]), encoded))
+        else:
+            table[code] = encoded[0]
+
+    cells = maze.cells
+    width = maze.width
+    with open(path, "wb") as writer:
+
+        # První řádek souboru má nejvyšší souřadnici y
+        for row in reversed(range(maze.height)):
+            line = bytes(cells[row * width:(row + 1) * width])
+            if NO_FIELD_CODE in line:
+                raise Exception("Bludiště s pozicemi bez políček nelze "
+                                "uložit v textovém formátu")
+            line = line.translate(table)
+            for code, encoded in replacements:
+                line = line.replace(code, encoded)
+            writer.write(line + b"\n")
@@ -0,0 +1,127 @@
+"""Modul obsahuje definici předkompilovaného grafu sousednosti bludiště.
+
+Místo toho, aby se při každém rozevření stavu znovu ověřovalo, které operátory
+lze aplikovat (existence políčka, zdi), lze bludiště spolu se sadou operátorů
+jednorázově převést na neměnný graf ve formátu CSR (Compressed Sparse Row).
+Rozevření uzlu je pak jen vyříznutím příslušného úseku z polí.
+"""
+
+# Import kompaktních polí pro uložení grafu
+from array import array
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable
+
+# Import bludiště a operátorů, ze kterých se graf sestavuje
+from .maze import Maze
+from .state_space import Operator
+
+
+class NeighbourGraph:
+    """Instance této třídy reprezentují neměnný graf sousednosti průchozích
+    políček bludiště pro danou sadu operátorů.
+
+    Každé průchozí políčko (tedy políčko, které není zdí) dostane celočíselný
+    identifikátor. Hrany vedoucí z políčka s identifikátorem `i` jsou uloženy
+    v polích `targets` (identifikátor cílového políčka) a `edge_operators`
+    (index operátoru, který hranu tvoří) na pozicích od `offsets[i]` do
+    `offsets[i + 1]`. Pole `edge_costs` nese na týchž pozicích cenu hrany,
+    tedy cenu vstupu na cílové políčko (viz `Maze.cost(int, int)`).
+
+    Graf je snímkem bludiště v okamžiku svého sestavení; pokud se bludiště
+    později změní, je třeba graf sestavit znovu.
+    """
+
+    def __init__(self, maze: Maze, operators: Iterable[Operator]):
+        """Initor, který přijímá bludiště a sadu operátorů, ze kterých má být
+        graf sestaven.
+        """
+        self._maze = maze
+        self._operators = tuple(operators)
+
+        # Mapování pozice v paměti bludiště na identifikátor políčka (nebo -1)
+        # a opačné mapování identifikátoru políčka na pozici
+        self._cell_ids = array("l", [-1]) * len(maze.cells)
+        self._positions = array("l")
+
+        # Přidělení identifikátorů všem průchozím políčkům
+        for position in range(len(maze.cells)):
+            if maze.is_passable(*maze.coordinates(position)):
+                self._cell_ids[position] = len(self._positions)
+                self._positions.append(position)
+
+        # Pole grafu ve formátu CSR
+        self._offsets = array("l", [0])
+        self._targets = array("l")
+        self._edge_operators = array("b")
+        self._edge_costs = array("b")
+
+        # Pro každé průchozí políčko ulož hrany ke všem průchozím sousedům
+        for position in self._positions:
+            x, y = maze.coordinates(position)
+            for index, operator in enumerate(self._operators):
+                neighbour = operator.direction.neighbour_coordinates(x, y)
+                if maze.is_passable(*neighbour):
+                    target = self._cell_ids[maze.position(*neighbour)]
+                    self._targets.append(target)
+                    self._edge_operators.append(index)
+                    self._edge_costs.append(maze.cost(*neighbour))
+            self._offsets.append(len(self._targets))
+
+    @property
+    def maze(self) -> Maze:
+        """Bludiště, ze kterého byl graf sestaven."""
+        return self._maze
+
+    @property
+    def operators(self) -> tuple[Operator]:
+        """Operátory, na které odkazují indexy v poli `edge_operators`."""
+        return self._operators
+
+    @property
+    def cell_count(self) -> int:
+        """Počet uzlů grafu, tedy počet průchozích políček bludiště."""
+        return len(self._positions)
+
+    @property
+    def offsets(self) -> memoryview:
+        """Pole počátků úseků hran jednotlivých uzlů (jen pro čtení)."""
+        return memoryview(self._offsets).toreadonly()
+
+    @property
+    def targets(self) -> memoryview:
+        """Pole identifikátorů cílových uzlů hran (jen pro čtení)."""
+        return memoryview(self._targets).toreadonly()
+
+    @property
+    def edge_operators(self) -> memoryview:
+        """Pole indexů operátorů, které hrany tvoří (jen pro čtení)."""
+        return memoryview(self._edge_operators).toreadonly()
+
+    @property
+    def edge_costs(self) -> memoryview:
+        """Pole cen hran, tedy cen vstupu na cílová políčka (jen pro čtení).
+        """
+        return memoryview(self._edge_costs).toreadonly()
+
+    def cell_id(self, x: int, y: int) -> int:
+        """Metoda vrací identifikátor políčka na daných souřadnicích. Pokud
+        takové políčko neexistuje nebo není průchozí, vrací -1."""
+        position = self._maze.position(x, y)
+        return self._cell_ids[position] if position >= 0 else -1
+
+    def coordinates(self, cell_id: int) -> tuple[int, int]:
+        """Metoda vrací souřadnice políčka s daným identifikátorem."""
+        return self._maze.coordinates(self._positions[cell_id])
+
+    def neighbours(self, cell_id: int) -> array:
+        """Metoda vrací identifikátory všech sousedů daného políčka."""
+        return self._targets[self._offsets[cell_id]:self._offsets[cell_id + 1]]
+
+    def edges(self, cell_id: int) -> zip:
+        """Metoda vrací dvojice (identifikátor souseda, operátor) pro všechny
+        hrany vedoucí z daného políčka."""
+        start, end = self._offsets[cell_id], self._offsets[cell_id + 1]
+        operators = self._operators
+        return zip(self._targets[start:end],
+                   [operators[i] for i in self._edge_operators[start:end]])
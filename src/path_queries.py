@@ -0,0 +1,237 @@
+"""Modul obsahuje dotazovací vrstvu nad stavovým prostorem pro opakované
+hledání cest ve stejných bludištích.
+
+Místo toho, aby každý dotaz (start -> cíl) prohledával stavový prostor znovu
+od začátku, je pro každou dvojici (obsah bludiště, cíl) jednorázově spočítán
+zpětný strom prohledávání od cíle - mapa vzdáleností a operátorů vedoucích
+k cíli. Ta je uchovávána v LRU cache s omezenou pamětí a libovolný další dotaz
+do téhož cíle je zodpovězen pouhým průchodem touto mapou.
+"""
+
+# Import kompaktních polí a datových struktur pro frontu a LRU cache
+from array import array
+from collections import OrderedDict, deque
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable
+
+# Import prostředků bludiště a stavového prostoru
+from .maze import Maze, CODE_COSTS
+from .state_space import StateSpace, State, Operator
+
+
+# Výchozí paměťový limit cache (64 MB)
+DEFAULT_MEMORY_LIMIT = 64 * 2 ** 20
+
+
+class GoalDistanceMap:
+    """Instance této třídy reprezentují zpětný strom prohledávání vedený
+    z cílového políčka přes celé bludiště Dijkstrovým algoritmem.
+
+    Pro každou pozici bludiště je uložena cena nejlevnější cesty do cíle
+    (součet cen vstupu na políčka cesty, viz `Maze.cost(int, int)`; bez
+    terénu jde o délku nejkratší cesty, -1 pro nedosažitelná políčka)
+    a index operátoru, jehož aplikací se z daného políčka k cíli přiblížíme.
+    Paměťová náročnost je 5 bajtů na políčko bludiště.
+
+    Ceny kroků jsou malá celá čísla, prioritní frontou je proto kruhové pole
+    kyblíků (Dialova fronta, viz též `BucketFringe`); bez terénu se výpočet
+    shoduje s prohledáváním do šířky.
+    """
+
+    def __init__(self, maze: Maze, goal: tuple[int, int],
+                 operators: Iterable[Operator]):
+        """Initor, který přijímá bludiště, souřadnice cílového políčka a sadu
+        operátorů. Mapa je spočítána ihned při vytvoření instance.
+
+        Pokud cílové políčko v bludišti neexistuje nebo je zdí, je vyhozena
+        výjimka.
+        """
+        if not maze.is_passable(*goal):
+            raise Exception(f"Cíl {goal} není průchozím políčkem bludiště")
+
+        self._maze = maze
+        self._goal = goal
+        self._operators = tuple(operators)
+
+        size = maze.width * maze.height
+        self._distances = array("i", [-1]) * size
+        self._next_operators = array("b", [-1]) * size
+
+        # Kyblíky pozic dle ceny cesty; ceny pozic čekajících ve frontě leží
+        # vždy v rozmezí od právě zpracovávané ceny po tuto cenu zvětšenou
+        # o nejvyšší cenu kroku, kyblíky jsou proto používány cyklicky
+        buckets = [deque() for _ in range(max(maze.max_cost, 1) + 1)]
+        goal_position = maze.position(*goal)
+        self._distances[goal_position] = 0
+        buckets[0].append(goal_position)
+        pending = 1
+        current_cost = 0
+
+        # Zpětné prohledávání z cíle; do políčka `current` vede operátor
+        # z políčka `predecessor`, které je od něj opačným směrem, a krok
+        # stojí cenu vstupu na políčko `current`
+        cells = maze.cells
+        while pending:
+            bucket = buckets[current_cost % len(buckets)]
+            if not bucket:
+                current_cost += 1
+                continue
+            current = bucket.popleft()
+            pending -= 1
+
+            # Pozice, pro kterou byla mezitím nalezena levnější cesta
+            if self._distances[current] != current_cost:
+                continue
+
+            x, y = maze.coordinates(current)
+            distance = current_cost + CODE_COSTS[cells[current]]
+            for index, operator in enumerate(self._operators):
+                predecessor_xy = (x - operator.direction.x_diff,
+                                  y - operator.direction.y_diff)
+                if not maze.is_passable(*predecessor_xy):
+                    continue
+                predecessor = maze.position(*predecessor_xy)
+                known = self._distances[predecessor]
+                if known < 0 or distance < known:
+                    self._distances[predecessor] = distance
+                    self._next_operators[predecessor] = index
+                    buckets[distance % len(buckets)].append(predecessor)
+                    pending += 1
+
+    @property
+    def goal(self) -> tuple[int, int]:
+        """Souřadnice cílového políčka."""
+        return self._goal
+
+    @property
+    def nbytes(self) -> int:
+        """Paměť (v bajtech), kterou zabírají pole mapy."""
+        return self._distances.itemsize * len(self._distances) \
+            + self._next_operators.itemsize * len(self._next_operators)
+
+    def distance(self, x: int, y: int) -> int:
+        """Metoda vrací cenu nejlevnější cesty z daného políčka do cíle (bez
+        terénu její délku), nebo -1, pokud je cíl z daného políčka
+        nedosažitelný."""
+        position = self._maze.position(x, y)
+        return self._distances[position] if position >= 0 else -1
+
+    def path_from(self, x: int, y: int) -> tuple[Operator]:
+        """Metoda vrací nejlevnější cestu (sekvenci operátorů) z daného
+        políčka do cíle jako průchod mapou. Pokud je cíl nedosažitelný, vrací
+        None."""
+        if self.distance(x, y) < 0:
+            return None
+
+        path = []
+        while (x, y) != self._goal:
+            operator = self._operators[
+                self._next_operators[self._maze.position(x, y)]]
+            path.append(operator)
+            x, y = operator.direction.neighbour_coordinates(x, y)
+        return tuple(path)
+
+
+class PathQueryCache:
+    """Instance této třídy odpovídají na dotazy na nejlevnější cestu mezi
+    startem a cílem nad stavovými prostory a uchovávají si k tomu mapy
+    vzdáleností (viz `GoalDistanceMap`) v LRU cache.
+
+    Klíčem cache je otisk obsahu bludiště, souřadnice cíle a směry operátorů;
+    dotazy nad různými instancemi bludiště se shodným obsahem tedy sdílí
+    tutéž mapu. Pokud celková paměť map překročí limit, jsou odstraňovány
+    nejdéle nepoužité mapy.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        """Initor, který přijímá paměťový limit cache v bajtech."""
+        self._memory_limit = memory_limit
+        self._maps: OrderedDict[tuple, GoalDistanceMap] = OrderedDict()
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def memory_limit(self) -> int:
+        """Paměťový limit cache v bajtech."""
+        return self._memory_limit
+
+    @property
+    def memory(self) -> int:
+        """Paměť v bajtech, kterou aktuálně zabírají uložené mapy."""
+        return self._memory
+
+    @property
+    def hits(self) -> int:
+        """Počet dotazů, pro které již byla mapa v cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Počet dotazů, pro které musela být mapa spočítána."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Počet map, které byly z cache odstraněny kvůli paměťovému limitu."""
+        return self._evictions
+
+    def __len__(self) -> int:
+        """Počet map uložených v cache."""
+        return len(self._maps)
+
+    def distance_map(self, maze: Maze, goal: tuple[int, int],
+                     operators: Iterable[Operator]) -> GoalDistanceMap:
+        """Metoda vrací mapu vzdáleností pro dané bludiště, cíl a operátory.
+        Pokud v cache není, je spočítána a do cache uložena."""
+        operators = tuple(operators)
+        key = (maze.content_hash, goal,
+               tuple((o.direction.x_diff, o.direction.y_diff)
+                     for o in operators))
+
+        # Nalezená mapa se přesune na konec (jako naposledy použitá)
+        if key in self._maps:
+            self._hits += 1
+            self._maps.move_to_end(key)
+            return self._maps[key]
+
+        self._misses += 1
+        distance_map = GoalDistanceMap(maze, goal, operators)
+        self._maps[key] = distance_map
+        self._memory += distance_map.nbytes
+
+        # Odstraňování nejdéle nepoužitých map (kromě právě vložené)
+        while self._memory > self._memory_limit and len(self._maps) > 1:
+            _, evicted = self._maps.popitem(last=False)
+            self._memory -= evicted.nbytes
+            self._evictions += 1
+
+        return distance_map
+
+    def path(self, state_space: StateSpace) -> tuple[Operator]:
+        """Metoda vrací nejlevnější cestu (sekvenci operátorů) z počátečního do
+        cílového stavu dodaného stavového prostoru, nebo None, pokud cesta
+        neexistuje."""
+        distance_map = self.distance_map(
+            state_space.initial_state.maze,
+            state_space.final_state.field_coords,
+            state_space.available_operators)
+        return distance_map.path_from(*state_space.initial_state.field_coords)
+
+    def solve(self, state_space: StateSpace) -> State:
+        """Metoda vrací cílový stav nejlevnější cesty z počátečního stavu
+        dodaného stavového prostoru, nebo None, pokud cesta neexistuje.
+
+        Stav je vytvořen postupnou aplikací operátorů nalezené cesty, lze z něj
+        tedy získat cestu obvyklým způsobem (např. `State.whole_path`).
+        """
+        path = self.path(state_space)
+        if path is None:
+            return None
+
+        state = state_space.initial_state
+        for operator in path:
+            state = operator.apply(state)
+        return state
@@ -1,30 +1,247 @@
-"""Modul obsahující definici pomocné funkce pro vytištění bludiště do konzole.
+"""Modul obsahující definici prostředků pro vykreslení bludiště do konzole
+či libovolného textového proudu.
+
+Řádky jsou sestavovány přímo z kompaktní paměti bludiště (viz `Maze.cells`),
+a to hromadně - celý řádek kódů políček je najednou převeden na znaky
+(metodou `bytes.translate`) a zvýrazněná políčka jsou do něj doplněna podle
+předem seskupených pozic. Vykreslený text je zapisován po blocích řádků, takže
+ani velmi velká bludiště nemusí být v paměti sestavena jako jeden řetězec.
+
+Pro krokovou vizualizaci prohledávání slouží třída `AnsiRenderer`, která po
+úvodním vykreslení překresluje (pomocí ANSI sekvencí pro posun kurzoru) jen
+změněná políčka.
 """
-from src.maze import Maze
 
+# Import standardního výstupu
+import sys
+
+# Import společných protokolů pro TypeHints
+from typing import Iterable, Iterator, TextIO
+
+from src.maze import Maze, CODE_CHARACTERS, NO_FIELD_CODE
+
+
+# Převodní tabulka kódů políček na znaky vykreslovaných políček; pozice bez
+# políčka se vykreslují jako mezera
+CELL_CHARACTERS = {**CODE_CHARACTERS, NO_FIELD_CODE: " "}
+
+# Tabulka pro hromadný převod kódů metodou `bytes.translate`; kódy ASCII
+# znaků jsou převedeny přímo, ostatní (např. zeď █) zůstávají svým kódem
+# a jsou po dekódování nahrazeny (viz `_WIDE_CHARACTERS`)
+_TRANSLATION = bytes(
+    ord(CELL_CHARACTERS[code])
+    if code in CELL_CHARACTERS and CELL_CHARACTERS[code].isascii() else code
+    for code in range(256))
+
+# Dvojice (kód jako znak, znak políčka) pro znaky mimo ASCII
+_WIDE_CHARACTERS = tuple((chr(code), character)
+                         for code, character in CELL_CHARACTERS.items()
+                         if not character.isascii())
+
+# Počet řádků zapsaných do proudu najednou
+CHUNK_ROWS = 256
+
+# Výchozí okraj (v políčkách) okolo zvýrazněných políček při ořezu
+DEFAULT_MARGIN = 2
+
+
+def _highlighted_rows(maze: Maze, coords: Iterable[tuple[int, int]]) \
+        -> dict[int, list[int]]:
+    """Pomocná funkce seskupí zvýrazněná políčka dle řádků paměti bludiště.
+    Vrací slovník řádek -> sloupce; políčka mimo bludiště jsou vynechána."""
+    width = maze.width
+    rows: dict[int, list[int]] = {}
+    for x, y in coords:
+        position = maze.position(x, y)
+        if position >= 0:
+            row, column = divmod(position, width)
+            rows.setdefault(row, []).append(column)
+    return rows
+
+
+def path_bounds(maze: Maze, coords: Iterable[tuple[int, int]],
+                margin: int = DEFAULT_MARGIN) -> tuple[int, int, int, int]:
+    """Funkce vrací výřez bludiště (nejmenší x, nejmenší y, největší x,
+    největší y) obsahující všechna dodaná políčka a okraj dodané šířky okolo
+    nich, oříznutý na rozměry bludiště. Bez dodaných políček je vrácen
+    rozsah celého bludiště."""
+    min_x, min_y = maze.origin
+    max_x, max_y = min_x + maze.width - 1, min_y + maze.height - 1
+
+    coords = tuple(coords)
+    if not coords:
+        return min_x, min_y, max_x, max_y
+    xs = [x for x, _ in coords]
+    ys = [y for _, y in coords]
+    return (max(min_x, min(xs) - margin), max(min_y, min(ys) - margin),
+            min(max_x, max(xs) + margin), min(max_y, max(ys) + margin))
+
+
+def render_rows(maze: Maze, coords: Iterable[tuple[int, int]] = (),
+                char: str = "*",
+                bounds: tuple[int, int, int, int] = None) -> Iterator[str]:
+    """Generátor vrací vykreslené řádky bludiště (bez znaku konce řádku), a to
+    od nejvyšší souřadnice y po nejnižší.
+
+    Přijímá k tomu bludiště, zvýrazněná políčka (dvojice souřadnic `x` a `y`),
+    znak, kterým mají být zvýrazněna, a volitelně výřez bludiště (viz
+    `path_bounds`), na který má být vykreslení omezeno.
+    """
+    if bounds is None:
+        bounds = path_bounds(maze, ())
+    min_x, min_y = maze.origin
+    first_column, first_row = bounds[0] - min_x, bounds[1] - min_y
+    last_column, last_row = bounds[2] - min_x, bounds[3] - min_y
+
+    highlighted = _highlighted_rows(maze, coords)
+    cells = maze.cells
+    width = maze.width
+
+    for row in range(last_row, first_row - 1, -1):
+        start = row * width
+        line = bytes(cells[start + first_column:start + last_column + 1]) \
+            .translate(_TRANSLATION).decode("latin-1")
+        for code, character in _WIDE_CHARACTERS:
+            line = line.replace(code, character)
+
+        # Doplnění zvýrazněných políček jen do řádků, které nějaká mají;
+        # řádek je složen z úseků mezi zvýrazněnými políčky
+        columns = highlighted.get(row)
+        if columns:
+            parts, previous = [], 0
+            for column in sorted(set(columns)):
+                if first_column <= column <= last_column:
+                    offset = column - first_column
+                    parts.append(line[previous:offset])
+                    parts.append(char)
+                    previous = offset + 1
+            parts.append(line[previous:])
+            line = "".join(parts)
+        yield line
+
+
+def render_maze(maze: Maze, coords: Iterable[tuple[int, int]] = (),
+                char: str = "*",
+                bounds: tuple[int, int, int, int] = None) -> str:
+    """Funkce vrací vykreslené bludiště jako jeden řetězec (každý řádek je
+    zakončen znakem konce řádku). Parametry viz `render_rows`."""
+    return "".join(line + "\n"
+                   for line in render_rows(maze, coords, char, bounds))
 
-def print_maze(maze: Maze, coords: list[tuple[int, int]], char: str = "*"):
-    """Funkce, která přijímá umožňuje vytisknout bludiště.
+
+def write_maze(maze: Maze, coords: Iterable[tuple[int, int]] = (),
+               char: str = "*", stream: TextIO = None,
+               bounds: tuple[int, int, int, int] = None):
+    """Funkce zapíše vykreslené bludiště do dodaného textového proudu
+    (defaultně standardní výstup), a to po blocích `CHUNK_ROWS` řádků.
+    Parametry viz `render_rows`."""
+    stream = stream if stream is not None else sys.stdout
+    chunk = []
+    for line in render_rows(maze, coords, char, bounds):
+        chunk.append(line)
+        if len(chunk) == CHUNK_ROWS:
+            stream.write("\n".join(chunk) + "\n")
+            chunk.clear()
+    if chunk:
+        stream.write("\n".join(chunk) + "\n")
+
+
+def print_maze(maze: Maze, coords: Iterable[tuple[int, int]],
+               char: str = "*", crop: bool = False):
+    """Funkce, která umožňuje vytisknout bludiště.
 
     Přijímá k tomu referenci na bludiště jako takové, seznam zvýrazněných
-    políček (reprezentovaných jako dvojice souřadnic `x` a `y`), a volitelný
-    znak, který má dané políčko zvýraznit.
+    políček (reprezentovaných jako dvojice souřadnic `x` a `y`), volitelný
+    znak, který má dané políčko zvýraznit, a zda-li má být vytištěn jen
+    výřez okolo zvýrazněných políček (viz `path_bounds`).
     """
-    # Připravení výstupního řetězce
-    result = ""
+    coords = tuple(coords)
+    bounds = path_bounds(maze, coords) if crop else None
+    write_maze(maze, coords, char, sys.stdout, bounds)
+    sys.stdout.write("\n")
+
+
+class AnsiRenderer:
+    """Instance této třídy vykreslují bludiště do terminálu podporujícího
+    ANSI sekvence a při krokové vizualizaci (např. s pomocí
+    `Algorithm.step(int)`) překreslují jen změněná políčka.
+
+    Po úvodním vykreslení (metoda `draw()`) si renderer poznamenává změny -
+    zvýraznění políček (metody `mark` a `unmark`) i změny samotného bludiště
+    (je zaregistrován u bludiště, viz `Maze.add_listener`) - a metoda
+    `refresh()` pak zapíše jen posun kurzoru a nový znak každého změněného
+    políčka. Pokud již renderer není potřeba, je vhodné jej od bludiště
+    odpojit metodou `close()`.
+    """
+
+    def __init__(self, maze: Maze, stream: TextIO = None):
+        """Initor, který přijímá bludiště a textový proud, do kterého bude
+        vykreslováno (defaultně standardní výstup)."""
+        self._maze = maze
+        self._stream = stream if stream is not None else sys.stdout
+
+        # Zvýrazněná políčka (pozice v paměti bludiště -> znak) a pozice
+        # políček, která je při příštím obnovení třeba překreslit
+        self._marks: dict[int, str] = {}
+        self._changed: set[int] = set()
+
+        maze.add_listener(self._cell_changed)
+
+    @property
+    def maze(self) -> Maze:
+        """Vykreslované bludiště."""
+        return self._maze
+
+    def _cell_changed(self, x: int, y: int):
+        """Pomocná metoda volaná bludištěm při změně políčka."""
+        self._changed.add(self._maze.position(x, y))
+
+    def draw(self):
+        """Metoda vymaže terminál a vykreslí celé bludiště včetně
+        zvýrazněných políček."""
+        self._stream.write("\x1b[2J\x1b[H")
+        write_maze(self._maze, stream=self._stream)
+        self._changed = set(self._marks)
+        self.refresh()
+
+    def mark(self, coords: Iterable[tuple[int, int]], char: str = "*"):
+        """Metoda zvýrazní dodaná políčka dodaným znakem (projeví se při
+        příštím obnovení, viz `refresh()`)."""
+        for x, y in coords:
+            position = self._maze.position(x, y)
+            if position >= 0 and self._marks.get(position) != char:
+                self._marks[position] = char
+                self._changed.add(position)
 
-    # Pro každý řádek (obrácený)
-    for y in reversed(range(maze.height)):
+    def unmark(self, coords: Iterable[tuple[int, int]]):
+        """Metoda zruší zvýraznění dodaných políček (projeví se při příštím
+        obnovení, viz `refresh()`)."""
+        for x, y in coords:
+            position = self._maze.position(x, y)
+            if self._marks.pop(position, None) is not None:
+                self._changed.add(position)
 
-        # Pro každé políčko v řádku
-        for x in range(maze.width):
+    def refresh(self):
+        """Metoda překreslí všechna změněná políčka a přesune kurzor pod
+        bludiště."""
+        maze = self._maze
+        cells = maze.cells
+        width, height = maze.width, maze.height
 
-            # Pokud je zvýrazňované políčko, vrať dodaný znak, jinak defaultní
-            # znak daného políčka
-            result += char if (x, y) in coords else maze.field(x, y).character
+        parts = []
+        for position in self._changed:
+            row, column = divmod(position, width)
+            char = self._marks.get(position)
+            if char is None:
+                char = CELL_CHARACTERS[cells[position]]
+            # Řádky terminálu jsou číslovány od 1 a shora (nejvyšší y)
+            parts.append(f"\x1b[{height - row};{column + 1}H{char}")
+        self._changed.clear()
 
-        # Zakonči řádek posunem na nový řádek
-        result += "\n"
+        parts.append(f"\x1b[{height + 1};1H")
+        self._stream.write("".join(parts))
+        self._stream.flush()
 
-    # Vytiskni celý výsledek
-    print(result)
+    def close(self):
+        """Metoda odpojí renderer od bludiště."""
+        self._maze.remove_listener(self._cell_changed)
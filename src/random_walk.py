@@ -0,0 +1,235 @@
+"""Modul obsahuje vektorový výpočet mnoha nezávislých náhodných procházek
+stavovým prostorem pomocí knihovny NumPy.
+
+Na rozdíl od algoritmu `Random`, který při každém kroku vytváří nový stav,
+jsou zde všechny procházky vedeny najednou - pozice procházek jsou jedním
+polem identifikátorů políček grafu sousednosti (viz `NeighbourGraph`) a každý
+krok je několika vektorovými operacemi nad tímto polem a poli grafu. Stavy
+nejsou vytvářeny vůbec; cestu vybrané procházky lze dodatečně přehrát ze
+semínka.
+
+Modul vyžaduje knihovnu NumPy; ostatní části projektu na ní nezávisí.
+"""
+
+# Import knihovny pro vektorové výpočty a funkce pro měření času
+import numpy as np
+from time import perf_counter_ns
+
+# Import prostředků stavového prostoru a grafu sousednosti
+from .neighbour_graph import NeighbourGraph
+from .state_space import StateSpace, State, Operator
+
+
+# Výchozí počet současně vedených procházek
+DEFAULT_WALKERS = 4096
+
+# Výchozí největší počet kroků jedné procházky (jako u algoritmu `Random`)
+DEFAULT_MAX_STEPS = 30_000
+
+# Počet kroků, pro které jsou náhodná čísla generována najednou
+BLOCK_STEPS = 64
+
+
+class RandomWalks:
+    """Instance této třídy reprezentují výsledek mnoha nezávislých náhodných
+    procházek z počátečního stavu stavového prostoru, které končí dosažením
+    cílového stavu, nebo překročením největšího počtu kroků.
+
+    V každém kroku je pro každou procházku (i již ukončenou) vylosováno jedno
+    náhodné číslo z generátoru inicializovaného semínkem; náhodná čísla jsou
+    generována po blocích kroků jako matice (krok, procházka). Posloupnost
+    náhodných čísel libovolné procházky je tak jednoznačně daná semínkem
+    a počtem procházek, a její cestu lze přehrát bez ukládání jednotlivých
+    kroků (viz metoda `path(int)`).
+
+    Pole `hitting_times` nese pro každou procházku počet kroků, po kterém
+    dosáhla cíle (-1, pokud cíle nedosáhla). Procházky jsou vypočítány ihned
+    při vytvoření instance.
+    """
+
+    def __init__(self, state_space: StateSpace,
+                 walkers: int = DEFAULT_WALKERS,
+                 max_steps: int = DEFAULT_MAX_STEPS, seed: int = 0):
+        """Initor, který přijímá stavový prostor, počet procházek, největší
+        počet kroků jedné procházky a semínko generátoru náhodných čísel.
+
+        Je-li stavový prostor zkompilován, je použit jeho graf sousednosti;
+        jinak je graf sestaven (bez zkompilování stavového prostoru).
+        """
+        start = perf_counter_ns()
+
+        self._state_space = state_space
+        self._walkers = walkers
+        self._max_steps = max_steps
+        self._seed = seed
+
+        graph = state_space.graph
+        if graph is None:
+            graph = NeighbourGraph(state_space.initial_state.maze,
+                                   state_space.available_operators)
+        self._graph = graph
+        self._offsets = np.asarray(graph.offsets, dtype=np.int64)
+        self._targets = np.asarray(graph.targets, dtype=np.int64)
+        self._degrees = np.diff(self._offsets)
+
+        self._start = graph.cell_id(*state_space.initial_state.field_coords)
+        self._goal = graph.cell_id(*state_space.final_state.field_coords)
+
+        self._hitting_times = np.full(walkers, -1, dtype=np.int64)
+        self._visited = np.zeros(graph.cell_count, dtype=bool)
+        self._visited[self._start] = True
+        self._steps = 0
+        self._walk()
+
+        self._time_ns = perf_counter_ns() - start
+
+    def _blocks(self):
+        """Pomocný generátor vrací bloky náhodných čísel (matice krok x
+        procházka) pro všechny kroky, a to vždy ve stejném pořadí a se
+        stejným dělením."""
+        rng = np.random.default_rng(self._seed)
+        for first in range(0, self._max_steps, BLOCK_STEPS):
+            steps = min(BLOCK_STEPS, self._max_steps - first)
+            yield first, rng.random((steps, self._walkers))
+
+    def _walk(self):
+        """Pomocná metoda provede všechny procházky."""
+        if self._start == self._goal:
+            self._hitting_times[:] = 0
+            return
+        if self._degrees[self._start] == 0:
+            return
+
+        positions = np.full(self._walkers, self._start, dtype=np.int64)
+        active = np.ones(self._walkers, dtype=bool)
+
+        for first, block in self._blocks():
+            for offset, draws in enumerate(block):
+
+                # Každá aktivní procházka přejde náhodnou hranou svého
+                # políčka; ukončené procházky zůstávají v cíli
+                choices = self._offsets[positions] \
+                    + (draws * self._degrees[positions]).astype(np.int64)
+                positions = np.where(active, self._targets[choices],
+                                     positions)
+                self._visited[positions] = True
+
+                arrived = active & (positions == self._goal)
+                self._hitting_times[arrived] = first + offset + 1
+                active &= ~arrived
+                if not active.any():
+                    self._steps = first + offset + 1
+                    return
+        self._steps = self._max_steps
+
+    @property
+    def state_space(self) -> StateSpace:
+        """Stavový prostor, ve kterém procházky probíhaly."""
+        return self._state_space
+
+    @property
+    def walkers(self) -> int:
+        """Počet procházek."""
+        return self._walkers
+
+    @property
+    def max_steps(self) -> int:
+        """Největší počet kroků jedné procházky."""
+        return self._max_steps
+
+    @property
+    def seed(self) -> int:
+        """Semínko generátoru náhodných čísel."""
+        return self._seed
+
+    @property
+    def steps(self) -> int:
+        """Počet provedených kroků (až do ukončení poslední procházky)."""
+        return self._steps
+
+    @property
+    def hitting_times(self) -> np.ndarray:
+        """Pole počtů kroků do dosažení cíle (-1 pro procházky, které cíle
+        nedosáhly), indexované pořadím procházky."""
+        return self._hitting_times
+
+    @property
+    def hit_count(self) -> int:
+        """Počet procházek, které dosáhly cíle."""
+        return int((self._hitting_times >= 0).sum())
+
+    @property
+    def success_rate(self) -> float:
+        """Podíl procházek, které dosáhly cíle."""
+        return self.hit_count / self._walkers if self._walkers else 0.0
+
+    @property
+    def mean_hitting_time(self) -> float:
+        """Průměrný počet kroků do dosažení cíle (jen přes procházky, které
+        cíle dosáhly), nebo None, pokud cíle nedosáhla žádná."""
+        hits = self._hitting_times[self._hitting_times >= 0]
+        return float(hits.mean()) if len(hits) else None
+
+    @property
+    def median_hitting_time(self) -> float:
+        """Medián počtu kroků do dosažení cíle (jen přes procházky, které cíle
+        dosáhly), nebo None, pokud cíle nedosáhla žádná."""
+        hits = self._hitting_times[self._hitting_times >= 0]
+        return float(np.median(hits)) if len(hits) else None
+
+    @property
+    def coverage(self) -> float:
+        """Podíl průchozích políček, která navštívila alespoň jedna
+        procházka."""
+        return float(self._visited.mean()) if len(self._visited) else 0.0
+
+    @property
+    def best_walker(self) -> int:
+        """Pořadí procházky, která dosáhla cíle nejrychleji, nebo None,
+        pokud cíle nedosáhla žádná."""
+        if self.hit_count == 0:
+            return None
+        times = np.where(self._hitting_times >= 0, self._hitting_times,
+                         np.iinfo(np.int64).max)
+        return int(times.argmin())
+
+    @property
+    def time_ns(self) -> int:
+        """Doba výpočtu všech procházek v nanosekundách."""
+        return self._time_ns
+
+    def path(self, walker: int) -> tuple[Operator]:
+        """Metoda přehraje procházku s dodaným pořadím ze semínka a vrátí její
+        cestu (sekvenci operátorů) až do dosažení cíle, resp. do největšího
+        počtu kroků."""
+        length = int(self._hitting_times[walker])
+        if length < 0:
+            length = self._max_steps if self._degrees[self._start] else 0
+
+        operators = self._graph.operators
+        edge_operators = self._graph.edge_operators
+        position = self._start
+        path = []
+        for _, block in self._blocks():
+            for draw in block[:, walker]:
+                if len(path) == length:
+                    return tuple(path)
+                choice = self._offsets[position] \
+                    + int(draw * self._degrees[position])
+                path.append(operators[edge_operators[choice]])
+                position = self._targets[choice]
+        return tuple(path)
+
+    def final_state(self, walker: int = None) -> State:
+        """Metoda vrací koncový stav procházky s dodaným pořadím (defaultně
+        nejrychlejší procházky, viz `best_walker`), vytvořený aplikací
+        operátorů její cesty na počáteční stav. Nedosáhla-li cíle žádná
+        procházka a pořadí není dodáno, vrací None."""
+        walker = walker if walker is not None else self.best_walker
+        if walker is None:
+            return None
+
+        state = self._state_space.initial_state
+        for operator in self.path(walker):
+            state = operator.apply(state)
+        return state
@@ -0,0 +1,115 @@
+"""Modul obsahuje definici kompaktního stromu prohledávání.
+
+Běžné algoritmy vytvářejí pro každého vygenerovaného následníka instanci
+třídy `State` s odkazy na předka a operátor. U rozsáhlých prohledávání je
+právě tento graf objektů největší položkou v paměti i zátěží pro garbage
+collector. Strom prohledávání namísto toho ukládá uzly do souběžných polí
+pevného typu (políčko, předek, operátor, cena cesty) a uzly jsou
+identifikovány celočíselnými indexy (handle). Skutečné stavy jsou vytvořeny
+až na vyžádání, typicky jen pro nalezené řešení.
+"""
+
+# Import kompaktních polí pro uložení uzlů
+from array import array
+
+# Import společného protokolu pro iterovatelné objekty
+from typing import Iterable, Sequence
+
+# Import prostředků stavového prostoru
+from .state_space import State, Operator
+
+
+class SearchTree:
+    """Instance této třídy reprezentují strom prohledávání uložený po
+    sloupcích (struct of arrays).
+
+    Každý uzel nese identifikátor políčka (typicky dle `NeighbourGraph`),
+    index předka (-1 pro kořen), index operátoru, kterým uzel vznikl (-1 pro
+    kořen), a cenu cesty. Uzel zabírá 8 + 8 + 1 + 8 = 25 bajtů (oproti
+    stovkám bajtů instance třídy `State` včetně jejích atributů).
+    """
+
+    def __init__(self):
+        """Initor, který vytvoří prázdný strom."""
+        self._cells = array("q")
+        self._parents = array("q")
+        self._operators = array("b")
+        self._costs = array("q")
+
+    def add(self, cell: int, parent: int = -1, operator: int = -1,
+            cost: int = 0) -> int:
+        """Metoda přidá do stromu uzel s dodaným políčkem, předkem, indexem
+        operátoru a cenou cesty a vrátí jeho index."""
+        self._cells.append(cell)
+        self._parents.append(parent)
+        self._operators.append(operator)
+        self._costs.append(cost)
+        return len(self._cells) - 1
+
+    def cell(self, node: int) -> int:
+        """Metoda vrací identifikátor políčka uzlu."""
+        return self._cells[node]
+
+    def parent(self, node: int) -> int:
+        """Metoda vrací index předka uzlu (-1 pro kořen)."""
+        return self._parents[node]
+
+    def operator(self, node: int) -> int:
+        """Metoda vrací index operátoru, kterým uzel vznikl (-1 pro kořen)."""
+        return self._operators[node]
+
+    def cost(self, node: int) -> int:
+        """Metoda vrací cenu cesty k uzlu."""
+        return self._costs[node]
+
+    @property
+    def nbytes(self) -> int:
+        """Velikost polí stromu v bajtech."""
+        return sum(values.itemsize * len(values) for values in
+                   (self._cells, self._parents, self._operators, self._costs))
+
+    def __len__(self) -> int:
+        """Počet uzlů stromu."""
+        return len(self._cells)
+
+    def path(self, node: int) -> list[int]:
+        """Metoda vrací indexy operátorů na cestě od kořene k uzlu."""
+        path = []
+        while self._parents[node] >= 0:
+            path.append(self._operators[node])
+            node = self._parents[node]
+        path.reverse()
+        return path
+
+    def state(self, node: int, initial_state: State,
+              operators: Sequence[Operator]) -> State:
+        """Metoda vytvoří stav odpovídající uzlu, a to postupnou aplikací
+        operátorů jeho cesty (viz `path(int)`) na dodaný počáteční stav.
+        Řetězec předků výsledného stavu je tak obvyklým řetězcem stavů."""
+        state = initial_state
+        for index in self.path(node):
+            state = operators[index].apply(state)
+        return state
+
+    def states(self, nodes: Iterable[int], initial_state: State,
+               operators: Sequence[Operator]) -> list[State]:
+        """Metoda vytvoří stavy odpovídající dodaným uzlům. Stavy společných
+        předků jsou vytvořeny jen jednou, celková práce je tedy úměrná počtu
+        různých uzlů na všech cestách, ne součtu délek cest."""
+        created: dict[int, State] = {}
+        result = []
+        for node in nodes:
+
+            # Nejbližší předek, jehož stav již byl vytvořen (či kořen)
+            chain = []
+            while node not in created and self._parents[node] >= 0:
+                chain.append(node)
+                node = self._parents[node]
+            state = created.get(node, initial_state)
+            created[node] = state
+
+            for node in reversed(chain):
+                state = operators[self._operators[node]].apply(state)
+                created[node] = state
+            result.append(state)
+        return result
@@ -19,15 +19,27 @@ class State:
     """
 
     def __init__(self, field: Field, parent: "State" = None,
-                 operator: "Operator" = None):
+                 operator: "Operator" = None, depth: int = 0,
+                 path_cost: int = 0):
         """Initor třídy, který přijímá referenci na políčko, které reprezetnuje
         dané aktuální rozložení. Dále přijímá volitelný parametr pro rodiče,
         ze kterého tato instance byla stvořena, a operátor coby přechodovou
         funkci, který to zprostředkoval (taktéž volitelný).
+
+        Volitelně přijímá i hloubku stavu ve stromu prohledávání a cenu cesty
+        k tomuto stavu. Ty jsou nastavovány jednorázově při aplikaci operátoru
+        (viz `Operator.apply(State)`), aby je nebylo nutné počítat procházením
+        celého řetězce předků.
         """
         self._field = field
         self._parent = parent
         self._operator = operator
+        self._depth = depth
+        self._path_cost = path_cost
+
+        # Líně vypočítávané (a následně uchovávané) rekonstrukce cesty
+        self._all_parents: tuple[State] = None
+        self._whole_path: tuple[Operator] = None
 
     @property
     def field(self) -> Field:
@@ -54,6 +66,17 @@ class State:
         """Operátor, který byl aplikován na rodiče, aby vznikl tento stav."""
         return self._operator
 
+    @property
+    def depth(self) -> int:
+        """Hloubka stavu ve stromu prohledávání, tedy počet operátorů, které
+        byly od počátečního stavu aplikovány."""
+        return self._depth
+
+    @property
+    def path_cost(self) -> int:
+        """Akumulovaná cena cesty od počátečního stavu k tomuto stavu."""
+        return self._path_cost
+
     @property
     def has_parent(self) -> bool:
         """Vrací True, pokud má stanoveného rodiče. Pokud stanoveného rodiče
@@ -62,58 +85,53 @@ class State:
 
     @property
     def all_parents(self) -> tuple["State"]:
-        """Všichni rodiče aktuálního stavu v ntici."""
-        parents = []
+        """Všichni rodiče aktuálního stavu v ntici.
+
+        Ntice je vypočítána až při prvním přístupu a dále uchovávána.
+        """
+        if self._all_parents is None:
+            parents = []
 
-        # Ukazatel na aktuálně prohledávaného rodiče
-        current_ancestor = self.parent
+            # Ukazatel na aktuálně prohledávaného rodiče
+            current_ancestor = self.parent
 
-        # Pokud tento stav má rodiče
-        if self.has_parent:
+            # Pokud tento stav má rodiče
+            if self.has_parent:
 
-            # Dokud má aktuální předek rodiče
-            while current_ancestor.has_parent:
+                # Dokud má aktuální předek rodiče
+                while current_ancestor.has_parent:
 
-                # Přidej mezi operátory ten, díky kterému vznikl
-                parents.append(current_ancestor.parent)
+                    # Přidej mezi rodiče rodiče aktuálního předka
+                    parents.append(current_ancestor.parent)
 
-                # Nastav jako aktuálního předka rodiče tohoto předka
-                current_ancestor = current_ancestor.parent
+                    # Nastav jako aktuálního předka rodiče tohoto předka
+                    current_ancestor = current_ancestor.parent
 
-        # Vrať seznam všech aplikovaných operátorů jako ntici
-        return tuple(reversed(parents))
+            # Ulož si seznam všech rodičů jako ntici
+            self._all_parents = tuple(reversed(parents))
+
+        return self._all_parents
 
     @property
     def all_states(self) -> tuple["State"]:
-        """"""
-        all_parents = list(self.all_parents)
-        all_parents.append(self.parent)
-        return tuple(all_parents)
+        """Všechny stavy na cestě k tomuto stavu (rodiče a přímý rodič)."""
+        return self.all_parents + (self.parent,)
 
     @property
     def whole_path(self) -> tuple["Operator"]:
-        """Vrací celou cestu (sekvenci operátorů) až k tomuto stavu."""
-
-        # Pomocný seznam všech operátorů
-        operators = []
+        """Vrací celou cestu (sekvenci operátorů) až k tomuto stavu.
 
-        # Ukazatel na aktuálně prohledávaného rodiče
-        current_ancestor = self.parent
-
-        # Pokud tento stav má rodiče
-        if self.has_parent:
-
-            # Dokud má aktuální předek rodiče
-            while current_ancestor.has_parent:
-
-                # Přidej mezi operátory ten, díky kterému vznikl
-                operators.append(current_ancestor.applied_operator)
+        Ntice je vypočítána až při prvním přístupu a dále uchovávána.
+        """
+        if self._whole_path is None:
 
-                # Nastav jako aktuálního předka rodiče tohoto předka
-                current_ancestor = current_ancestor.parent
+            # Operátory, díky kterým vznikli všichni rodiče kromě kořene
+            # (kořen nemá rodiče a žádný operátor tedy nenese)
+            self._whole_path = tuple(
+                state.applied_operator
+                for state in self.all_states[1:])
 
-        # Vrať seznam všech aplikovaných operátorů jako ntici
-        return tuple(reversed(operators))
+        return self._whole_path
 
     def __eq__(self, other: object) -> bool:
         """Dunder metoda umožňující porovnávání objektů pomocí operátoru ==.
@@ -123,6 +141,12 @@ class State:
         """
         return isinstance(other, State) and self.field == other.field
 
+    def __hash__(self) -> int:
+        """Dunder metoda vracející hash stavu. Ten je (v souladu
+        s porovnáváním) odvozen jen od políčka, díky čemuž lze stavy ukládat
+        do množin a slovníků dle políčka, které reprezentují."""
+        return hash(self._field)
+
 
 class Operator:
     """Operátor plní roli přechodové funkce pro převod z jednoho stavu do
@@ -152,16 +176,9 @@ class Operator:
         # Souřadnice nového políčka
         x, y = self.direction.neighbour_coordinates(*state.field_coords)
 
-        # Pokud neexistuje políčko s takovými souřadnicemi
-        if not state.maze.has_field(x, y):
-            return False
-
-        # Pokud je na zadaném políčku zeď
-        elif state.maze.field(x, y).is_wall:
-            return False
-
-        # Jinak
-        return True
+        # Políčko s takovými souřadnicemi musí existovat a nesmí být zdí;
+        # obojí lze zjistit přímo z kódu políčka bez vytváření instance Field
+        return state.maze.is_passable(x, y)
 
     def apply(self, state: State) -> State:
         """Metoda, která aplikuje tento operátor na dodaný stav, čímž vytvoří
@@ -178,12 +195,30 @@ class Operator:
         x, y = self.direction.neighbour_coordinates(*state.field_coords)
 
         # Získá referenci na vyhledanou instanci políčka o daných souřadnicích
-        destination = state.maze.field(x, y)
+        return self.successor(state, state.maze.field(x, y))
 
+    @staticmethod
+    def cost_to(destination: Field) -> int:
+        """Cena aplikace operátoru, který vede na dodané cílové políčko. Je
+        dána cenou vstupu na toto políčko (viz `Field.cost`), pro políčka
+        cesty je tedy rovna 1, pro terén hodnotě jeho číslice."""
+        return destination.cost
+
+    def successor(self, state: State, destination: Field) -> State:
+        """Metoda vytvoří následníka dodaného stavu na dodaném cílovém políčku,
+        aniž by ověřovala aplikovatelnost operátoru.
+
+        Hloubka a cena cesty nového stavu jsou odvozeny od rodiče, aby je
+        nebylo třeba později dopočítávat procházením celého řetězce předků;
+        cena cesty je zvětšena o cenu vstupu na cílové políčko (viz
+        `cost_to(Field)`).
+        """
         # Vrátí nově vytvořenou instanci stavu s dodaným novým políčkem,
         # referencí na stav, ze kterého byl vytvořen, a na operátor, který
         # byl k tvorbě použit (self)
-        return State(field=destination, parent=state, operator=self)
+        return State(field=destination, parent=state, operator=self,
+                     depth=state.depth + 1,
+                     path_cost=state.path_cost + self.cost_to(destination))
 
     def __repr__(self) -> str:
         """Metoda vrací textovou reprezentaci operátoru založenou na názvu
@@ -215,6 +250,12 @@ class StateSpace:
         self._initial_state = initial_state
         self._final_state = final_state
 
+        # Předkompilovaný graf sousednosti (viz metoda `compile()`)
+        self._graph = None
+
+        # Graf křižovatek se staženými chodbami (viz metoda `contract()`)
+        self._junction_graph = None
+
     @property
     def available_operators(self) -> tuple[Operator]:
         """Dostupné operátory, které lze pro prohledávání stavového prostoru
@@ -246,11 +287,64 @@ class StateSpace:
         """
         return self.final_state == state
 
+    @property
+    def graph(self) -> "NeighbourGraph":
+        """Předkompilovaný graf sousednosti, nebo None, pokud stavový prostor
+        nebyl zkompilován."""
+        return self._graph
+
+    @property
+    def is_compiled(self) -> bool:
+        """Vrací, zda-li byl stavový prostor zkompilován do grafu."""
+        return self._graph is not None
+
+    def compile(self) -> "NeighbourGraph":
+        """Metoda převede bludiště počátečního stavu spolu s dostupnými
+        operátory na neměnný graf sousednosti. Následníci stavů se pak
+        neurčují ověřováním operátorů, nýbrž vyříznutím úseku z tohoto grafu.
+
+        Pokud se bludiště po zkompilování změní, je třeba kompilaci zopakovat.
+        """
+        # Import až zde kvůli zamezení cyklickým importům
+        from .neighbour_graph import NeighbourGraph
+
+        self._graph = NeighbourGraph(self.initial_state.maze,
+                                     self.available_operators)
+        return self._graph
+
+    @property
+    def junction_graph(self) -> "JunctionGraph":
+        """Graf křižovatek se staženými chodbami, nebo None, pokud chodby
+        stavového prostoru nebyly staženy."""
+        return self._junction_graph
+
+    def contract(self) -> "JunctionGraph":
+        """Metoda převede bludiště počátečního stavu spolu s dostupnými
+        operátory na graf křižovatek, ve kterém jsou chodby mezi
+        křižovatkami, slepými konci, počátečním a cílovým políčkem staženy do
+        jednotlivých hran. Graf je uchován a vrácen.
+
+        Pokud se bludiště po stažení změní, je třeba stažení zopakovat.
+        """
+        # Import až zde kvůli zamezení cyklickým importům
+        from .junction_graph import JunctionGraph
+
+        self._junction_graph = JunctionGraph(
+            self.initial_state.maze, self.available_operators,
+            (self.initial_state.field_coords, self.final_state.field_coords))
+        return self._junction_graph
+
     def available_for_state(self, state: State) -> tuple[Operator]:
         """Metoda vrací ntici všech operátorů, které lze aplikovat na dodaný
         stav. O možnostech aplikace se rozhoduje autonomně každý původně
-        dodaný operátor sám.
+        dodaný operátor sám, případně je využit předkompilovaný graf.
         """
+        # Pokud je stavový prostor zkompilován, stačí přečíst hrany z grafu
+        if self._graph is not None:
+            cell_id = self._graph.cell_id(*state.field_coords)
+            return tuple(operator for _, operator
+                         in self._graph.edges(cell_id))
+
         # Vrací ntici vytvořenou z profiltrované sady operátorů
         return tuple(filter(
 
@@ -259,3 +353,23 @@ class StateSpace:
 
             # Vstupní soubor operátorů, který se má profiltrovat
             self.available_operators))
+
+    def successors(self, state: State) -> tuple[State]:
+        """Metoda vrací ntici všech následníků dodaného stavu, tedy stavů
+        vzniklých aplikací všech aplikovatelných operátorů.
+
+        Je-li stavový prostor zkompilován, jsou následníci vytvořeni přímo
+        z hran grafu bez opětovného ověřování aplikovatelnosti operátorů.
+        """
+        # Bez grafu se každý aplikovatelný operátor aplikuje obvyklou cestou
+        if self._graph is None:
+            return tuple(operator.apply(state)
+                         for operator in self.available_for_state(state))
+
+        # Jinak se následníci vytvoří přímo z hran grafu
+        graph = self._graph
+        maze = state.maze
+        cell_id = graph.cell_id(*state.field_coords)
+        return tuple(
+            operator.successor(state, maze.field(*graph.coordinates(target)))
+            for target, operator in graph.edges(cell_id))